@@ -0,0 +1,4 @@
+"""Performance benchmarks for the deserialize library.
+
+Run with `python -m benchmarks`. See `python -m benchmarks --help` for options.
+"""
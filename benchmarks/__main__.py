@@ -0,0 +1,156 @@
+"""Run the benchmarks.
+
+Examples:
+
+    python -m benchmarks
+    python -m benchmarks --scenario flat --scenario union
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+import deserialize
+from benchmarks.fixtures import SCENARIOS, Scenario
+
+
+def measure(scenario: Scenario, min_time: float) -> dict[str, float]:
+    """Measure a single scenario.
+
+    The scenario is run repeatedly in rounds of at least `min_time / 5` seconds,
+    and the fastest round is used, which is the least affected by noise.
+
+    :returns: The ops/sec, per object latency in microseconds and peak memory in KiB
+    """
+
+    data = scenario.make_data()
+
+    def run() -> None:
+        deserialize.deserialize(scenario.class_reference, data, **scenario.options)
+
+    # Warm up the caches so that they don't count towards the timings
+    run()
+
+    best_round = float("inf")
+    deadline = time.perf_counter() + min_time
+
+    while time.perf_counter() < deadline or best_round == float("inf"):
+        iterations = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            iterations += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time / 5:
+                break
+        best_round = min(best_round, elapsed / iterations)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": 1 / best_round,
+        "latency_us": best_round / scenario.object_count * 1_000_000,
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Compare results against a baseline.
+
+    :returns: The names of the scenarios which regressed by more than the tolerance
+    """
+
+    regressions: list[str] = []
+
+    print()
+    print(f"{'scenario':<18}{'baseline ops/s':>16}{'current ops/s':>16}{'change':>10}")
+
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"{name:<18}{'-':>16}{result['ops_per_sec']:>16.1f}{'new':>10}")
+            continue
+
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        marker = ""
+        if change < -tolerance:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(
+            f"{name:<18}{previous['ops_per_sec']:>16.1f}{result['ops_per_sec']:>16.1f}"
+            f"{change:>+10.1%}{marker}"
+        )
+
+    return regressions
+
+
+def main(arguments: list[str]) -> int:
+    """Run the benchmarks with the given command line arguments."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Only run this scenario (can be repeated)",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=1.0, help="Seconds to spend on each scenario"
+    )
+    parser.add_argument("--save", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare the results to a JSON file saved earlier")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fractional slow down allowed before a scenario counts as a regression",
+    )
+    options = parser.parse_args(arguments)
+
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if options.scenario is None or scenario.name in options.scenario
+    ]
+
+    print(f"{'scenario':<18}{'ops/s':>12}{'latency (us)':>15}{'peak (KiB)':>13}  description")
+
+    results: dict[str, dict[str, float]] = {}
+    for scenario in scenarios:
+        result = measure(scenario, options.min_time)
+        results[scenario.name] = result
+        print(
+            f"{scenario.name:<18}{result['ops_per_sec']:>12.1f}{result['latency_us']:>15.2f}"
+            f"{result['peak_memory_kib']:>13.1f}  {scenario.description}"
+        )
+
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                output_file,
+                indent=2,
+            )
+
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(results, baseline, options.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
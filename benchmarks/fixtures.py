@@ -0,0 +1,260 @@
+"""Realistic classes and data covering each shape of deserialization."""
+
+import enum
+from typing import Any, Callable
+
+import deserialize
+
+# pylint: disable=missing-class-docstring
+
+
+class Scenario:
+    """A single benchmark: a type, the data to deserialize, and the options to use."""
+
+    __slots__ = ("name", "description", "class_reference", "make_data", "object_count", "options")
+
+    name: str
+    description: str
+    class_reference: Any
+    make_data: Callable[[], Any]
+    object_count: int
+    options: dict[str, Any]
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        class_reference: Any,
+        make_data: Callable[[], Any],
+        *,
+        object_count: int,
+        **options: Any,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.class_reference = class_reference
+        self.make_data = make_data
+        self.object_count = object_count
+        self.options = options
+
+
+# Flat records
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    DISABLED = "disabled"
+
+
+class FlatRecord:
+    identifier: int
+    name: str
+    email: str
+    score: float
+    active: bool
+    status: Status
+    nickname: str | None
+
+
+def flat_records(count: int = 1000) -> list[dict[str, Any]]:
+    """Create flat records."""
+    return [
+        {
+            "identifier": index,
+            "name": f"User {index}",
+            "email": f"user{index}@example.com",
+            "score": index * 1.5,
+            "active": index % 2 == 0,
+            "status": "active" if index % 3 else "disabled",
+            "nickname": None if index % 5 else f"nick{index}",
+        }
+        for index in range(count)
+    ]
+
+
+# Deep nesting
+
+
+class Node:
+    value: int
+    label: str
+    child: "Node | None"
+
+
+def deep_node(depth: int = 50) -> dict[str, Any]:
+    """Create a chain of nodes nested `depth` deep."""
+    node: dict[str, Any] | None = None
+    for index in range(depth):
+        node = {"value": index, "label": str(index), "child": node}
+    assert node is not None
+    return node
+
+
+# Wide classes
+
+WIDE_FIELD_COUNT = 80
+
+WideRecord: Any = type(
+    "WideRecord",
+    (),
+    {
+        "__annotations__": {
+            f"field_{index}": [int, str, float, bool][index % 4]
+            for index in range(WIDE_FIELD_COUNT)
+        },
+        "__module__": __name__,
+    },
+)
+
+
+def wide_records(count: int = 100) -> list[dict[str, Any]]:
+    """Create records with many fields."""
+    values = [1, "a", 1.5, True]
+    return [
+        {f"field_{index}": values[index % 4] for index in range(WIDE_FIELD_COUNT)}
+        for _ in range(count)
+    ]
+
+
+# Large primitive lists
+
+
+class Telemetry:
+    sensor: str
+    readings: list[int]
+    samples: list[float]
+
+
+def telemetry() -> dict[str, Any]:
+    """Create a payload with large numeric arrays."""
+    return {
+        "sensor": "probe",
+        "readings": list(range(100_000)),
+        "samples": [index / 10 for index in range(100_000)],
+    }
+
+
+# Unions
+
+
+class Circle:
+    radius: float
+
+
+class Square:
+    side: float
+
+
+class Polygon:
+    points: list[tuple[float, float]]
+
+
+class Shaped:
+    shape: Circle | Square | Polygon | int | float | str | None
+
+
+def union_records(count: int = 1000) -> list[dict[str, Any]]:
+    """Create records which exercise every member of a wide union."""
+    shapes: list[Any] = [
+        {"points": [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]},
+        {"side": 2.0},
+        {"radius": 1.0},
+        7,
+        7.5,
+        "text",
+        None,
+    ]
+    return [{"shape": shapes[index % len(shapes)]} for index in range(count)]
+
+
+# Downcasting
+
+
+@deserialize.downcast_field("kind")
+class Animal:
+    kind: str
+    name: str
+
+
+@deserialize.downcast_identifier(Animal, "dog")
+class Dog(Animal):
+    good: bool
+
+
+@deserialize.downcast_identifier(Animal, "cat")
+class Cat(Animal):
+    lives: int
+
+
+@deserialize.downcast_identifier(Animal, "fish")
+class Fish(Animal):
+    fresh_water: bool
+
+
+def animals(count: int = 1000) -> list[dict[str, Any]]:
+    """Create a mixed list of downcast records."""
+    templates: list[dict[str, Any]] = [
+        {"kind": "dog", "name": "Rex", "good": True},
+        {"kind": "cat", "name": "Tom", "lives": 9},
+        {"kind": "fish", "name": "Nemo", "fresh_water": False},
+    ]
+    return [dict(templates[index % len(templates)]) for index in range(count)]
+
+
+# auto_snake
+
+
+@deserialize.auto_snake()
+class SnakeRecord:
+    user_identifier: int
+    first_name: str
+    last_name: str
+    email_address: str
+    phone_number: str | None
+    date_of_birth: str
+
+
+def snake_records(count: int = 1000) -> list[dict[str, Any]]:
+    """Create camelCase records for an auto_snake class."""
+    return [
+        {
+            "userIdentifier": index,
+            "firstName": "First",
+            "lastName": "Last",
+            "emailAddress": "someone@example.com",
+            "phoneNumber": None,
+            "dateOfBirth": "2000-01-01",
+        }
+        for index in range(count)
+    ]
+
+
+SCENARIOS = [
+    Scenario("flat", "1,000 flat records", list[FlatRecord], flat_records, object_count=1000),
+    Scenario("deep", "Nodes nested 50 deep", Node, deep_node, object_count=50),
+    Scenario("wide", "100 records of 80 fields", list[WideRecord], wide_records, object_count=100),
+    Scenario("list_int", "2 x 100,000 item numeric lists", Telemetry, telemetry, object_count=1),
+    Scenario(
+        "union",
+        "1,000 records with a 7 member union",
+        list[Shaped],
+        union_records,
+        object_count=1000,
+    ),
+    Scenario("downcast", "1,000 mixed downcast records", list[Animal], animals, object_count=1000),
+    Scenario(
+        "auto_snake",
+        "1,000 camelCase auto_snake records",
+        list[SnakeRecord],
+        snake_records,
+        object_count=1000,
+    ),
+    Scenario(
+        "raw_storage_all",
+        "1,000 flat records with RawStorageMode.ALL",
+        list[FlatRecord],
+        flat_records,
+        object_count=1000,
+        raw_storage_mode=deserialize.RawStorageMode.ALL,
+    ),
+]
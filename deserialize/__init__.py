@@ -2,13 +2,38 @@
 
 # pylint: disable=protected-access
 # pylint: disable=too-many-branches
+# pylint: disable=unused-argument
+# pylint: disable=too-many-lines
 
+import asyncio
+import concurrent.futures
+from concurrent.futures import Executor
 import enum
+import functools
 import inspect
-from typing import Any, Annotated, TypeVar, cast, overload
+import math
+import os
+import typing
+from types import ModuleType
+from typing import (
+    Any,
+    Annotated,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Literal,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
 
+from deserialize.compiled import compiled_deserializer
 from deserialize.conversions import camel_case, pascal_case
 from deserialize.custom_deserializable import CustomDeserializable
+from deserialize.debug_name import DebugName, render_debug_name
 from deserialize.decorators import (
     constructed,
     _call_constructed,
@@ -17,13 +42,14 @@ from deserialize.decorators import default
 from deserialize.decorators import (
     downcast_field,
     downcast_identifier,
-    _get_downcast_class,
     allow_downcast_fallback,
 )
 from deserialize.decorators import ignore
 from deserialize.decorators import key
-from deserialize.decorators import parser
+from deserialize.decorators import parser, _identity_parser
 from deserialize.decorators import auto_snake
+from deserialize.decorators import adaptive_unions
+from deserialize.decorators import _any_class_generation
 from deserialize.decorators import (
     allow_unhandled,
     _should_allow_unhandled,
@@ -40,27 +66,53 @@ from deserialize.type_checks import (
     is_classvar,
     is_union,
     union_types,
+    union_members,
     is_typing_type,
     is_list,
     is_dict,
     is_set,
     is_tuple,
+    is_importable,
     list_content_type,
     dict_content_types,
     set_content_type,
     tuple_content_types,
 )
-from deserialize.metadata_cache import get_class_metadata
+from deserialize.metadata_cache import (
+    FieldMetadata,
+    _extract_field_config,
+    discriminated_members,
+    disable_persistent_cache,
+    enable_persistent_cache,
+    get_class_metadata,
+    metadata_cache_info,
+)
+from deserialize.profiling import Profiler, ProfileStats, active_profiler
+from deserialize.precompile import precompile, precompile_ready
+from deserialize.streaming import DEFAULT_CHUNK_SIZE, Readable, StreamFormat, iter_json_values
 from deserialize.field import Field
+from deserialize.generics import specialized_origin
 
 # Type variable for deserialization
 T = TypeVar("T")
 
+# The default number of top level list items to deserialize between each yield
+# to the event loop when deserializing asynchronously
+DEFAULT_YIELD_EVERY = 1000
+
 
 # Public API - explicitly declare re-exports for type checkers
 __all__ = [
-    # Main function
+    # Main functions
     "deserialize",
+    "deserialize_many",
+    "deserialize_iter",
+    "stream",
+    "deserialize_async",
+    "prewarm",
+    "precompile_ready",
+    "enable_persistent_cache",
+    "disable_persistent_cache",
     # Decorators
     "constructed",
     "default",
@@ -72,6 +124,8 @@ __all__ = [
     "parser",
     "auto_snake",
     "allow_unhandled",
+    "adaptive_unions",
+    "precompile",
     # Exceptions
     "DeserializeException",
     "InvalidBaseTypeException",
@@ -83,6 +137,7 @@ __all__ = [
     "is_classvar",
     "is_union",
     "union_types",
+    "union_members",
     "is_typing_type",
     "is_list",
     "is_dict",
@@ -97,244 +152,1647 @@ __all__ = [
     "Annotated",
     # Custom deserialization protocol
     "CustomDeserializable",
+    # Profiling
+    "Profiler",
+    "ProfileStats",
     # Utilities
     "camel_case",
     "pascal_case",
     "get_class_metadata",
+    "metadata_cache_info",
 ]
 
 
-@overload
-def deserialize(
-    class_reference: type[T],
-    data: Any,
-    *,
-    throw_on_unhandled: bool = False,
-    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
-) -> T: ...
+@overload
+def deserialize(
+    class_reference: type[T],
+    data: Any,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> T: ...
+
+
+@overload
+def deserialize(
+    class_reference: Any,
+    data: Any,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> Any: ...
+
+
+# pylint: disable=function-redefined
+def deserialize(  # type: ignore
+    class_reference: type[T],
+    data: dict[Any, Any] | list[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> T:
+    """Deserialize data to a Python object.
+
+    :param class_reference: The type to deserialize the data to
+    :param data: The data to deserialize
+    :param throw_on_unhandled: Set to True to throw on fields which are unhandled
+    :param raw_storage_mode: Where to store the raw data on the deserialized objects
+    :param workers: If set, and the data is a top level list, split it into
+        chunks and deserialize them across this many processes.
+    :param executor: An existing executor to deserialize chunks of a top level
+        list with, rather than creating a process pool for each call.
+
+    :returns: The deserialized object
+    """
+
+    _check_base_type(data)
+
+    name = _root_name(class_reference)
+
+    if (workers is not None or executor is not None) and isinstance(data, list):
+        return cast(
+            T,
+            _deserialize_in_parallel(
+                class_reference,
+                data,
+                name,
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode,
+                workers=workers,
+                executor=executor,
+            ),
+        )
+
+    return _deserialize(
+        class_reference,
+        data,
+        name,
+        throw_on_unhandled=throw_on_unhandled,
+        raw_storage_mode=raw_storage_mode,
+    )
+
+
+@overload
+def deserialize_many(
+    class_reference: type[T],
+    rows: Iterable[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> list[T]: ...
+
+
+@overload
+def deserialize_many(
+    class_reference: Any,
+    rows: Iterable[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> list[Any]: ...
+
+
+def deserialize_many(  # type: ignore
+    class_reference: type[T],
+    rows: Iterable[dict[Any, Any] | list[Any]],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> list[T]:
+    """Deserialize each row of data to a Python object.
+
+    This is equivalent to calling `deserialize` on each row, but the work which
+    only depends on the class is done once for the whole batch.
+
+    :param class_reference: The type to deserialize each row to
+    :param rows: The rows of data to deserialize
+    :param throw_on_unhandled: Set to True to throw on fields which are unhandled
+    :param raw_storage_mode: The raw storage mode to use for each row
+    :param errors: If set, rows which fail to deserialize are skipped and the
+        index of the row and the exception are appended to this list, rather
+        than the exception being raised.
+
+    :returns: The deserialized rows
+    """
+
+    return list(
+        deserialize_iter(
+            class_reference,
+            rows,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+            errors=errors,
+        )
+    )
+
+
+@overload
+def deserialize_iter(
+    class_reference: type[T],
+    rows: Iterable[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> Iterator[T]: ...
+
+
+@overload
+def deserialize_iter(
+    class_reference: Any,
+    rows: Iterable[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> Iterator[Any]: ...
+
+
+def deserialize_iter(  # type: ignore
+    class_reference: type[T],
+    rows: Iterable[dict[Any, Any] | list[Any]],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+) -> Iterator[T]:
+    """Lazily deserialize each row of data to a Python object.
+
+    This is the generator version of `deserialize_many`, taking the same
+    parameters. Rows are only read from the iterable as results are consumed.
+    """
+
+    name = _root_name(class_reference)
+    handler = _handler_for(class_reference)
+
+    for index, row in enumerate(rows):
+        try:
+            _check_base_type(row)
+            result = handler(
+                class_reference,
+                row,
+                (name, index, True),
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode,
+            )
+        except DeserializeException as ex:
+            if errors is None:
+                raise
+            errors.append((index, ex))
+            continue
+
+        yield cast(T, result)
+
+
+@overload
+def stream(
+    class_reference: type[T],
+    source: Readable,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    # pylint: disable-next=redefined-builtin
+    format: StreamFormat = "auto",
+) -> Iterator[T]: ...
+
+
+@overload
+def stream(
+    class_reference: Any,
+    source: Readable,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    # pylint: disable-next=redefined-builtin
+    format: StreamFormat = "auto",
+) -> Iterator[Any]: ...
+
+
+def stream(  # type: ignore
+    class_reference: type[T],
+    source: Readable,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    errors: list[tuple[int, DeserializeException]] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    # pylint: disable-next=redefined-builtin
+    format: StreamFormat = "auto",
+) -> Iterator[T]:
+    """Lazily deserialize JSON read incrementally from a file or socket.
+
+    The source can either contain JSON Lines, or a single top level JSON array.
+    Each line, or each element of the array, is decoded and deserialized to
+    `class_reference` in turn, so only one is held in memory at a time. Unless
+    the format is given, a source which starts with `[` is read as an array.
+
+    :param class_reference: The type to deserialize each value to
+    :param source: A text or binary file-like object, such as an open file or
+        the result of `socket.makefile()`
+    :param throw_on_unhandled: Set to True to throw on fields which are unhandled
+    :param raw_storage_mode: The raw storage mode to use for each value
+    :param errors: As for `deserialize_many`
+    :param chunk_size: The amount to read from the source at a time
+    :param format: "lines" for JSON Lines, "array" for a top level array, or
+        "auto" to pick from the first character
+
+    :raises ValueError: If the format isn't one of those
+    :raises json.JSONDecodeError: If the source isn't valid JSON
+
+    :returns: A generator of the deserialized values
+    """
+
+    return deserialize_iter(
+        class_reference,
+        iter_json_values(source, chunk_size, format),
+        throw_on_unhandled=throw_on_unhandled,
+        raw_storage_mode=raw_storage_mode,
+        errors=errors,
+    )
+
+
+@overload
+async def deserialize_async(
+    class_reference: type[T],
+    data: Any,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    yield_every: int = DEFAULT_YIELD_EVERY,
+    executor: Executor | None = None,
+    offload_threshold: int = 0,
+) -> T: ...
+
+
+@overload
+async def deserialize_async(
+    class_reference: Any,
+    data: Any,
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    yield_every: int = DEFAULT_YIELD_EVERY,
+    executor: Executor | None = None,
+    offload_threshold: int = 0,
+) -> Any: ...
+
+
+async def deserialize_async(  # type: ignore
+    class_reference: type[T],
+    data: dict[Any, Any] | list[Any],
+    *,
+    throw_on_unhandled: bool = False,
+    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
+    yield_every: int = DEFAULT_YIELD_EVERY,
+    executor: Executor | None = None,
+    offload_threshold: int = 0,
+) -> T:
+    """Deserialize data to a Python object without blocking the event loop.
+
+    Top level lists are deserialized `yield_every` items at a time, yielding to
+    the event loop in between, so other tasks keep running. Each item, including
+    any lists nested inside it, is deserialized without yielding. If an
+    executor is given, data with at least `offload_threshold` elements, counting
+    those of nested lists and dicts, is instead deserialized in that executor,
+    and anything smaller is deserialized inline. This covers large lists
+    wrapped in a dict, such as `{"items": [...]}`, which can't be yielded from.
+
+    :param class_reference: The type to deserialize the data to
+    :param data: The data to deserialize
+    :param throw_on_unhandled: Set to True to throw on fields which are unhandled
+    :param raw_storage_mode: Where to store the raw data on the deserialized objects
+    :param yield_every: The number of top level list items to deserialize
+        between each yield to the event loop
+    :param executor: An executor to offload large payloads to
+    :param offload_threshold: The minimum number of elements (list items or
+        dict values, at any depth) for data to be offloaded to the executor
+
+    :raises ValueError: If `yield_every` is less than 1
+
+    :returns: The deserialized object
+    """
+
+    if yield_every < 1:
+        raise ValueError(f"yield_every must be at least 1, not {yield_every}")
+
+    _check_base_type(data)
+
+    if executor is not None and _element_count(data, offload_threshold) >= offload_threshold:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                deserialize,
+                class_reference,
+                data,
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode,
+            ),
+        )
+
+    name = _root_name(class_reference)
+
+    if not isinstance(data, list) or not is_list(class_reference):
+        return _deserialize(
+            class_reference,
+            data,
+            name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
+
+    content_type = list_content_type(class_reference, name)
+    output: list[Any] = []
+
+    for start in range(0, len(data), yield_every):
+        if start > 0:
+            await asyncio.sleep(0)
+
+        output.extend(
+            _deserialize_chunk(
+                content_type,
+                name,
+                start,
+                data[start : start + yield_every],
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode.child_mode(),
+            )
+        )
+
+    return cast(T, output)
+
+
+# pylint: enable=function-redefined
+
+
+def _element_count(data: Any, limit: int) -> int:
+    """Count the items of the lists and dicts in the data, at any depth.
+
+    Counting stops once the limit is reached, so that large payloads aren't
+    walked in full just to find out that they are large.
+    """
+
+    count = 0
+    pending: list[Any] = [data]
+
+    while pending and count < limit:
+        value = pending.pop()
+        items: Collection[Any]
+
+        if isinstance(value, dict):
+            items = cast(dict[Any, Any], value).values()
+        elif isinstance(value, list):
+            items = cast(list[Any], value)
+        else:
+            continue
+
+        count += len(items)
+        pending.extend(items)
+
+    return count
+
+
+def prewarm(*targets: Any) -> int:
+    """Build everything needed to deserialize the given types ahead of time.
+
+    Normally the work which only depends on the types (class metadata,
+    handlers, downcast tables, etc.) is done the first time each type is
+    seen. This does it all up front for every type reachable from the
+    targets: the fields of classes, the contents of collections, the members
+    of unions and the subclasses they can be downcast to.
+
+    For servers which fork workers, call this in the parent before forking,
+    followed by `gc.freeze()`, so that the workers share the results rather
+    than each building their own.
+
+    :param targets: The types to prepare, or modules whose classes should be
+        prepared. Classes in modules which can't be deserialized, such as those
+        with unresolvable type hints, are skipped.
+
+    :returns: The number of types which were prepared
+    """
+
+    pending: list[Any] = []
+
+    for target in targets:
+        if inspect.ismodule(target):
+            pending.extend(_deserializable_classes(target))
+        else:
+            pending.append(target)
+
+    # Keyed by id, since not every type hint is hashable
+    seen: dict[int, Any] = {}
+
+    while pending:
+        type_hint = pending.pop()
+
+        if id(type_hint) in seen:
+            continue
+
+        seen[id(type_hint)] = type_hint
+        pending.extend(_prewarm_type(type_hint))
+
+    return len(seen)
+
+
+def _deserializable_classes(module: ModuleType) -> list[type]:
+    """Get the classes defined in a module which have resolvable type hints."""
+
+    classes: list[type] = []
+
+    for value in vars(module).values():
+        if not inspect.isclass(value) or value.__module__ != module.__name__:
+            continue
+
+        try:
+            typing.get_type_hints(value)
+        except (NameError, TypeError):
+            continue
+
+        classes.append(value)
+
+    return classes
+
+
+def _prewarm_type(class_reference: Any) -> list[Any]:
+    """Build everything needed to deserialize a type.
+
+    :param class_reference: The type to prepare
+    :returns: The types which can be reached from it
+    """
+
+    handler = _handler_for(class_reference)
+    debug_name = str(class_reference)
+
+    if isinstance(handler, _UnionHandler):
+        return list(handler.valid_types)
+
+    if not isinstance(handler, _ValueHandler):
+        return []
+
+    if is_list(class_reference) or is_set(class_reference) or is_tuple(class_reference):
+        if handler.list_handler is None:
+            handler.list_handler = _list_handler_for(class_reference, debug_name)
+        return [content for content in get_args(class_reference) if content is not Ellipsis]
+
+    if is_dict(class_reference):
+        if handler.dict_handler is None:
+            handler.dict_handler = _dict_handler_for(class_reference, debug_name)
+        return list(get_args(class_reference))
+
+    if specialized_origin(class_reference) is None and (
+        is_typing_type(class_reference)
+        or not inspect.isclass(class_reference)
+        or class_reference.__module__ == "builtins"
+    ):
+        return []
+
+    if handler.dict_handler is None:
+        handler.dict_handler = _dict_handler_for(class_reference, debug_name)
+
+    metadata = get_class_metadata(class_reference)
+    reachable: list[Any] = []
+
+    for field_meta in metadata.steps:
+        if field_meta.is_classvar:
+            continue
+
+        reachable.append(field_meta.type)
+
+        if field_meta.discriminator is not None:
+            reachable.extend(field_meta.discriminated_members().values())
+
+    if metadata.downcast_field:
+        for target in metadata.downcast_table().values():
+            target.metadata()
+            reachable.append(target.class_reference)
+
+    return reachable
+
+
+def _deserialize_in_parallel(
+    class_reference: Any,
+    list_data: list[Any],
+    debug_name: str,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+    workers: int | None,
+    executor: Executor | None,
+) -> Any:
+    """Deserialize a top level list in chunks across multiple processes.
+
+    Everything sent to the workers is pickled, so the types must be importable
+    (i.e. defined at the top level of a module), and each worker resolves them
+    by their qualified name.
+    """
+
+    if not is_list(class_reference):
+        return _deserialize(
+            class_reference,
+            list_data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
+
+    content_type = list_content_type(class_reference, debug_name)
+
+    # A few chunks per worker evens out the work if some chunks are slower
+    worker_count = workers or os.cpu_count() or 1
+    chunk_size = max(1, math.ceil(len(list_data) / (worker_count * 4)))
+    starts = range(0, len(list_data), chunk_size)
+
+    # A pool of a single new process would only add the cost of starting it
+    if len(starts) <= 1 or (executor is None and worker_count == 1):
+        return _deserialize_chunk(
+            content_type,
+            debug_name,
+            0,
+            list_data,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode.child_mode(),
+        )
+
+    deserialize_chunk = functools.partial(
+        _deserialize_chunk,
+        content_type,
+        debug_name,
+        throw_on_unhandled=throw_on_unhandled,
+        raw_storage_mode=raw_storage_mode.child_mode(),
+    )
+    chunks = (list_data[start : start + chunk_size] for start in starts)
+
+    output: list[Any] = []
+
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_initialize_worker,
+            initargs=(content_type,),
+        ) as pool:
+            for chunk_output in pool.map(deserialize_chunk, starts, chunks):
+                output.extend(chunk_output)
+    else:
+        for chunk_output in executor.map(deserialize_chunk, starts, chunks):
+            output.extend(chunk_output)
+
+    return output
+
+
+def _initialize_worker(class_reference: Any) -> None:
+    """Warm the caches for the type being deserialized in a new worker."""
+
+    prewarm(class_reference)
+
+
+def _deserialize_chunk(
+    class_reference: Any,
+    debug_name: str,
+    start: int,
+    list_data: list[Any],
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> list[Any]:
+    """Deserialize a chunk of a top level list, starting at the given index."""
+
+    handler = _handler_for(class_reference)
+
+    return [
+        handler(
+            class_reference,
+            item,
+            (debug_name, index, True),
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
+        for index, item in enumerate(list_data, start)
+    ]
+
+
+def _check_base_type(data: Any) -> None:
+    """Check that the data is a valid type to deserialize from.
+
+    :raises InvalidBaseTypeException: If the data is not a dict or a list
+    """
+
+    if not isinstance(data, dict) and not isinstance(data, list):
+        raise InvalidBaseTypeException(
+            "Only lists and dictionaries are supported as base raw data types"
+        )
+
+
+# The name used for each type hint when it is the root value, since looking it
+# up is slow for generic aliases such as `Page[User]`. Like the handler cache,
+# this only holds type hints which can be imported by name.
+_ROOT_NAMES: dict[Any, str] = {}
+
+
+def _root_name(class_reference: Any) -> str:
+    """Get the name used for the root value in error messages."""
+
+    if isinstance(class_reference, type):
+        return class_reference.__name__
+
+    try:
+        return _ROOT_NAMES[class_reference]
+    except (KeyError, TypeError):
+        pass
+
+    if hasattr(class_reference, "__name__"):
+        name = class_reference.__name__
+    else:
+        name = str(class_reference)
+
+    if is_importable(class_reference):
+        try:
+            _ROOT_NAMES[class_reference] = name
+        except TypeError:
+            pass
+
+    return name
+
+
+# Handlers take (class_reference, data, debug_name) plus the keyword options
+_Handler = Callable[..., Any]
+
+# The handler to use for each type hint. Type hints are resolved to a handler
+# the first time they are seen, and then reused for every value of that type.
+# Only type hints which can be imported by name are kept here, so that classes
+# created at runtime can still be garbage collected.
+_HANDLER_CACHE: dict[Any, _Handler] = {}
+
+# The attribute classes which can't be imported by name keep their handler in
+_HANDLER_ATTRIBUTE = "__deserialize_handler__"
+
+
+def _deserialize(
+    class_reference: type[T],
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> T:
+    """Deserialize data to a Python object, but allow base types"""
+
+    try:
+        handler = _HANDLER_CACHE[class_reference]
+    except (KeyError, TypeError):
+        handler = _resolve_handler(class_reference)
+
+    return cast(
+        T,
+        handler(
+            class_reference,
+            data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        ),
+    )
+
+
+def _handler_for(class_reference: Any) -> _Handler:
+    """Get the handler for a type hint, resolving it if it isn't cached yet."""
+
+    try:
+        return _HANDLER_CACHE[class_reference]
+    except (KeyError, TypeError):
+        return _resolve_handler(class_reference)
+
+
+def _resolve_handler(class_reference: Any) -> _Handler:
+    """Work out which handler deserializes values of the given type.
+
+    The result is cached so that this only has to happen once per type hint.
+    Unhashable type hints can't be cached and are resolved every time.
+
+    :param class_reference: The type hint to resolve
+    :returns: The handler for the type hint
+    """
+
+    # In here we try and use some "heuristics" to deserialize. We have 2 main
+    # options to do this. For the first, we can take the expected type and try
+    # and deserialize the data to that and show any errors. The other option is
+    # to take the data, and try and determine the types and deserialize that
+    # way. We do a mix of both.
+    #
+    # For example, we check if we have an any type first and return early,
+    # since we can't deserialize directly to that (since that doesn't make any
+    # sense). But then later, we can't go for a list directly to a type, so we
+    # have to go through each item in the data, and iterate.
+    #
+    # This produces quite a complex interweaving of operations. The general
+    # approach I've found to work is to try and do specific type checks first,
+    # then handle collection data, then any other types afterwards. That's not
+    # set in stone though.
+    #
+    # Only the checks on the type are done here. The checks on the data happen
+    # in the handlers, since they differ for every value.
+
+    handler: _Handler | None
+
+    if inspect.isclass(class_reference):
+        handler = class_reference.__dict__.get(_HANDLER_ATTRIBUTE)
+        if handler is not None:
+            return handler
+
+    if class_reference is Any:
+        handler = _deserialize_any
+    elif inspect.isclass(class_reference) and issubclass(class_reference, CustomDeserializable):
+        handler = _deserialize_custom
+    elif is_union(class_reference):
+        handler = _union_handler(class_reference)
+    elif get_origin(class_reference) is Annotated:
+        handler = _annotated_handler(class_reference)
+    elif get_origin(class_reference) is Literal:
+        handler = functools.partial(_deserialize_literal, get_args(class_reference))
+    elif not is_typing_type(class_reference) and issubclass(class_reference, enum.Enum):
+        handler = _deserialize_enum
+    else:
+        # None needs no special casing here. `isinstance(None, type(None))` is
+        # True, so it passes through the value handler unchanged.
+        handler = _ValueHandler(class_reference)
+
+    _cache_handler(class_reference, handler)
+
+    return handler
+
+
+def _cache_handler(class_reference: Any, handler: _Handler) -> None:
+    """Cache the handler for a type hint, without keeping it alive.
+
+    Type hints which can be imported by name live as long as their modules, so
+    are cached globally. Classes created at runtime keep their own handler,
+    and any other type hints which refer to them are cached by the fields
+    which use them instead.
+    """
+
+    if is_importable(class_reference):
+        try:
+            _HANDLER_CACHE[class_reference] = handler
+        except TypeError:
+            pass
+    elif inspect.isclass(class_reference):
+        try:
+            setattr(class_reference, _HANDLER_ATTRIBUTE, handler)
+        except (TypeError, AttributeError):
+            pass
+
+
+def _field_handler(field_meta: FieldMetadata) -> _Handler:
+    """Get the handler for the type of a field, which the field keeps."""
+
+    if field_meta.handler is None:
+        field_meta.handler = _handler_for(field_meta.type)
+
+    return field_meta.handler
+
+
+def _finalize(value: T, data: Any, raw_storage_mode: RawStorageMode) -> T:
+    """Run through any finalization steps before returning the value."""
+
+    # Set raw data where applicable
+    if raw_storage_mode in [RawStorageMode.ROOT, RawStorageMode.ALL]:
+        # We can't set attributes on primitive types
+        if hasattr(value, "__dict__"):
+            setattr(value, "__deserialize_raw__", data)
+
+    return value
+
+
+def _deserialize_any(
+    class_reference: Any,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Return the data as is, since anything is valid."""
+
+    return data
+
+
+def _deserialize_literal(
+    values: tuple[Any, ...],
+    class_reference: Any,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Check that the data is one of the values of a Literal."""
+
+    # The type is checked too, since 1 == True but Literal[1] shouldn't accept True
+    for value in values:
+        if data == value and type(data) is type(value):
+            return _finalize(data, data, raw_storage_mode)
+
+    raise DeserializeException(
+        f"Cannot deserialize {data!r} to '{class_reference}' for '{render_debug_name(debug_name)}'"
+    )
+
+
+def _deserialize_custom(
+    class_reference: Any,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize using the deserialize method on a custom deserializable."""
+
+    result = class_reference.deserialize(data)
+    return _finalize(result, data, raw_storage_mode)
+
+
+def _deserialize_union(
+    valid_types: Iterable[Any],
+    class_reference: Any,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+    known_failures: dict[int, DeserializeException] | None = None,
+) -> Any:
+    """Deserialize to the first member of a union which accepts the data.
+
+    :param known_failures: Exceptions from members which have already been
+        tried, keyed by their index in `valid_types`
+    """
+
+    exceptions: list[str] = []
+    for index, valid_type in enumerate(valid_types):
+        if known_failures is not None and index in known_failures:
+            exceptions.append(str(known_failures[index]))
+            continue
+
+        try:
+            return _finalize(
+                _deserialize(
+                    valid_type,
+                    data,
+                    debug_name,
+                    throw_on_unhandled=throw_on_unhandled,
+                    raw_storage_mode=raw_storage_mode.child_mode(),
+                ),
+                data,
+                raw_storage_mode,
+            )
+        except DeserializeException as ex:
+            exceptions.append(str(ex))
+
+    exception_message = f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{render_debug_name(debug_name)}' ->"
+    for exception in exceptions:
+        exception_lines = exception.split("\n")
+        sub_message = f"\n\t* {exception_lines[0]}"
+        for line in exception_lines[1:]:
+            sub_message += f"\n\t{line}"
+        exception_message += sub_message
+    raise DeserializeException(exception_message)
+
+
+# Builtin types which have no type hints, so can never be deserialized from a dict
+_HINTLESS_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+# pylint: disable-next=too-many-return-statements
+def _could_accept(class_reference: Any, data_type: type) -> bool:
+    """Check whether data of the given type could be deserialized to a type.
+
+    This only returns False when deserializing is guaranteed to fail, so it is
+    safe to skip the type without trying it.
+    """
+
+    if not isinstance(_handler_for(class_reference), _ValueHandler):
+        # Any, custom deserializers, unions and enums can't be ruled out
+        return True
+
+    if issubclass(data_type, dict):
+        if is_dict(class_reference):
+            return True
+        if is_list(class_reference) or is_set(class_reference) or is_tuple(class_reference):
+            return False
+        return class_reference not in _HINTLESS_TYPES
+
+    if issubclass(data_type, list):
+        return is_list(class_reference) or is_set(class_reference) or is_tuple(class_reference)
+
+    if is_typing_type(class_reference):
+        return False
+
+    try:
+        return issubclass(data_type, class_reference)
+    except TypeError:
+        return True
+
+
+# Checks whether a union member certainly rejects some data, given the data
+# and whether unhandled fields are an error
+_Trial = Callable[[Any, bool], bool]
+
+
+def _trial_for(class_reference: Any, data_type: type) -> _Trial | None:
+    """Get the trial for a union member, for data of the given type.
+
+    Trials never raise, and never run parsers or other user code, so members
+    which fail them are ruled out for almost nothing. Only the failures which
+    can be seen without looking inside nested values are detected. Anything
+    else is left to trying the member for real.
+
+    :returns: The trial, or None if there is nothing it could detect
+    """
+
+    handler = _handler_for(class_reference)
+
+    if (
+        issubclass(data_type, dict)
+        and inspect.isclass(class_reference)
+        and not is_dict(class_reference)
+        and isinstance(handler, _ValueHandler)
+    ):
+        return functools.partial(_object_rejects, class_reference)
+
+    if isinstance(handler, functools.partial) and handler.func is _deserialize_literal:
+        return functools.partial(_literal_rejects, handler.args[0])
+
+    return None
+
+
+def _object_rejects(class_reference: Any, data: dict[Any, Any], throw_on_unhandled: bool) -> bool:
+    """Check whether deserializing dict data to a class is certain to fail.
+
+    Classes with a downcast field may end up as a different class, with
+    different fields, so are never ruled out.
+    """
+
+    metadata = get_class_metadata(class_reference)
+
+    if metadata.downcast_field:
+        return False
+
+    for keys in metadata.required_keys:
+        for data_key in keys:
+            if data_key in data:
+                break
+        else:
+            return True
+
+    if len(metadata.hints) == 0 or metadata.snake_case_violation is not None:
+        return True
+
+    shape = metadata.shape_plan(tuple(data))
+
+    for field_meta, data_key in zip(metadata.steps, shape.keys):
+        if field_meta.is_classvar:
+            if field_meta.key in data:
+                return True
+        elif (
+            data_key is not None
+            and field_meta.parser is _identity_parser
+            and field_meta.union_cache is None
+            and field_meta.discriminator is None
+            and _value_rejects(field_meta.handler or _field_handler(field_meta), data[data_key])
+        ):
+            return True
+
+    return (
+        throw_on_unhandled
+        and len(shape.unhandled) > 0
+        and len(_unhandled_keys(class_reference, data, shape.unhandled)) > 0
+    )
+
+
+def _value_rejects(handler: _Handler, value: Any) -> bool:
+    """Check whether a handler is certain to fail for a value.
+
+    Dicts and lists aren't looked inside, and Any, enums and custom
+    deserializers are never ruled out.
+    """
+
+    if isinstance(handler, _ValueHandler):
+        return handler.rejects(value)
+
+    if isinstance(handler, functools.partial) and handler.func is _deserialize_literal:
+        return _literal_rejects(handler.args[0], value)
+
+    if isinstance(handler, _UnionHandler):
+        return all(_value_rejects(_handler_for(member), value) for member in handler.valid_types)
+
+    return False
+
+
+def _literal_rejects(values: tuple[Any, ...], data: Any, throw_on_unhandled: bool = False) -> bool:
+    """Check whether data is none of the values of a Literal."""
+
+    for value in values:
+        if data == value and type(data) is type(value):
+            return False
+
+    return True
+
+
+# The handler for each union, keyed by its members in the order they were
+# declared. Equal unions, such as `A | B` and `B | A`, share an entry in the
+# handler cache, so the handlers use this to find the one for the order of the
+# union they are given.
+_UNION_HANDLERS: dict[tuple[Any, ...], "_UnionHandler"] = {}
+
+
+def _union_handler(class_reference: Any) -> "_UnionHandler":
+    """Get the handler which tries the members of a union in their declared order."""
+
+    members = get_args(class_reference)
+
+    try:
+        return _UNION_HANDLERS[members]
+    except (KeyError, TypeError):
+        pass
+
+    handler = _UnionHandler(members)
+
+    if is_importable(class_reference):
+        try:
+            _UNION_HANDLERS[members] = handler
+        except TypeError:
+            pass
+
+    return handler
+
+
+class _UnionHandler:
+    """Deserializes to the first member of a union which accepts the data.
+
+    Members are tried in the order they were declared. Most of them can be
+    ruled out from the type of the data alone. Which members are worth trying
+    is worked out the first time each data type is seen, and then kept. The
+    rest are put through a trial first, which rules out those which are certain
+    to fail without raising, such as classes whose fields are missing or have
+    values of the wrong type.
+
+    Failed attempts are kept without rendering their messages. Only if none of
+    them succeed is the error built, trying the members which were ruled out so
+    that it explains why each one failed.
+    """
+
+    __slots__ = ("valid_types", "candidates")
+
+    valid_types: tuple[Any, ...]
+    candidates: dict[type, tuple[tuple[int, Any, _Trial | None], ...]]
+
+    def __init__(self, valid_types: Iterable[Any]) -> None:
+        self.valid_types = tuple(valid_types)
+        self.candidates = {}
+
+    def __call__(
+        self,
+        class_reference: Any,
+        data: Any,
+        debug_name: DebugName,
+        *,
+        throw_on_unhandled: bool,
+        raw_storage_mode: RawStorageMode,
+    ) -> Any:
+        return self.resolve(
+            class_reference,
+            data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )[1]
+
+    def resolve(
+        self,
+        class_reference: Any,
+        data: Any,
+        debug_name: DebugName,
+        *,
+        throw_on_unhandled: bool,
+        raw_storage_mode: RawStorageMode,
+    ) -> tuple[Any, Any]:
+        """Deserialize the data, returning the member which accepted it and the result."""
+
+        if class_reference.__args__ != self.valid_types:
+            # An equal union declared in a different order shares this handler
+            return _union_handler(class_reference).resolve(
+                class_reference,
+                data,
+                debug_name,
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode,
+            )
+
+        data_type = cast(type[Any], type(data))
+        candidates = self.candidates.get(data_type)
+
+        if candidates is None:
+            candidates = tuple(
+                (index, valid_type, _trial_for(valid_type, data_type))
+                for index, valid_type in enumerate(self.valid_types)
+                if _could_accept(valid_type, data_type)
+            )
+            if candidates:
+                # If the last member is ruled out, it is tried anyway to build
+                # the error, so it is tried straight away instead
+                index, valid_type, _ = candidates[-1]
+                candidates = candidates[:-1] + ((index, valid_type, None),)
+            self.candidates[data_type] = candidates
+
+        failures: dict[int, DeserializeException] | None = None
+
+        for index, valid_type, trial in candidates:
+            if trial is not None and trial(data, throw_on_unhandled):
+                continue
+
+            try:
+                return valid_type, _finalize(
+                    _deserialize(
+                        valid_type,
+                        data,
+                        debug_name,
+                        throw_on_unhandled=throw_on_unhandled,
+                        raw_storage_mode=raw_storage_mode.child_mode(),
+                    ),
+                    data,
+                    raw_storage_mode,
+                )
+            except DeserializeException as ex:
+                # Keep the exception, but don't render it unless every member fails
+                if failures is None:
+                    failures = {}
+                failures[index] = ex
+
+        # This always raises, since every member which could succeed has failed
+        return None, _deserialize_union(
+            self.valid_types,
+            class_reference,
+            data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+            known_failures=failures,
+        )
+
+
+def _deserialize_union_field(
+    field_meta: FieldMetadata,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize a union field which is discriminated or adaptive."""
+
+    if field_meta.discriminator is not None and isinstance(data, dict):
+        return _deserialize_discriminated_union(
+            field_meta.type,
+            field_meta.discriminator,
+            field_meta.discriminated_members(),
+            cast(dict[Any, Any], data),
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
+
+    if field_meta.union_cache is not None:
+        return _deserialize_adaptive_union(
+            field_meta,
+            data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
+
+    return _field_handler(field_meta)(
+        field_meta.type,
+        data,
+        debug_name,
+        throw_on_unhandled=throw_on_unhandled,
+        raw_storage_mode=raw_storage_mode,
+    )
+
+
+def _deserialize_discriminated_union(
+    union_type: Any,
+    discriminator: str,
+    members: dict[Any, Any],
+    data: dict[Any, Any],
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize a union to the member identified by the discriminator in the data."""
+
+    if discriminator not in data:
+        raise DeserializeException(
+            f"Missing discriminator '{discriminator}' for {render_debug_name(debug_name)}"
+        )
+
+    tag = data[discriminator]
+
+    try:
+        member = members.get(tag)
+    except TypeError:
+        # Unhashable values can't be tags
+        member = None
+
+    if member is None:
+        raise UndefinedDowncastException(
+            f"Could not find member of {union_type} with {discriminator} '{tag}' for {render_debug_name(debug_name)}"
+        )
+
+    return _finalize(
+        _deserialize(
+            member,
+            data,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode.child_mode(),
+        ),
+        data,
+        raw_storage_mode,
+    )
+
+
+def _annotated_handler(class_reference: Any) -> _Handler:
+    """Get the handler for an `Annotated` type hint nested inside another one.
+
+    The annotations on a field itself are read into its metadata, so this is
+    only used for hints such as `list[Annotated[A | B, Field(discriminator="kind")]]`.
+    The discriminator is the only `Field` option which applies to them.
+    """
+
+    actual_type, field_config = _extract_field_config(class_reference)
+
+    if field_config is None or field_config.discriminator is None:
+        return functools.partial(_deserialize_annotated, actual_type)
+
+    if not is_union(actual_type):
+        raise DeserializeException(
+            f"A discriminator can only be used with a union of classes: {class_reference}"
+        )
+
+    return _DiscriminatedHandler(actual_type, field_config.discriminator)
+
+
+def _deserialize_annotated(
+    actual_type: Any,
+    class_reference: Any,
+    data: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize to the type an `Annotated` type hint wraps."""
+
+    return _deserialize(
+        actual_type,
+        data,
+        debug_name,
+        throw_on_unhandled=throw_on_unhandled,
+        raw_storage_mode=raw_storage_mode,
+    )
+
+
+class _DiscriminatedHandler:
+    """Deserializes a discriminated union nested inside another type hint."""
+
+    __slots__ = ("union_type", "discriminator", "members", "generation")
+
+    union_type: Any
+    discriminator: str
+    members: dict[Any, Any]
+    generation: int
+
+    def __init__(self, union_type: Any, discriminator: str) -> None:
+        self.union_type = union_type
+        self.discriminator = discriminator
+        self.members = {}
+        self.generation = -1
+
+    def __call__(
+        self,
+        class_reference: Any,
+        data: Any,
+        debug_name: DebugName,
+        *,
+        throw_on_unhandled: bool,
+        raw_storage_mode: RawStorageMode,
+    ) -> Any:
+        if not isinstance(data, dict):
+            # Other data, such as None, is deserialized as for any union
+            return _deserialize(
+                self.union_type,
+                data,
+                debug_name,
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode,
+            )
+
+        # The tags come from the members' configuration, which may change
+        generation = _any_class_generation()
+
+        if self.generation != generation:
+            self.members = discriminated_members(
+                self.union_type, self.discriminator, str(self.union_type)
+            )
+            self.generation = generation
+
+        return _deserialize_discriminated_union(
+            self.union_type,
+            self.discriminator,
+            self.members,
+            cast(dict[Any, Any], data),
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
 
 
-@overload
-def deserialize(
-    class_reference: Any,
+def _deserialize_adaptive_union(
+    field_meta: FieldMetadata,
     data: Any,
+    debug_name: DebugName,
     *,
-    throw_on_unhandled: bool = False,
-    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
-) -> Any: ...
-
-
-# pylint: disable=function-redefined
-def deserialize(  # type: ignore
-    class_reference: type[T],
-    data: dict[Any, Any] | list[Any],
-    *,
-    throw_on_unhandled: bool = False,
-    raw_storage_mode: RawStorageMode = RawStorageMode.NONE,
-) -> T:
-    """Deserialize data to a Python object."""
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize a union field, first trying the member which last succeeded for it."""
 
-    if not isinstance(data, dict) and not isinstance(data, list):  # type: ignore[unreachable]
-        raise InvalidBaseTypeException(
-            "Only lists and dictionaries are supported as base raw data types"
-        )
+    union_cache = cast(dict[type, Any], field_meta.union_cache)
+    data_type = cast(type[Any], type(data))
+    last_member = union_cache.get(data_type)
 
-    if hasattr(class_reference, "__name__"):
-        name = class_reference.__name__
-    else:
-        name = str(class_reference)
+    if last_member is not None:
+        try:
+            return _finalize(
+                _deserialize(
+                    last_member,
+                    data,
+                    debug_name,
+                    throw_on_unhandled=throw_on_unhandled,
+                    raw_storage_mode=raw_storage_mode.child_mode(),
+                ),
+                data,
+                raw_storage_mode,
+            )
+        except DeserializeException:
+            pass
 
-    return _deserialize(
-        class_reference,
+    handler = cast(_UnionHandler, _field_handler(field_meta))
+    member, value = handler.resolve(
+        field_meta.type,
         data,
-        name,
+        debug_name,
         throw_on_unhandled=throw_on_unhandled,
         raw_storage_mode=raw_storage_mode,
     )
+    union_cache[data_type] = member
+    return value
 
 
-# pylint: enable=function-redefined
-
-
-# pylint:disable=too-many-return-statements
-def _deserialize(
-    class_reference: type[T],
+def _deserialize_enum(
+    class_reference: Any,
     data: Any,
-    debug_name: str,
+    debug_name: DebugName,
     *,
     throw_on_unhandled: bool,
     raw_storage_mode: RawStorageMode,
-) -> T:
-    """Deserialize data to a Python object, but allow base types"""
+) -> Any:
+    """Deserialize an enum from its value."""
 
-    # In here we try and use some "heuristics" to deserialize. We have 2 main
-    # options to do this. For the first, we can take the expected type and try
-    # and deserialize the data to that and show any errors. The other option is
-    # to take the data, and try and determine the types and deserialize that
-    # way. We do a mix of both.
-    #
-    # For example, we check if we have an any type or None type first and return
-    # early, since we can't deserialize directly to those (since that doesn't
-    # make any sense). But then later, we can't go for a list directly to a
-    # type, so we have to go through each item in the data, and iterate.
-    #
-    # This produces quite a complex interweaving of operations. The general
-    # approach I've found to work is to try and do specific type checks first,
-    # then handle collection data, then any other types afterwards. That's not
-    # set in stone though.
+    try:
+        return _finalize(class_reference(data), data, raw_storage_mode)
+    # pylint:disable=bare-except
+    except:
+        # pylint: disable=raise-missing-from
+        raise DeserializeException(
+            f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{render_debug_name(debug_name)}'"
+        )
+    # pylint:enable=bare-except,raise-missing-from
 
-    def finalize(value: T) -> T:
-        """Run through any finalization steps before returning the value."""
 
-        # Set raw data where applicable
-        if raw_storage_mode in [RawStorageMode.ROOT, RawStorageMode.ALL]:
-            # We can't set attributes on primitive types
-            if hasattr(value, "__dict__"):
-                setattr(value, "__deserialize_raw__", data)
+class _ValueHandler:
+    """Deserializes everything which isn't handled by a more specific handler.
 
-        return value
+    Which deserializer to use for dict and list data only depends on the type,
+    so each is worked out the first time it is needed and then kept.
+    """
 
-    if class_reference is Any:  # type: ignore[comparison-overlap]
-        return cast(T, data)
+    __slots__ = ("class_reference", "is_typing_type", "dict_handler", "list_handler")
 
-    if inspect.isclass(class_reference) and issubclass(class_reference, CustomDeserializable):
-        # If the class is a custom deserializable, we need to call the
-        # deserialize method on it
-        result = class_reference.deserialize(data)
-        return finalize(cast(T, result))
+    class_reference: Any
+    is_typing_type: bool
+    dict_handler: _Handler | None
+    list_handler: _Handler | None
 
-    # Check if it's None (since things like Union[int, str | None] become
-    # Union[int, str, None] so we end up iterating against it)
-    if class_reference == type(None) and data is None:
-        return cast(T, None)
+    def __init__(self, class_reference: Any) -> None:
+        self.class_reference = class_reference
+        self.is_typing_type = is_typing_type(class_reference)
+        self.dict_handler = None
+        self.list_handler = None
 
-    if is_union(class_reference):
-        valid_types = union_types(class_reference, debug_name)
-        exceptions: list[str] = []
-        for valid_type in valid_types:
-            try:
-                return finalize(
-                    _deserialize(
-                        valid_type,
-                        data,
-                        debug_name,
-                        throw_on_unhandled=throw_on_unhandled,
-                        raw_storage_mode=raw_storage_mode.child_mode(),
-                    )
-                )
-            except DeserializeException as ex:
-                exceptions.append(str(ex))
+    def rejects(self, data: Any) -> bool:
+        """Check whether deserializing data is certain to fail, without raising.
 
-        exception_message = (
-            f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{debug_name}' ->"
-        )
-        for exception in exceptions:
-            exception_lines = exception.split("\n")
-            sub_message = f"\n\t* {exception_lines[0]}"
-            for line in exception_lines[1:]:
-                sub_message += f"\n\t{line}"
-            exception_message += sub_message
-        raise DeserializeException(exception_message)
+        Dicts and lists aren't looked inside, so are never ruled out.
+        """
 
-    if not is_typing_type(class_reference) and issubclass(class_reference, enum.Enum):
-        try:
-            return finalize(class_reference(data))
-        # pylint:disable=bare-except
-        except:
-            # pylint: disable=raise-missing-from
-            raise DeserializeException(
-                f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{debug_name}'"
-            )
-        # pylint:enable=bare-except,raise-missing-from
+        if isinstance(data, (dict, list)):
+            return False
 
-    if isinstance(data, dict):
-        return finalize(
-            _deserialize_dict(
-                class_reference,
-                cast(dict[Any, Any], data),
-                debug_name,
-                throw_on_unhandled=throw_on_unhandled,
-                raw_storage_mode=raw_storage_mode,
-            )
-        )
+        if self.is_typing_type:
+            return True
 
-    if isinstance(data, list):
-        if is_set(class_reference):
-            return finalize(
-                _deserialize_set(
-                    class_reference,
-                    cast(list[Any], data),
+        try:
+            return not isinstance(data, self.class_reference)
+        except TypeError:
+            return False
+
+    def __call__(
+        self,
+        class_reference: Any,
+        data: Any,
+        debug_name: DebugName,
+        *,
+        throw_on_unhandled: bool,
+        raw_storage_mode: RawStorageMode,
+    ) -> Any:
+        if isinstance(data, dict):
+            if self.dict_handler is None:
+                self.dict_handler = _dict_handler_for(class_reference, debug_name)
+            return _finalize(
+                self.dict_handler(
+                    cast(dict[Any, Any], data),
                     debug_name,
                     throw_on_unhandled=throw_on_unhandled,
                     raw_storage_mode=raw_storage_mode,
-                )
+                ),
+                data,
+                raw_storage_mode,
             )
-        if is_tuple(class_reference):
-            return finalize(
-                _deserialize_tuple(
-                    class_reference,
+
+        if isinstance(data, list):
+            if self.list_handler is None:
+                self.list_handler = _list_handler_for(class_reference, debug_name)
+            return _finalize(
+                self.list_handler(
                     cast(list[Any], data),
                     debug_name,
                     throw_on_unhandled=throw_on_unhandled,
                     raw_storage_mode=raw_storage_mode,
-                )
-            )
-        return finalize(
-            _deserialize_list(
-                class_reference,
-                cast(list[Any], data),
-                debug_name,
-                throw_on_unhandled=throw_on_unhandled,
-                raw_storage_mode=raw_storage_mode,
+                ),
+                data,
+                raw_storage_mode,
             )
-        )
 
-    # If we still have a type from the typing module, we don't know how to
-    # handle it
-    if is_typing_type(class_reference):
-        # The data should not be None if we have a type that got here. Optionals
-        # are handled by unions above, so if we are here, it's a non-optional
-        # type and therefore should not be None.
-        if data is None:
+        # If we still have a type from the typing module, we don't know how to
+        # handle it
+        if self.is_typing_type:
+            # The data should not be None if we have a type that got here. Optionals
+            # are handled by unions, so if we are here, it's a non-optional type
+            # and therefore should not be None.
+            if data is None:
+                raise DeserializeException(
+                    f"No value for '{render_debug_name(debug_name)}'. Expected value of type '{class_reference}'"
+                )
+
             raise DeserializeException(
-                f"No value for '{debug_name}'. Expected value of type '{class_reference}'"
+                f"Unsupported deserialization type: {class_reference} for {render_debug_name(debug_name)}"
             )
 
+        # Whatever we have left now is either correct, or invalid
+        if isinstance(data, class_reference):
+            return _finalize(data, data, raw_storage_mode)
+
         raise DeserializeException(
-            f"Unsupported deserialization type: {class_reference} for {debug_name}"
+            f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{render_debug_name(debug_name)}'"
         )
 
-    # Whatever we have left now is either correct, or invalid
-    if isinstance(data, class_reference):
-        return finalize(data)
+
+def _dict_handler_for(class_reference: Any, debug_name: DebugName) -> _Handler:
+    """Get the deserializer to use when dict data is supplied for a type."""
+
+    if not is_dict(class_reference):
+        if not inspect.isclass(class_reference) and specialized_origin(class_reference) is None:
+            # Only classes, and specializations of generic classes, have fields
+            return functools.partial(_deserialize_invalid_dict, class_reference)
+
+        # Use the deserializer generated ahead of time for the class if there is one
+        compiled = compiled_deserializer(class_reference)
+        if compiled is not None:
+            return compiled
+        return functools.partial(_deserialize_dict, class_reference)
+
+    if class_reference is dict:
+        # If types of dictionary entries are not defined, do not deserialize
+        return _deserialize_untyped_dict
+
+    key_type, value_type = dict_content_types(class_reference, render_debug_name(debug_name))
+    return functools.partial(_deserialize_typed_dict, key_type, value_type)
+
+
+def _deserialize_invalid_dict(
+    class_reference: Any,
+    data: dict[Any, Any],
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Fail to deserialize a dict to a type which isn't a mapping or a class."""
 
     raise DeserializeException(
-        f"Cannot deserialize '{type(data)}' to '{class_reference}' for '{debug_name}'"
+        f"Cannot deserialize a dict to '{class_reference}' for {render_debug_name(debug_name)}"
     )
 
 
-# pylint:enable=too-many-return-statements
+def _list_handler_for(class_reference: Any, debug_name: DebugName) -> _Handler:
+    """Get the deserializer to use when list data is supplied for a type."""
 
+    if is_set(class_reference):
+        return functools.partial(
+            _deserialize_set, set_content_type(class_reference, render_debug_name(debug_name))
+        )
 
-def _deserialize_list(
-    class_reference: type[T],
+    if is_tuple(class_reference):
+        return functools.partial(
+            _deserialize_tuple, tuple_content_types(class_reference, render_debug_name(debug_name))
+        )
+
+    if is_list(class_reference):
+        return functools.partial(
+            _deserialize_list, list_content_type(class_reference, render_debug_name(debug_name))
+        )
+
+    return functools.partial(_deserialize_invalid_list, class_reference)
+
+
+def _deserialize_invalid_list(
+    class_reference: Any,
     list_data: list[Any],
-    debug_name: str,
+    debug_name: DebugName,
     *,
     throw_on_unhandled: bool,
     raw_storage_mode: RawStorageMode,
-) -> T:
-    if not is_list(class_reference):
-        raise DeserializeException(
-            f"Cannot deserialize a list to '{class_reference}' for {debug_name}"
-        )
+) -> Any:
+    """Fail to deserialize a list to a type which isn't a collection."""
+
+    raise DeserializeException(
+        f"Cannot deserialize a list to '{class_reference}' for {render_debug_name(debug_name)}"
+    )
 
-    if not isinstance(list_data, list):  # pyright: ignore[reportUnnecessaryIsInstance]
-        raise DeserializeException(
-            f"Cannot deserialize '{type(list_data)}' as a list for {debug_name}."
-        )
 
-    list_content_type_value = list_content_type(class_reference, debug_name)
+# Content types which can be checked in a single scan of a collection
+_SCANNABLE_TYPES = (Any, int, str, float, bool)
+
+
+def _is_homogeneous(list_data: list[Any], content_type: Any) -> bool:
+    """Check if every item in the list is valid for a scannable content type.
+
+    Items have to be exactly the type, so subclasses (e.g. bools in a list of
+    ints) fail the scan and are left to the per-item path to decide on.
+    """
+
+    if content_type is Any:
+        return True
+
+    return set(map(type, list_data)) <= {content_type}
+
+
+def _deserialize_list(
+    list_content_type_value: Any,
+    list_data: list[Any],
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> list[Any]:
+    if list_content_type_value in _SCANNABLE_TYPES and _is_homogeneous(
+        list_data, list_content_type_value
+    ):
+        return list(list_data)
 
     output: list[Any] = []
 
@@ -342,34 +1800,27 @@ def _deserialize_list(
         deserialized = _deserialize(
             list_content_type_value,
             item,
-            f"{debug_name}[{index}]",
+            (debug_name, index, True),
             throw_on_unhandled=throw_on_unhandled,
             raw_storage_mode=raw_storage_mode.child_mode(),
         )
         output.append(deserialized)
 
-    return cast(T, output)
+    return output
 
 
 def _deserialize_set(
-    class_reference: type[T],
+    set_content_type_value: Any,
     list_data: list[Any],
-    debug_name: str,
+    debug_name: DebugName,
     *,
     throw_on_unhandled: bool,
     raw_storage_mode: RawStorageMode,
-) -> T:
-    if not is_set(class_reference):
-        raise DeserializeException(
-            f"Cannot deserialize a list to '{class_reference}' for {debug_name}"
-        )
-
-    if not isinstance(list_data, list):  # pyright: ignore[reportUnnecessaryIsInstance]
-        raise DeserializeException(
-            f"Cannot deserialize '{type(list_data)}' as a set for {debug_name}."
-        )
-
-    set_content_type_value = set_content_type(class_reference, debug_name)
+) -> set[Any]:
+    if set_content_type_value in _SCANNABLE_TYPES and _is_homogeneous(
+        list_data, set_content_type_value
+    ):
+        return set(list_data)
 
     output: set[Any] = set()
 
@@ -377,58 +1828,49 @@ def _deserialize_set(
         deserialized = _deserialize(
             set_content_type_value,
             item,
-            f"{debug_name}[{index}]",
+            (debug_name, index, True),
             throw_on_unhandled=throw_on_unhandled,
             raw_storage_mode=raw_storage_mode.child_mode(),
         )
         output.add(deserialized)
 
-    return cast(T, output)
+    return output
 
 
 def _deserialize_tuple(
-    class_reference: type[T],
+    tuple_types: tuple[Any, ...],
     list_data: list[Any],
-    debug_name: str,
+    debug_name: DebugName,
     *,
     throw_on_unhandled: bool,
     raw_storage_mode: RawStorageMode,
-) -> T:
-    if not is_tuple(class_reference):
-        raise DeserializeException(
-            f"Cannot deserialize a list to '{class_reference}' for {debug_name}"
-        )
-
-    if not isinstance(list_data, list):  # pyright: ignore[reportUnnecessaryIsInstance]
-        raise DeserializeException(
-            f"Cannot deserialize '{type(list_data)}' as a tuple for {debug_name}."
-        )
-
-    tuple_types = tuple_content_types(class_reference, debug_name)
-
+) -> tuple[Any, ...]:
     # Handle untyped tuple
     if len(tuple_types) == 0:
-        return cast(T, tuple(list_data))
+        return tuple(list_data)
 
     # Handle variable-length tuple (e.g., tuple[int, ...])
     if len(tuple_types) == 2 and tuple_types[1] is Ellipsis:
         element_type = tuple_types[0]
+        if element_type in _SCANNABLE_TYPES and _is_homogeneous(list_data, element_type):
+            return tuple(list_data)
+
         output: list[Any] = []
         for index, item in enumerate(list_data):
             deserialized = _deserialize(
                 element_type,
                 item,
-                f"{debug_name}[{index}]",
+                (debug_name, index, True),
                 throw_on_unhandled=throw_on_unhandled,
                 raw_storage_mode=raw_storage_mode.child_mode(),
             )
             output.append(deserialized)
-        return cast(T, tuple(output))
+        return tuple(output)
 
     # Handle fixed-length tuple (e.g., tuple[int, str, bool])
     if len(list_data) != len(tuple_types):
         raise DeserializeException(
-            f"Cannot deserialize list of length {len(list_data)} to tuple of length {len(tuple_types)} for {debug_name}"
+            f"Cannot deserialize list of length {len(list_data)} to tuple of length {len(tuple_types)} for {render_debug_name(debug_name)}"
         )
 
     output = []
@@ -436,75 +1878,181 @@ def _deserialize_tuple(
         deserialized = _deserialize(
             expected_type,
             item,
-            f"{debug_name}[{index}]",
+            (debug_name, index, True),
             throw_on_unhandled=throw_on_unhandled,
             raw_storage_mode=raw_storage_mode.child_mode(),
         )
         output.append(deserialized)
 
-    return cast(T, tuple(output))
+    return tuple(output)
+
+
+def _deserialize_untyped_dict(
+    data: dict[Any, Any],
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> dict[Any, Any]:
+    """Return a dictionary with no types specified as is."""
+
+    return data
+
+
+def _deserialize_typed_dict(
+    key_type: Any,
+    value_type: Any,
+    data: dict[Any, Any],
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> dict[Any, Any]:
+    """Deserialize a dictionary with typed keys and values."""
+
+    result: dict[Any, Any] = {}
+
+    for dict_key, dict_value in data.items():
+        if key_type != Any and not isinstance(dict_key, key_type):
+            raise DeserializeException(
+                f"Could not deserialize key {dict_key} to type {key_type} for {render_debug_name(debug_name)}"
+            )
+
+        result[dict_key] = _deserialize(
+            value_type,
+            dict_value,
+            (debug_name, dict_key, False),
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode.child_mode(),
+        )
+
+    return result
 
 
 def _deserialize_dict(
     class_reference: type[T],
     data: dict[Any, Any],
-    debug_name: str,
+    debug_name: DebugName,
     *,
     throw_on_unhandled: bool,
     raw_storage_mode: RawStorageMode,
 ) -> T:
     """Deserialize a dictionary to a Python object."""
 
-    # Check if we are doing a straightforward dictionary parse first, or if it
-    # has to be deserialized
+    profiler = active_profiler()
 
-    remaining_properties = set(data.keys())
+    if profiler is None:
+        return _deserialize_object(
+            class_reference,
+            data,
+            debug_name,
+            None,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
 
-    if not isinstance(data, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
-        raise DeserializeException(
-            f"Data was not dict for instance: {class_reference} for {debug_name}"
+    with profiler.record(profiler.classes, _profile_name(class_reference)):
+        return _deserialize_object(
+            class_reference,
+            data,
+            debug_name,
+            profiler,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
         )
 
-    if is_dict(class_reference):
-        if class_reference is dict:
-            # If types of dictionary entries are not defined, do not deserialize
-            return cast(T, data)
-        key_type, value_type = dict_content_types(class_reference, debug_name)
-        result: dict[Any, Any] = {}
-
-        for dict_key, dict_value in data.items():
-            if key_type != Any and not isinstance(dict_key, key_type):
-                raise DeserializeException(
-                    f"Could not deserialize key {dict_key} to type {key_type} for {debug_name}"
-                )
 
-            result[dict_key] = _deserialize(
-                value_type,
-                dict_value,
-                f"{debug_name}.{dict_key}",
+def _unhandled_keys(
+    class_reference: Any, data: dict[Any, Any], unhandled: tuple[int, ...]
+) -> list[Any]:
+    """Get the keys which no field reads from, and which aren't allowed to be unhandled.
+
+    :param unhandled: The positions in the data of the keys no field reads from
+    """
+
+    data_keys = list(data)
+
+    return [
+        data_keys[position]
+        for position in unhandled
+        if not _should_allow_unhandled(class_reference, data_keys[position])
+    ]
+
+
+def _profile_name(class_reference: Any) -> str:
+    """Get the name to record a class under when profiling."""
+    return getattr(class_reference, "__qualname__", None) or str(class_reference)
+
+
+def _deserialize_field_profiled(
+    profiler: Profiler,
+    class_reference: Any,
+    field_meta: FieldMetadata,
+    value: Any,
+    debug_name: DebugName,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> Any:
+    """Deserialize a single field of a class, recording its timings."""
+
+    field_name = f"{_profile_name(class_reference)}.{field_meta.name}"
+
+    with profiler.record(profiler.fields, field_name):
+        if field_meta.parser is _identity_parser:
+            parsed_value = value
+        else:
+            parsed_value = profiler.call(profiler.parsers, field_name, field_meta.parser, value)
+
+        if field_meta.union_cache is not None or field_meta.discriminator is not None:
+            return _deserialize_union_field(
+                field_meta,
+                parsed_value,
+                debug_name,
                 throw_on_unhandled=throw_on_unhandled,
-                raw_storage_mode=raw_storage_mode.child_mode(),
+                raw_storage_mode=raw_storage_mode,
             )
 
-            remaining_properties.remove(dict_key)
+        return _field_handler(field_meta)(
+            field_meta.type,
+            parsed_value,
+            debug_name,
+            throw_on_unhandled=throw_on_unhandled,
+            raw_storage_mode=raw_storage_mode,
+        )
 
-        if throw_on_unhandled and len(remaining_properties) > 0:
-            raise UnhandledFieldException(
-                f"The following field was unhandled: {list(remaining_properties)[0]} for {debug_name}"
-            )
 
-        return cast(T, result)
+# pylint: disable-next=too-many-locals
+def _deserialize_object(
+    class_reference: type[T],
+    data: dict[Any, Any],
+    debug_name: DebugName,
+    profiler: Profiler | None,
+    *,
+    throw_on_unhandled: bool,
+    raw_storage_mode: RawStorageMode,
+) -> T:
+    """Deserialize a dictionary to an instance of a class."""
 
-    # It wasn't a straight forward dictionary, so we are in deserialize mode
+    if not isinstance(data, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise DeserializeException(
+            f"Data was not dict for instance: {class_reference} for {render_debug_name(debug_name)}"
+        )
 
     # Use metadata cache for performance
     metadata = get_class_metadata(class_reference)
 
-    # Handle downcasting
-    if metadata.downcast_field:
+    # Specializations of generic classes, such as `Page[User]`, are created
+    # from and configured on the generic class itself
+    if metadata.origin is not None:
+        class_reference = metadata.origin
+
+    # Handle downcasting. If the class downcast to has a downcast field of its
+    # own, the data is downcast again.
+    while metadata.downcast_field:
         downcast_value = data[metadata.downcast_field]
-        new_reference = _get_downcast_class(class_reference, downcast_value)
-        if new_reference is None:
+        target = metadata.downcast_table().get(downcast_value)
+        if target is None:
             if metadata.allows_downcast_fallback:
                 result_dict = _deserialize(
                     dict[Any, Any],
@@ -515,104 +2063,111 @@ def _deserialize_dict(
                 )
                 return cast(T, result_dict)
             raise UndefinedDowncastException(
-                f"Could not find subclass of {class_reference} with downcast identifier '{downcast_value}' for {debug_name}"
+                f"Could not find subclass of {class_reference} with downcast identifier '{downcast_value}' for {render_debug_name(debug_name)}"
             )
-        # Update class reference and get new metadata
-        class_reference = cast(type[T], new_reference)
-        metadata = get_class_metadata(class_reference)
+        class_reference = cast(type[T], target.class_reference)
+        metadata = target.metadata()
+        if not target.nested:
+            break
 
     try:
         class_instance: T = class_reference.__new__(class_reference)
     except TypeError as ex:
         raise DeserializeException(
-            f"Could not create instance of {class_reference} for {debug_name}"
+            f"Could not create instance of {class_reference} for {render_debug_name(debug_name)}"
         ) from ex
 
-    handled_fields: set[str] = set()
-
     # Check if we have type hints (using cached hints from metadata)
     if len(metadata.hints) == 0:
         raise DeserializeException(
-            f"Could not deserialize {data} into {class_reference} due to lack of type hints ({debug_name})"
+            f"Could not deserialize {data} into {class_reference} due to lack of type hints ({render_debug_name(debug_name)})"
         )
 
-    # Process fields using cached metadata
-    for attribute_name, field_meta in metadata.fields.items():
-        # Skip ignored fields
-        if field_meta.ignore:
-            continue
+    # Which key each field is read from only depends on the keys in the data,
+    # which are nearly always the same for every object of a class
+    shape = metadata.shape_plan(tuple(data))
 
-        # Skip ClassVars
+    # Process fields using the precompiled steps from the metadata
+    for field_meta, data_key in zip(metadata.steps, shape.keys):
+        attribute_name = field_meta.name
+
+        # ClassVars can't be set, so they just need to be absent
         if field_meta.is_classvar:
             if field_meta.key in data:
                 raise DeserializeException(
-                    f"ClassVars cannot be set: {debug_name}.{attribute_name}"
+                    f"ClassVars cannot be set: {render_debug_name(debug_name)}.{attribute_name}"
                 )
             continue
 
-        # Check auto_snake property naming
-        if metadata.auto_snake and attribute_name.lower() != attribute_name:
-            raise DeserializeException(
-                f"When using auto_snake, all properties must be snake cased. Error on: {debug_name}.{attribute_name}"
-            )
-
-        using_default = False
-        property_value: Any = None
-        deserialized_value: Any = None
-
-        # Look up value in data (using pre-computed keys for auto_snake)
-        if field_meta.key in data:
-            value = data[field_meta.key]
-            handled_fields.add(field_meta.key)
-            property_value = field_meta.parser(value)
-        elif metadata.auto_snake and field_meta.camel_key and field_meta.camel_key in data:
-            value = data[field_meta.camel_key]
-            handled_fields.add(field_meta.camel_key)
-            property_value = field_meta.parser(value)
-        elif metadata.auto_snake and field_meta.pascal_key and field_meta.pascal_key in data:
-            value = data[field_meta.pascal_key]
-            handled_fields.add(field_meta.pascal_key)
-            property_value = field_meta.parser(value)
+        if data_key is not None:
+            property_value = data[data_key]
         else:
             # Value not in data - check for default or None
             if field_meta.has_default:
-                deserialized_value = field_meta.default_value
-                using_default = True
-            else:
-                # Check if None is acceptable (Union with None)
-                if (
-                    field_meta.is_union
-                    and field_meta.union_types
-                    and type(None) in field_meta.union_types
-                ):
-                    property_value = field_meta.parser(None)
-                else:
-                    raise DeserializeException(
-                        f"Unexpected missing value for: {debug_name}.{attribute_name}"
-                    )
-
-        if not using_default:
-            deserialized_value = _deserialize(
+                setattr(class_instance, attribute_name, field_meta.default_value)
+                continue
+
+            # Check if None is acceptable (Union with None)
+            if not field_meta.accepts_none:
+                raise DeserializeException(
+                    f"Unexpected missing value for: {render_debug_name(debug_name)}.{attribute_name}"
+                )
+
+            property_value = None
+
+        if profiler is None and field_meta.union_cache is None and field_meta.discriminator is None:
+            handler = field_meta.handler
+            if handler is None:
+                handler = _field_handler(field_meta)
+            deserialized_value = handler(
                 field_meta.type,
+                field_meta.parser(property_value),
+                (debug_name, attribute_name, False),
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode.child_mode(),
+            )
+        elif profiler is None:
+            deserialized_value = _deserialize_union_field(
+                field_meta,
+                field_meta.parser(property_value),
+                (debug_name, attribute_name, False),
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=raw_storage_mode.child_mode(),
+            )
+        else:
+            deserialized_value = _deserialize_field_profiled(
+                profiler,
+                class_reference,
+                field_meta,
                 property_value,
-                f"{debug_name}.{attribute_name}",
+                (debug_name, attribute_name, False),
                 throw_on_unhandled=throw_on_unhandled,
                 raw_storage_mode=raw_storage_mode.child_mode(),
             )
 
         setattr(class_instance, attribute_name, deserialized_value)
 
-    unhandled = set(data.keys()) - handled_fields
+    # Check auto_snake property naming
+    if metadata.snake_case_violation is not None:
+        raise DeserializeException(
+            f"When using auto_snake, all properties must be snake cased. Error on: {render_debug_name(debug_name)}.{metadata.snake_case_violation}"
+        )
 
-    if throw_on_unhandled and len(unhandled) > 0:
-        filtered_unhandled = [
-            key for key in unhandled if not _should_allow_unhandled(class_reference, key)
-        ]
+    if throw_on_unhandled and len(shape.unhandled) > 0:
+        filtered_unhandled = _unhandled_keys(class_reference, data, shape.unhandled)
         if len(filtered_unhandled) > 0:
             raise UnhandledFieldException(
-                f"Unhandled field: {list(filtered_unhandled)[0]} for {debug_name}"
+                f"Unhandled field: {filtered_unhandled[0]} for {render_debug_name(debug_name)}"
             )
 
-    _call_constructed(class_reference, class_instance)
+    if profiler is None:
+        _call_constructed(class_reference, class_instance)
+    elif hasattr(class_reference, "__deserialize_constructed__"):
+        profiler.call(
+            profiler.constructed,
+            _profile_name(class_reference),
+            functools.partial(_call_constructed, class_reference),
+            class_instance,
+        )
 
     return class_instance
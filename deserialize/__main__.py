@@ -0,0 +1,121 @@
+"""Command line tools for the library.
+
+Examples:
+
+    python -m deserialize compile app.models
+    python -m deserialize compile app.models:User app.models:Order
+    python -m deserialize compile app.models --output build/models_deserialize_compiled.py
+"""
+
+import argparse
+import importlib
+import inspect
+import sys
+from typing import Any
+
+from deserialize import _deserializable_classes
+from deserialize.codegen import GeneratedModule, default_output_path, generate, generate_per_module
+
+
+def load_roots(specifications: list[str]) -> list[Any]:
+    """Import the classes to start generating from.
+
+    :param specifications: Each is either a module, for every class defined in
+        it, or `module:QualifiedName` for a single class
+
+    :returns: The classes
+    """
+
+    roots: list[Any] = []
+
+    for specification in specifications:
+        module_name, _, qualified_name = specification.partition(":")
+        module = importlib.import_module(module_name)
+
+        if not qualified_name:
+            roots.extend(_deserializable_classes(module))
+            continue
+
+        value: Any = module
+        for part in qualified_name.split("."):
+            value = getattr(value, part)
+
+        if not inspect.isclass(value):
+            raise TypeError(f"{specification} is not a class")
+
+        roots.append(value)
+
+    return roots
+
+
+def compile_command(arguments: argparse.Namespace) -> int:
+    """Generate the deserializers for the classes given on the command line."""
+
+    roots = load_roots(arguments.roots)
+    description = " " + " ".join(arguments.roots)
+
+    if arguments.output:
+        results = {arguments.output: generate(roots, description)}
+    else:
+        results = {}
+        for module_name, result in generate_per_module(roots, description).items():
+            if not result.compiled:
+                _report_skipped(result)
+                continue
+            results[default_output_path(sys.modules[module_name])] = result
+
+    for output, result in results.items():
+        with open(output, "w", encoding="utf-8") as output_file:
+            output_file.write(result.source)
+
+        print(f"Generated deserializers for {len(result.compiled)} classes in {output}")
+        _report_skipped(result)
+
+    return 0
+
+
+def _report_skipped(result: GeneratedModule) -> None:
+    """Print the classes which were left out of a generated module, and why."""
+
+    for class_reference, reason in result.skipped.items():
+        print(
+            f"Skipped {class_reference.__module__}.{class_reference.__qualname__}: {reason}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point."""
+
+    parser = argparse.ArgumentParser(prog="python -m deserialize", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="Generate specialized deserializers for classes ahead of time",
+        description=(
+            "Generate deserializers for every class reachable from the given roots. "
+            "By default they are written to a module next to each module the classes "
+            "are defined in, where they are picked up automatically."
+        ),
+    )
+    compile_parser.add_argument(
+        "roots",
+        nargs="+",
+        metavar="ROOT",
+        help="A module, for every class in it, or module:ClassName for a single class",
+    )
+    compile_parser.add_argument(
+        "--output",
+        "-o",
+        help="A single file to write every deserializer to, which must be imported at startup",
+    )
+    compile_parser.set_defaults(handler=compile_command)
+
+    arguments = parser.parse_args(argv)
+
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,729 @@
+"""Generate specialized deserializers for classes ahead of time.
+
+The deserializers are written out as a plain Python module, with everything
+which only depends on the class (keys, parsers, defaults, handlers, etc.)
+worked out while generating it, so that none of it has to be looked up again
+at runtime. The generated code follows `_deserialize_object` step by step, and
+anything it can't express is left to the normal code path.
+"""
+
+# pylint: disable=unidiomatic-typecheck
+# pylint: disable=protected-access
+
+import enum
+import importlib
+import inspect
+import math
+import os
+import sys
+import types
+import typing
+from typing import Any, Iterable, Literal, cast, get_args, get_origin
+
+from deserialize import _could_accept
+from deserialize.compiled import COMPILED_MODULE_SUFFIX
+from deserialize.custom_deserializable import CustomDeserializable
+from deserialize.decorators import _get_default, _get_parser, _has_default, _identity_parser
+from deserialize.decorators.generation import _GENERATION_ATTRIBUTE
+from deserialize.metadata_cache import ClassMetadata, FieldMetadata, get_class_metadata
+from deserialize.persistent_cache import fingerprint
+
+# Types whose values are returned unchanged when the data is exactly that type
+_SCALAR_TYPES = (int, float, str, bool, type(None))
+
+
+class _UnsupportedError(Exception):
+    """Raised when a class can't be expressed as generated code."""
+
+
+class GeneratedModule:
+    """The result of generating deserializers for a set of classes."""
+
+    __slots__ = ("source", "compiled", "skipped")
+
+    source: str
+    compiled: list[type]
+    skipped: dict[Any, str]
+
+    def __init__(self, source: str, compiled: list[type], skipped: dict[Any, str]) -> None:
+        """Create a new result.
+
+        :param source: The source of the generated module
+        :param compiled: The classes which have generated deserializers
+        :param skipped: The classes which don't, with the reason for each
+        """
+        self.source = source
+        self.compiled = compiled
+        self.skipped = skipped
+
+
+def compiled_module_name(module_name: str) -> str:
+    """Get the name of the module the deserializers for a module are generated into.
+
+    The library imports the module with this name automatically the first
+    time a class from the original module is deserialized.
+
+    :param module_name: The name of the module the classes are defined in
+    :returns: The name of the generated module
+    """
+    return module_name + COMPILED_MODULE_SUFFIX
+
+
+def reachable_classes(roots: Iterable[Any]) -> list[type]:
+    """Find every class which can be reached when deserializing the roots.
+
+    :param roots: The types to start from
+    :returns: The classes, in the order they were found
+    """
+
+    pending = list(roots)
+    seen: set[int] = set()
+    classes: list[type] = []
+
+    while pending:
+        type_hint = pending.pop(0)
+
+        if id(type_hint) in seen:
+            continue
+
+        seen.add(id(type_hint))
+
+        if not _is_model_class(type_hint):
+            origin = get_origin(type_hint)
+            if origin is not None:
+                pending.append(origin)
+            pending.extend(argument for argument in get_args(type_hint) if argument is not Ellipsis)
+            continue
+
+        classes.append(type_hint)
+
+        try:
+            metadata = get_class_metadata(type_hint)
+        # Classes which can't be deserialized are reported when they are generated
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            continue
+
+        for field_meta in metadata.steps:
+            if field_meta.is_classvar:
+                continue
+
+            pending.append(field_meta.type)
+
+            if field_meta.discriminator is not None:
+                pending.extend(field_meta.discriminated_members().values())
+
+        if metadata.downcast_field:
+            pending.extend(target.class_reference for target in metadata.downcast_table().values())
+
+    return classes
+
+
+def generate(roots: Iterable[Any], description: str = "") -> GeneratedModule:
+    """Generate a module of deserializers for every class reachable from the roots.
+
+    The module registers its classes wherever they are defined, but is only
+    imported automatically for the module it is named after, so import it
+    yourself if it covers classes from several modules.
+
+    :param roots: The types to start from
+    :param description: What the module was generated from, for its docstring
+
+    :returns: The generated module
+    """
+    return _generate(reachable_classes(roots), description)
+
+
+def generate_per_module(roots: Iterable[Any], description: str = "") -> dict[str, GeneratedModule]:
+    """Generate a module of deserializers for each module the reachable classes are defined in.
+
+    Each generated module can then be imported automatically the first time
+    a class from its module is deserialized, whichever class that is.
+
+    :param roots: The types to start from
+    :param description: What the modules were generated from, for their docstrings
+
+    :returns: The generated module for each module name
+    """
+
+    classes_by_module: dict[str, list[type]] = {}
+
+    for class_reference in reachable_classes(roots):
+        classes_by_module.setdefault(class_reference.__module__, []).append(class_reference)
+
+    return {
+        module_name: _generate(classes, description)
+        for module_name, classes in classes_by_module.items()
+    }
+
+
+def _generate(classes: Iterable[type], description: str) -> GeneratedModule:
+    """Generate a module of deserializers for the given classes."""
+
+    writer = _ModuleWriter()
+    compiled: list[type] = []
+    skipped: dict[Any, str] = {}
+
+    for class_reference in classes:
+        try:
+            writer.add_class(class_reference)
+        except _UnsupportedError as ex:
+            skipped[class_reference] = str(ex)
+        # Anything raised while building the metadata means the class can't be
+        # deserialized at all, so it's left to raise as normal
+        # pylint: disable-next=broad-exception-caught
+        except Exception as ex:
+            skipped[class_reference] = f"{type(ex).__name__}: {ex}"
+        else:
+            compiled.append(class_reference)
+
+    return GeneratedModule(writer.source(description), compiled, skipped)
+
+
+def _is_model_class(type_hint: Any) -> bool:
+    """Check if a type is a class which is deserialized field by field."""
+
+    return (
+        inspect.isclass(type_hint)
+        and type_hint.__module__ not in ("builtins", "typing", "types", "collections.abc")
+        and not issubclass(type_hint, (enum.Enum, CustomDeserializable))
+    )
+
+
+class _ModuleWriter:
+    """Builds up the source of a generated module."""
+
+    def __init__(self) -> None:
+        self.module_aliases: dict[str, str] = {}
+        self.blocks: list[list[str]] = []
+
+    def source(self, description: str) -> str:
+        """Get the source of the module."""
+
+        lines = [
+            f'"""Deserializers generated by `python -m deserialize compile{description}`.',
+            "",
+            "Do not edit this file. Generate it again whenever the classes change. Any",
+            "class which has changed since it was generated is deserialized as normal.",
+            '"""',
+            "",
+            "# pylint: skip-file",
+            "# fmt: off",
+            "",
+            "import typing",
+            "",
+            "from deserialize import _deserialize_dict, _handler_for",
+            "from deserialize.compiled import register",
+            "from deserialize.debug_name import render_debug_name",
+            "from deserialize.decorators import _class_generation, _get_default, _get_parser",
+            "from deserialize.exceptions import DeserializeException, UnhandledFieldException",
+            "from deserialize.profiling import active_profiler",
+            "",
+        ]
+
+        for module_name, alias in self.module_aliases.items():
+            lines.append(f"import {module_name} as {alias}")
+
+        for block in self.blocks:
+            lines.extend(["", ""])
+            lines.extend(block)
+
+        return "\n".join(lines) + "\n"
+
+    def add_class(self, class_reference: type) -> None:
+        """Add the deserializer for a class.
+
+        :raises _UnsupportedError: If the class can't be expressed as generated code
+        """
+
+        # Aliases are only kept if the whole class can be written
+        aliases = dict(self.module_aliases)
+
+        try:
+            block = _ClassWriter(self, class_reference, len(self.blocks)).write()
+        except Exception:
+            self.module_aliases = aliases
+            raise
+
+        self.blocks.append(block)
+
+    def module_alias(self, module_name: str) -> str:
+        """Get the name a module is imported as."""
+
+        if module_name not in self.module_aliases:
+            self.module_aliases[module_name] = f"_module_{len(self.module_aliases)}"
+
+        return self.module_aliases[module_name]
+
+    def namespace(self) -> dict[str, Any]:
+        """Get the globals the generated expressions are evaluated in."""
+
+        namespace: dict[str, Any] = {"typing": typing}
+
+        for module_name, alias in self.module_aliases.items():
+            namespace[alias] = sys.modules[module_name]
+
+        return namespace
+
+
+class _ClassWriter:
+    """Writes the deserializer for a single class."""
+
+    def __init__(self, module: _ModuleWriter, class_reference: type, index: int) -> None:
+        self.module = module
+        self.class_reference = class_reference
+        self.index = index
+        self.setup: list[str] = []
+        self.body: list[str] = []
+        self.constants: dict[tuple[str, str], str] = {}
+
+    def write(self) -> list[str]:
+        """Write the deserializer.
+
+        :returns: The lines of the generated code
+        :raises _UnsupportedError: If the class can't be expressed as generated code
+        """
+
+        class_source = self.reference(self.class_reference)
+
+        class_fingerprint = fingerprint(self.class_reference)
+        if class_fingerprint is None:
+            raise _UnsupportedError("the class can't be fingerprinted")
+
+        metadata = get_class_metadata(self.class_reference)
+        self.check_supported(metadata)
+
+        for field_meta in metadata.steps:
+            self.write_field(field_meta)
+
+        self.write_unhandled_check(metadata)
+
+        if hasattr(self.class_reference, "__deserialize_constructed__"):
+            self.setup.append("constructed = cls.__deserialize_constructed__")
+            self.body.append("constructed(instance)")
+
+        self.body.append("return instance")
+
+        function_name = "deserialize_" + self.class_reference.__qualname__.replace(".", "_")
+        build_name = f"_build_{self.index}"
+
+        lines = [
+            f"def {build_name}():",
+            f'    """{self.class_reference.__module__}.{self.class_reference.__qualname__}"""',
+            f"    cls = {class_source}",
+            "    class_dict = cls.__dict__",
+            "    generation = _class_generation(cls)",
+        ]
+        lines.extend("    " + line for line in self.setup)
+        lines.extend(
+            [
+                "",
+                f"    def {function_name}(data, debug_name, *, throw_on_unhandled, raw_storage_mode):",
+                "        # Decorators applied since this was generated change the class",
+                f"        if active_profiler() is not None or class_dict.get({_GENERATION_ATTRIBUTE!r}, 0) != generation:",
+                "            return _deserialize_dict(",
+                "                cls,",
+                "                data,",
+                "                debug_name,",
+                "                throw_on_unhandled=throw_on_unhandled,",
+                "                raw_storage_mode=raw_storage_mode,",
+                "            )",
+                "",
+                "        try:",
+                "            instance = cls.__new__(cls)",
+                "        except TypeError as ex:",
+                "            raise DeserializeException(",
+                '                f"Could not create instance of {cls} for {render_debug_name(debug_name)}"',
+                "            ) from ex",
+                "",
+                "        child_mode = raw_storage_mode.child_mode()",
+                "",
+            ]
+        )
+        lines.extend(("        " + line).rstrip() for line in self.body)
+        lines.extend(
+            [
+                "",
+                f"    return cls, {function_name}",
+                "",
+                "",
+                "register(",
+                f"    {self.class_reference.__module__!r},",
+                f"    {self.class_reference.__qualname__!r},",
+                f"    {class_fingerprint!r},",
+                f"    {build_name},",
+                ")",
+            ]
+        )
+
+        return lines
+
+    def check_supported(self, metadata: ClassMetadata) -> None:
+        """Check that a class only uses features the generated code supports."""
+
+        if metadata.downcast_field:
+            raise _UnsupportedError("downcasting isn't supported")
+
+        if len(metadata.hints) == 0:
+            raise _UnsupportedError("the class has no type hints")
+
+        if metadata.snake_case_violation is not None:
+            raise _UnsupportedError(f"the field {metadata.snake_case_violation} isn't snake cased")
+
+        for field_meta in metadata.steps:
+            if field_meta.union_cache is not None:
+                raise _UnsupportedError(f"adaptive unions aren't supported: {field_meta.name}")
+
+            if field_meta.discriminator is not None:
+                raise _UnsupportedError(f"discriminated unions aren't supported: {field_meta.name}")
+
+    def constant(self, prefix: str, source: str) -> str:
+        """Add a value which is worked out once, when the module is imported.
+
+        Fields which need the same value share it.
+
+        :returns: The name of the value
+        """
+
+        name = self.constants.get((prefix, source))
+
+        if name is None:
+            name = f"{prefix}_{len(self.constants)}"
+            self.constants[(prefix, source)] = name
+            self.setup.append(f"{name} = {source}")
+
+        return name
+
+    def write_field(self, field_meta: FieldMetadata) -> None:
+        """Write the steps which read a single field."""
+
+        name = field_meta.name
+
+        if field_meta.is_classvar:
+            self.body.extend(
+                [
+                    f"if {field_meta.key!r} in data:",
+                    "    raise DeserializeException(",
+                    f'        f"ClassVars cannot be set: {{render_debug_name(debug_name)}}.{name}"',
+                    "    )",
+                    "",
+                ]
+            )
+            return
+
+        value_lines = self.value_lines(field_meta)
+        parser_name = self.parser_name(field_meta)
+
+        if len(field_meta.keys) == 1:
+            value_source = f"data[{field_meta.key!r}]"
+            missing_value_source = f"data.get({field_meta.key!r})"
+            condition = f"{field_meta.key!r} in data"
+        else:
+            key_name = self.key_variable(field_meta)
+            for position, data_key in enumerate(field_meta.keys):
+                self.body.append(f"{'if' if position == 0 else 'elif'} {data_key!r} in data:")
+                self.body.append(f"    {key_name} = {data_key!r}")
+            self.body.extend(["else:", f"    {key_name} = None"])
+            value_source = f"data[{key_name}]"
+            missing_value_source = f"data[{key_name}] if {key_name} is not None else None"
+            condition = f"{key_name} is not None"
+
+        missing_is_none = (
+            field_meta.accepts_none
+            and parser_name is None
+            and _none_is_first_match(field_meta.type)
+        )
+
+        if field_meta.accepts_none and not field_meta.has_default and not missing_is_none:
+            # A missing value is deserialized from None, through the same
+            # steps as any other value
+            self.body.append(f"value = {_call(parser_name, missing_value_source)}")
+            self.body.extend(value_lines)
+            self.body.append("")
+            return
+
+        self.body.append(f"if {condition}:")
+        self.body.append(f"    value = {_call(parser_name, value_source)}")
+        self.body.extend("    " + line for line in value_lines)
+        self.body.append("else:")
+
+        if field_meta.has_default:
+            self.body.append(f"    instance.{name} = {self.default_source(field_meta)}")
+        elif missing_is_none:
+            self.body.append(f"    instance.{name} = None")
+        else:
+            self.body.extend(
+                [
+                    "    raise DeserializeException(",
+                    f'        f"Unexpected missing value for: {{render_debug_name(debug_name)}}.{name}"',
+                    "    )",
+                ]
+            )
+
+        self.body.append("")
+
+    def key_variable(self, field_meta: FieldMetadata) -> str:
+        """Get the name of the variable holding the key a field was read from."""
+        return f"key_{field_meta.name}"
+
+    def parser_name(self, field_meta: FieldMetadata) -> str | None:
+        """Get the name of the parser for a field, or None if it has no parser."""
+
+        if field_meta.parser is _identity_parser:
+            return None
+
+        try:
+            parser_source = self.reference(field_meta.parser)
+        except _UnsupportedError:
+            if _get_parser(self.class_reference, field_meta.key) is not field_meta.parser:
+                raise _UnsupportedError(
+                    f"the parser for {field_meta.name} can't be imported by name"
+                ) from None
+            parser_source = f"_get_parser(cls, {field_meta.key!r})"
+
+        return self.constant("parser", parser_source)
+
+    def default_source(self, field_meta: FieldMetadata) -> str:
+        """Get the source of the default value for a field."""
+
+        try:
+            return self.constant("default", self.value_source(field_meta.default_value))
+        except _UnsupportedError:
+            pass
+
+        if (
+            not _has_default(self.class_reference, field_meta.name)
+            or _get_default(self.class_reference, field_meta.name) is not field_meta.default_value
+        ):
+            raise _UnsupportedError(f"the default for {field_meta.name} can't be written as source")
+
+        return self.constant("default", f"_get_default(cls, {field_meta.name!r})")
+
+    def value_lines(self, field_meta: FieldMetadata) -> list[str]:
+        """Get the lines which deserialize `value` and set it on the instance."""
+
+        name = field_meta.name
+        type_hint = field_meta.type
+
+        if type_hint is Any:
+            return [f"instance.{name} = value"]
+
+        type_name = self.constant("type", self.type_source(type_hint))
+        handler_name = self.constant("handler", f"_handler_for({type_name})")
+        deserialize_lines = [
+            f"instance.{name} = {handler_name}({type_name}, value, (debug_name, {name!r}, False),"
+            " throw_on_unhandled=throw_on_unhandled, raw_storage_mode=child_mode)"
+        ]
+
+        # Values which are exactly one of the scalar types accepted are always
+        # returned unchanged, so the handler can be skipped for them
+        if type_hint in _SCALAR_TYPES:
+            check = f"type(value) is {self.type_source(type_hint)}"
+        elif field_meta.is_union and all(
+            member in _SCALAR_TYPES for member in field_meta.union_types or ()
+        ):
+            members = ", ".join(self.type_source(member) for member in get_args(type_hint))
+            check = f"type(value) in {self.constant('scalars', f'frozenset(({members}))')}"
+        else:
+            return deserialize_lines
+
+        return [f"if {check}:", f"    instance.{name} = value", "else:"] + [
+            "    " + line for line in deserialize_lines
+        ]
+
+    def write_unhandled_check(self, metadata: ClassMetadata) -> None:
+        """Write the check for keys in the data which no field reads."""
+
+        handled_keys: set[str] = set()
+        chosen_keys: list[str] = []
+
+        for field_meta in metadata.steps:
+            if field_meta.is_classvar:
+                continue
+
+            if len(field_meta.keys) == 1:
+                handled_keys.add(field_meta.key)
+            else:
+                chosen_keys.append(self.key_variable(field_meta))
+
+        allowed = getattr(self.class_reference, "__deserialize_allow_unhandled_map__", {})
+        handled_keys.update(key for key, is_allowed in allowed.items() if is_allowed)
+
+        handled_name = self.constant("handled_keys", f"frozenset({sorted(handled_keys)!r})")
+        condition = " and ".join(
+            [f"data_key not in {handled_name}"]
+            + [f"data_key != {key_name}" for key_name in chosen_keys]
+        )
+
+        self.body.extend(
+            [
+                "if throw_on_unhandled:",
+                "    for data_key in data:",
+                f"        if {condition}:",
+                "            raise UnhandledFieldException(",
+                '                f"Unhandled field: {data_key} for {render_debug_name(debug_name)}"',
+                "            )",
+                "",
+            ]
+        )
+
+    def reference(self, value: Any) -> str:
+        """Get the source which refers to a class or function by name.
+
+        :raises _UnsupportedError: If the value can't be imported by name
+        """
+
+        module_name = getattr(value, "__module__", None)
+        qualified_name = getattr(value, "__qualname__", None)
+
+        if (
+            not isinstance(module_name, str)
+            or not isinstance(qualified_name, str)
+            or "<" in qualified_name
+            or module_name == "__main__"
+        ):
+            raise _UnsupportedError(f"{value!r} can't be imported by name")
+
+        try:
+            found: Any = importlib.import_module(module_name)
+            for part in qualified_name.split("."):
+                found = getattr(found, part)
+        except (ImportError, AttributeError):
+            raise _UnsupportedError(f"{value!r} can't be imported by name") from None
+
+        if found is not value:
+            raise _UnsupportedError(f"{value!r} can't be imported by name")
+
+        if module_name == "builtins":
+            return qualified_name
+
+        return f"{self.module.module_alias(module_name)}.{qualified_name}"
+
+    def value_source(self, value: Any) -> str:
+        """Get the source of a constant value.
+
+        :raises _UnsupportedError: If the value can't be written as source
+        """
+
+        if type(value) in (type(None), bool, int, str, bytes):
+            return repr(value)
+
+        if type(value) is float and math.isfinite(value):
+            return repr(value)
+
+        if type(value) is tuple:
+            items = "".join(f"{self.value_source(item)}, " for item in cast(tuple[Any, ...], value))
+            return f"({items})"
+
+        if isinstance(value, enum.Enum):
+            return f"{self.reference(type(value))}[{value.name!r}]"
+
+        raise _UnsupportedError(f"{value!r} can't be written as source")
+
+    def type_source(self, type_hint: Any) -> str:
+        """Get the source of a type hint, checking it evaluates back to the same hint.
+
+        :raises _UnsupportedError: If the type hint can't be written as source
+        """
+
+        source = self._type_source(type_hint)
+
+        try:
+            # pylint: disable-next=eval-used
+            evaluated = eval(source, self.module.namespace())
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            raise _UnsupportedError(f"{type_hint} can't be written as source") from None
+
+        if evaluated != type_hint or repr(evaluated) != repr(type_hint):
+            raise _UnsupportedError(f"{type_hint} can't be written as source")
+
+        return source
+
+    # pylint: disable-next=too-many-return-statements
+    def _type_source(self, type_hint: Any) -> str:
+        """Get the source of a type hint."""
+
+        if type_hint is type(None):
+            return "type(None)"
+
+        if type_hint is Any:
+            return "typing.Any"
+
+        origin = get_origin(type_hint)
+        arguments = get_args(type_hint)
+
+        if origin is None:
+            if not inspect.isclass(type_hint):
+                raise _UnsupportedError(f"{type_hint} can't be written as source")
+            return self.reference(type_hint)
+
+        if isinstance(type_hint, types.UnionType):
+            return " | ".join(self._type_source(argument) for argument in arguments)
+
+        if origin is typing.Union:
+            base = "typing.Union"
+        elif origin is Literal:
+            return f"typing.Literal[{', '.join(self.value_source(argument) for argument in arguments)}]"
+        elif isinstance(type_hint, types.GenericAlias):
+            base = self.reference(origin)
+        elif getattr(type_hint, "_name", None) and hasattr(typing, type_hint._name):
+            base = f"typing.{type_hint._name}"
+        else:
+            base = self.reference(origin)
+
+        if not arguments:
+            return base
+
+        argument_sources = [
+            "..." if argument is Ellipsis else self._type_source(argument) for argument in arguments
+        ]
+
+        return f"{base}[{', '.join(argument_sources)}]"
+
+
+def _none_is_first_match(type_hint: Any) -> bool:
+    """Check if None is always deserialized to None for a union, without trying another member."""
+
+    for member in get_args(type_hint):
+        if member is type(None):
+            return True
+
+        if _could_accept(member, type(None)):
+            return False
+
+    return False
+
+
+def _call(function_name: str | None, argument_source: str) -> str:
+    """Get the source which calls a function, or just the argument if there is no function."""
+
+    if function_name is None:
+        return argument_source
+
+    return f"{function_name}({argument_source})"
+
+
+def default_output_path(module: Any) -> str:
+    """Get the path to generate the deserializers for a module to.
+
+    This is next to the module, named so that the library finds it automatically.
+
+    :param module: The module the classes are defined in
+    :returns: The path of the generated module
+    """
+
+    module_file = getattr(module, "__file__", None)
+
+    if not module_file:
+        raise ValueError(f"{module.__name__} isn't a file, so an output path is needed")
+
+    directory = os.path.dirname(module_file)
+
+    # Packages are generated next to their directory
+    if os.path.basename(module_file) == "__init__.py":
+        directory = os.path.dirname(directory)
+
+    short_name = compiled_module_name(module.__name__).rsplit(".", 1)[-1]
+
+    return os.path.join(directory, f"{short_name}.py")
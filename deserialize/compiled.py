@@ -0,0 +1,134 @@
+"""Look up deserializers generated ahead of time by `python -m deserialize compile`."""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Callable
+
+from deserialize.persistent_cache import fingerprint
+
+# The suffix added to the name of a module to get the name of the module its
+# deserializers are generated into, e.g. `app.models_deserialize_compiled`
+COMPILED_MODULE_SUFFIX = "_deserialize_compiled"
+
+# The generated deserializers which haven't been used yet, keyed by the module
+# and qualified name of their class, with the fingerprint of the class when
+# they were generated
+_PENDING: dict[tuple[str, str], tuple[str, Callable[[], tuple[type, Callable[..., Any]]]]] = {}
+
+# The generated deserializer for each class which has been used, which takes
+# the same arguments as the dict handlers in the main module
+_COMPILED: dict[type, Callable[..., Any]] = {}
+
+# The modules which have already been checked for generated deserializers
+_SEARCHED_MODULES: set[str] = set()
+
+_SEARCH_LOCK = threading.RLock()
+
+
+def register(
+    module_name: str,
+    qualified_name: str,
+    class_fingerprint: str,
+    build: Callable[[], tuple[type, Callable[..., Any]]],
+) -> None:
+    """Register a generated deserializer.
+
+    This is called by generated modules as they are imported, and shouldn't
+    be needed otherwise. Nothing is checked or built until the class is first
+    deserialized, so that importing a generated module is cheap.
+
+    :param module_name: The module the class is defined in
+    :param qualified_name: The qualified name of the class
+    :param class_fingerprint: The fingerprint of the class when the
+        deserializer was generated
+    :param build: Builds the deserializer, returning the class it is for and
+        the deserializer itself
+    """
+
+    with _SEARCH_LOCK:
+        _PENDING[(module_name, qualified_name)] = (class_fingerprint, build)
+
+
+def compiled_deserializer(class_reference: Any) -> Callable[..., Any] | None:
+    """Get the generated deserializer for a class, if there is one.
+
+    The first time a class from a module is seen, the module generated for it
+    is imported if it exists.
+
+    :param class_reference: The class to get the deserializer for
+    :returns: The deserializer, or None if the class should be deserialized as
+        normal, including if it has changed since the deserializer was generated
+    """
+
+    if not isinstance(class_reference, type):
+        return None
+
+    deserializer = _COMPILED.get(class_reference)
+
+    if deserializer is not None:
+        return deserializer
+
+    module_name = class_reference.__module__
+
+    with _SEARCH_LOCK:
+        if module_name not in _SEARCHED_MODULES:
+            _import_compiled_module(module_name)
+            _SEARCHED_MODULES.add(module_name)
+
+        entry = _PENDING.pop((module_name, class_reference.__qualname__), None)
+
+        if entry is None:
+            return _COMPILED.get(class_reference)
+
+        deserializer = _build(class_reference, *entry)
+
+        if deserializer is not None:
+            _COMPILED[class_reference] = deserializer
+
+        return deserializer
+
+
+def _build(
+    class_reference: type,
+    class_fingerprint: str,
+    build: Callable[[], tuple[type, Callable[..., Any]]],
+) -> Callable[..., Any] | None:
+    """Build a generated deserializer, if its class hasn't changed since it was generated."""
+
+    if fingerprint(class_reference) != class_fingerprint:
+        return None
+
+    try:
+        built_class, deserializer = build()
+    except (AttributeError, ImportError, KeyError, TypeError):
+        # Something the class refers to no longer exists
+        return None
+
+    if built_class is not class_reference:
+        return None
+
+    return deserializer
+
+
+def _import_compiled_module(module_name: str) -> None:
+    """Import the generated module for a module, if it exists."""
+
+    compiled_name = module_name + COMPILED_MODULE_SUFFIX
+
+    try:
+        if importlib.util.find_spec(compiled_name) is None:
+            return
+    except (ImportError, ValueError):
+        return
+
+    importlib.import_module(compiled_name)
+
+
+def clear_compiled() -> None:
+    """Forget every generated deserializer, and which modules have been searched."""
+
+    with _SEARCH_LOCK:
+        _PENDING.clear()
+        _COMPILED.clear()
+        _SEARCHED_MODULES.clear()
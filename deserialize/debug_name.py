@@ -0,0 +1,28 @@
+"""Lazily rendered names for values, used in error messages."""
+
+from typing import Any, Union
+
+# A debug name is either the name of the root value, or a tuple of
+# (parent debug name, key, whether the key is an index) for a value nested
+# inside another. Tuples are far cheaper to create than formatted strings, and
+# almost all names are never needed, so they are only rendered into strings
+# such as `Root.field[3].name` when an error message is built.
+DebugName = Union[str, tuple["DebugName", Any, bool]]
+
+
+def render_debug_name(debug_name: DebugName) -> str:
+    """Render a debug name into the string used in error messages.
+
+    :param debug_name: The debug name to render
+    :returns: The rendered debug name
+    """
+
+    parts: list[str] = []
+
+    while not isinstance(debug_name, str):
+        debug_name, key, is_index = debug_name
+        parts.append(f"[{key}]" if is_index else f".{key}")
+
+    parts.append(debug_name)
+
+    return "".join(reversed(parts))
@@ -1,7 +1,13 @@
 """Decorators used for adding functionality to the library."""
 
+from deserialize.decorators.adaptive import adaptive_unions, _uses_adaptive_unions
 from deserialize.decorators.constructed import constructed, _call_constructed
 from deserialize.decorators.default import default, _get_default, _has_default
+from deserialize.decorators.generation import (
+    _any_class_generation,
+    _class_generation,
+    _configuration_changed,
+)
 from deserialize.decorators.downcasting import (
     downcast_field,
     _get_downcast_field,
@@ -9,10 +15,13 @@ from deserialize.decorators.downcasting import (
     _get_downcast_class,
     allow_downcast_fallback,
     _allows_downcast_fallback,
+    _get_own_downcast_map,
+    _downcast_generation,
+    _invalidate_downcasts,
 )
 from deserialize.decorators.ignore import ignore, _should_ignore
 from deserialize.decorators.key import key, _get_key
-from deserialize.decorators.parser import parser, _get_parser
+from deserialize.decorators.parser import parser, _get_parser, _identity_parser
 from deserialize.decorators.snake import auto_snake, _uses_auto_snake
 from deserialize.decorators.unhandled import allow_unhandled, _should_allow_unhandled
 
@@ -28,6 +37,7 @@ __all__ = [
     "parser",
     "auto_snake",
     "allow_unhandled",
+    "adaptive_unions",
     # Internal functions (exported for use within the deserialize package)
     "_call_constructed",
     "_get_default",
@@ -35,9 +45,17 @@ __all__ = [
     "_get_downcast_field",
     "_get_downcast_class",
     "_allows_downcast_fallback",
+    "_get_own_downcast_map",
+    "_downcast_generation",
+    "_invalidate_downcasts",
     "_should_ignore",
     "_get_key",
     "_get_parser",
+    "_identity_parser",
     "_uses_auto_snake",
     "_should_allow_unhandled",
+    "_uses_adaptive_unions",
+    "_any_class_generation",
+    "_class_generation",
+    "_configuration_changed",
 ]
@@ -0,0 +1,28 @@
+"""Decorators used for adding functionality to the library."""
+
+from typing import Any, Callable, TypeVar
+
+from deserialize.decorators.generation import _configuration_changed
+
+T = TypeVar("T")
+
+
+def adaptive_unions() -> Callable[[type[T]], type[T]]:
+    """A decorator function for marking classes as those whose union fields should adapt.
+
+    Each union field of the class remembers which member of the union last
+    succeeded for each type of data, and tries that member first next time.
+    """
+
+    def store(class_reference: type[T]) -> type[T]:
+        """Store the adaptive flag."""
+        setattr(class_reference, "__deserialize_adaptive_unions__", True)
+        _configuration_changed(class_reference)
+        return class_reference
+
+    return store
+
+
+def _uses_adaptive_unions(class_reference: type[Any]) -> bool:
+    """Get whether adaptive unions are in use or not"""
+    return getattr(class_reference, "__deserialize_adaptive_unions__", False)
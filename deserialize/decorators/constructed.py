@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
+
 T = TypeVar("T")
 
 
@@ -11,6 +13,7 @@ def constructed(function: Callable[[Any], None]) -> Callable[[type[T]], type[T]]
     def store_constructed(class_reference: type[T]) -> type[T]:
         """Store the key map."""
         setattr(class_reference, "__deserialize_constructed__", function)
+        _configuration_changed(class_reference)
         return class_reference
 
     return store_constructed
@@ -2,6 +2,7 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
 from deserialize.exceptions import NoDefaultSpecifiedException
 
 T = TypeVar("T")
@@ -17,6 +18,7 @@ def default(key_name: str, default_value: Any) -> Callable[[type[T]], type[T]]:
             setattr(class_reference, "__deserialize_defaults_map__", {})
 
         class_reference.__deserialize_defaults_map__[key_name] = default_value  # type: ignore[attr-defined]
+        _configuration_changed(class_reference, "__deserialize_defaults_map__")
 
         return class_reference
 
@@ -2,8 +2,24 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed, _Counter
+
 T = TypeVar("T")
 
+# Incremented whenever downcasting is configured, so that anything built from
+# the configuration can tell when it is out of date
+_GENERATION = _Counter()
+
+
+def _downcast_generation() -> int:
+    """Get the current generation of the downcast configuration."""
+    return _GENERATION.value
+
+
+def _invalidate_downcasts() -> None:
+    """Mark anything built from the downcast configuration as out of date."""
+    _GENERATION.increment()
+
 
 def downcast_field(property_name: str) -> Callable[[type[T]], type[T]]:
     """A decorator function for handling downcasting."""
@@ -11,6 +27,8 @@ def downcast_field(property_name: str) -> Callable[[type[T]], type[T]]:
     def store_downcast_field_value(class_reference: type[T]) -> type[T]:
         """Store the key map."""
         setattr(class_reference, "__deserialize_downcast_field__", property_name)
+        _configuration_changed(class_reference)
+        _invalidate_downcasts()
         return class_reference
 
     return store_downcast_field_value
@@ -26,10 +44,14 @@ def downcast_identifier(super_class: type[Any], identifier: Any) -> Callable[[ty
 
     def store_key_map(class_reference: type[T]) -> type[T]:
         """Store the downcast map."""
-        if not hasattr(super_class, "__deserialize_downcast_map__"):
+        # Each class gets its own map, rather than adding to an inherited one,
+        # so that subclasses can be downcast roots themselves
+        if "__deserialize_downcast_map__" not in super_class.__dict__:
             setattr(super_class, "__deserialize_downcast_map__", {})
 
         super_class.__deserialize_downcast_map__[identifier] = class_reference
+        _configuration_changed(super_class)
+        _invalidate_downcasts()
 
         return class_reference
 
@@ -39,10 +61,20 @@ def downcast_identifier(super_class: type[Any], identifier: Any) -> Callable[[ty
 def _get_downcast_class(super_class: type[Any], identifier: Any) -> type[Any] | None:
     """Get the downcast identifier for the given class and super class, returning None if not set"""
 
-    if not hasattr(super_class, "__deserialize_downcast_map__"):
-        return None
+    for class_reference in super_class.__mro__:
+        if _get_downcast_field(class_reference) != _get_downcast_field(super_class):
+            continue
+
+        subclass = _get_own_downcast_map(class_reference).get(identifier)
+        if subclass is not None:
+            return subclass
+
+    return None
+
 
-    return super_class.__deserialize_downcast_map__.get(identifier)
+def _get_own_downcast_map(class_reference: type[Any]) -> dict[Any, type[Any]]:
+    """Get the downcast identifiers registered directly against a class."""
+    return getattr(class_reference, "__dict__", {}).get("__deserialize_downcast_map__", {})
 
 
 def allow_downcast_fallback() -> Callable[[type[T]], type[T]]:
@@ -51,6 +83,7 @@ def allow_downcast_fallback() -> Callable[[type[T]], type[T]]:
     def store(class_reference: type[T]) -> type[T]:
         """Store the allowance flag."""
         setattr(class_reference, "__deserialize_downcast_allow_fallback__", True)
+        _configuration_changed(class_reference)
         return class_reference
 
     return store
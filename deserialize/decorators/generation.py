@@ -0,0 +1,81 @@
+"""Track when the deserialize configuration of a class changes."""
+
+from typing import Any
+
+# The attribute each class's generation is stored in. It is always read from
+# the class's own `__dict__`, never inherited.
+_GENERATION_ATTRIBUTE = "__deserialize_generation__"
+
+
+class _Counter:
+    """A number which is increased whenever something it tracks changes."""
+
+    __slots__ = ("value",)
+
+    value: int
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def increment(self) -> None:
+        """Mark anything built from the previous value as out of date."""
+        self.value += 1
+
+
+# Incremented whenever the configuration of any class changes, for anything
+# built from the configuration of several unrelated classes
+_ANY_GENERATION = _Counter()
+
+
+def _class_generation(class_reference: Any) -> int:
+    """Get the generation of the configuration of a class.
+
+    This changes whenever a decorator changes the configuration of the class
+    or any of its bases, so that anything built from the configuration can
+    cheaply tell when it is out of date.
+
+    :param class_reference: The class to get the generation of
+    :returns: The generation, which is 0 if the class has never been configured
+    """
+    return getattr(class_reference, "__dict__", {}).get(_GENERATION_ATTRIBUTE, 0)
+
+
+def _any_class_generation() -> int:
+    """Get a generation which changes whenever the configuration of any class does."""
+    return _ANY_GENERATION.value
+
+
+def _configuration_changed(class_reference: Any, attribute_name: str | None = None) -> None:
+    """Record that the configuration of a class has changed.
+
+    The generation of the class and all of its subclasses is increased, since
+    they inherit its configuration.
+
+    :param class_reference: The class which was configured
+    :param attribute_name: The attribute which was changed. If it is
+        inherited from a base class, the base class's configuration has
+        changed rather than just this class's.
+    """
+
+    _ANY_GENERATION.increment()
+
+    changed = class_reference
+
+    if attribute_name is not None:
+        for base_class in getattr(class_reference, "__mro__", ()):
+            if attribute_name in base_class.__dict__:
+                changed = base_class
+                break
+
+    pending = [changed]
+    seen: set[int] = set()
+
+    while pending:
+        current = pending.pop()
+
+        if id(current) in seen:
+            continue
+
+        seen.add(id(current))
+        setattr(current, _GENERATION_ATTRIBUTE, _class_generation(current) + 1)
+        pending.extend(type.__subclasses__(current))
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
+
 T = TypeVar("T")
 
 
@@ -14,6 +16,7 @@ def key(property_name: str, key_name: str) -> Callable[[type[T]], type[T]]:
             setattr(class_reference, "__deserialize_key_map__", {})
 
         class_reference.__deserialize_key_map__[property_name] = key_name  # type: ignore[attr-defined]
+        _configuration_changed(class_reference, "__deserialize_key_map__")
 
         return class_reference
 
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
+
 T = TypeVar("T")
 
 
@@ -15,20 +17,22 @@ def parser(key_name: str, parser_function: Callable[[Any], Any]) -> Callable[[ty
             setattr(class_reference, "__deserialize_parser_map__", {})
 
         class_reference.__deserialize_parser_map__[key_name] = parser_function  # type: ignore[attr-defined]
+        _configuration_changed(class_reference, "__deserialize_parser_map__")
 
         return class_reference
 
     return store_parser_map
 
 
+def _identity_parser(value: Any) -> Any:
+    """This parser does nothing. It's simply used as the default."""
+    return value
+
+
 def _get_parser(class_reference: type[Any], key_name: str) -> Callable[[Any], Any]:
     """Get the parser for the given class and key name."""
 
-    def identity_parser(value: Any) -> Any:
-        """This parser does nothing. It's simply used as the default."""
-        return value
-
     if not hasattr(class_reference, "__deserialize_parser_map__"):
-        return identity_parser
+        return _identity_parser
 
-    return class_reference.__deserialize_parser_map__.get(key_name, identity_parser)
+    return class_reference.__deserialize_parser_map__.get(key_name, _identity_parser)
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
+
 T = TypeVar("T")
 
 
@@ -11,6 +13,7 @@ def auto_snake() -> Callable[[type[T]], type[T]]:
     def store(class_reference: type[T]) -> type[T]:
         """Store the allowance flag."""
         setattr(class_reference, "__deserialize_auto_snake__", True)
+        _configuration_changed(class_reference)
         return class_reference
 
     return store
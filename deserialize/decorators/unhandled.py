@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, TypeVar
 
+from deserialize.decorators.generation import _configuration_changed
+
 T = TypeVar("T")
 
 
@@ -14,6 +16,7 @@ def allow_unhandled(key_name: str) -> Callable[[type[T]], type[T]]:
             setattr(class_reference, "__deserialize_allow_unhandled_map__", {})
 
         class_reference.__deserialize_allow_unhandled_map__[key_name] = True  # type: ignore[attr-defined]
+        _configuration_changed(class_reference, "__deserialize_allow_unhandled_map__")
 
         return class_reference
 
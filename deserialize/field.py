@@ -29,14 +29,17 @@ class Field:
     :param default: Default value if field is missing (replaces @default decorator)
     :param parser: Function to parse/transform the value (replaces @parser decorator)
     :param ignore: Whether to ignore this field during deserialization (replaces @ignore decorator)
+    :param discriminator: For a union of classes, the key in the source data whose value
+        identifies which member of the union to deserialize to
     """
 
-    __slots__ = ("alias", "default", "parser", "ignore", "_has_default")
+    __slots__ = ("alias", "default", "parser", "ignore", "discriminator", "_has_default")
 
     alias: str | None
     default: Any
     parser: Callable[[Any], Any] | None
     ignore: bool
+    discriminator: str | None
     _has_default: bool
 
     def __init__(
@@ -46,11 +49,13 @@ class Field:
         default: Any = _MISSING,
         parser: Callable[[Any], Any] | None = None,
         ignore: bool = False,
+        discriminator: str | None = None,
     ) -> None:
         self.alias = alias
         self.default = default
         self.parser = parser
         self.ignore = ignore
+        self.discriminator = discriminator
         self._has_default = default is not _MISSING
 
     def has_default(self) -> bool:
@@ -70,4 +75,6 @@ class Field:
             parts.append(f"parser={self.parser!r}")
         if self.ignore:
             parts.append("ignore=True")
+        if self.discriminator is not None:
+            parts.append(f"discriminator={self.discriminator!r}")
         return f"Field({', '.join(parts)})"
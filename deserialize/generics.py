@@ -0,0 +1,121 @@
+"""Resolve the type hints of generic classes for a set of type arguments."""
+
+import inspect
+import typing
+from typing import Any, TypeVar
+
+
+def specialized_origin(type_value: Any) -> type | None:
+    """Get the generic class a type hint specializes, if it does.
+
+    e.g. For `Page[User]` this is `Page`.
+
+    :param type_value: The type hint to check
+    :returns: The generic class, or None if the hint isn't a specialization of one
+    """
+
+    origin = typing.get_origin(type_value)
+
+    if not inspect.isclass(origin) or not getattr(origin, "__parameters__", ()):
+        return None
+
+    if origin.__module__ in ("builtins", "typing", "collections.abc"):
+        return None
+
+    return origin
+
+
+def resolve_type_hints(class_reference: Any) -> dict[str, Any]:
+    """Get the type hints of a class, with any type variables substituted.
+
+    This works for specializations of generic classes, such as `Page[User]`,
+    and for classes which inherit from them, such as
+    `class UserPage(Page[User])`. Type variables which aren't given a type
+    are left as they are.
+
+    :param class_reference: The class or specialization to get the hints for
+    :returns: The type hints, in the same order as `typing.get_type_hints`
+    """
+
+    origin = specialized_origin(class_reference)
+
+    if origin is None:
+        hints = typing.get_type_hints(class_reference, include_extras=True)
+        arguments: tuple[Any, ...] = ()
+        actual_class = class_reference
+    else:
+        hints = typing.get_type_hints(origin, include_extras=True)
+        arguments = typing.get_args(class_reference)
+        actual_class = origin
+
+    substitutions: dict[Any, dict[TypeVar, Any]] = {}
+    _collect_substitutions(actual_class, arguments, substitutions)
+
+    if not any(substitutions.values()):
+        return hints
+
+    resolved: dict[str, Any] = {}
+
+    for attribute_name, hint in hints.items():
+        owner = _annotation_owner(actual_class, attribute_name)
+        resolved[attribute_name] = substitute(hint, substitutions.get(owner, {}))
+
+    return resolved
+
+
+def substitute(type_value: Any, substitutions: dict[TypeVar, Any]) -> Any:
+    """Replace the type variables in a type hint.
+
+    :param type_value: The type hint, e.g. `list[T]`
+    :param substitutions: The type for each type variable, e.g. `{T: User}`
+    :returns: The type hint with the type variables replaced, e.g. `list[User]`
+    """
+
+    if isinstance(type_value, TypeVar):
+        return substitutions.get(type_value, type_value)
+
+    parameters = getattr(type_value, "__parameters__", None)
+
+    if not parameters or inspect.isclass(type_value):
+        return type_value
+
+    return type_value[tuple(substitutions.get(parameter, parameter) for parameter in parameters)]
+
+
+def _collect_substitutions(
+    class_reference: Any,
+    arguments: tuple[Any, ...],
+    substitutions: dict[Any, dict[TypeVar, Any]],
+) -> None:
+    """Work out the type of each type variable for a class and its bases.
+
+    :param class_reference: The class
+    :param arguments: The types the class's own type variables are given, if any
+    :param substitutions: The type for each type variable, keyed by the class
+        which declares it, which is added to
+    """
+
+    if class_reference in substitutions:
+        return
+
+    own: dict[TypeVar, Any] = dict(zip(getattr(class_reference, "__parameters__", ()), arguments))
+    substitutions[class_reference] = own
+
+    for base in getattr(class_reference, "__dict__", {}).get("__orig_bases__", ()):
+        base_class = typing.get_origin(base)
+
+        if not inspect.isclass(base_class):
+            continue
+
+        base_arguments = tuple(substitute(argument, own) for argument in typing.get_args(base))
+        _collect_substitutions(base_class, base_arguments, substitutions)
+
+
+def _annotation_owner(class_reference: Any, attribute_name: str) -> Any:
+    """Get the class in the MRO which declares the annotation for an attribute."""
+
+    for base_class in class_reference.__mro__:
+        if attribute_name in base_class.__dict__.get("__annotations__", {}):
+            return base_class
+
+    return class_reference
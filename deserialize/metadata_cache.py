@@ -1,18 +1,31 @@
 """Class metadata caching for performance optimization."""
 
+import builtins
+import inspect
+import os
+import threading
+import weakref
 import typing
-from typing import Any, Callable, get_args, get_origin, Annotated
+from typing import Any, Callable, Literal, cast, get_args, get_origin, Annotated
 
 from deserialize.decorators import (
     _get_key,
     _get_parser,
+    _identity_parser,
     _has_default,
     _get_default,
     _should_ignore,
     _uses_auto_snake,
+    _uses_adaptive_unions,
     _get_downcast_field,
     _allows_downcast_fallback,
+    _class_generation,
+    _any_class_generation,
+    _get_own_downcast_map,
+    _downcast_generation,
+    _invalidate_downcasts,
 )
+from deserialize.decorators.generation import _GENERATION_ATTRIBUTE
 from deserialize.type_checks import (
     is_classvar,
     is_union,
@@ -23,7 +36,10 @@ from deserialize.type_checks import (
     dict_content_types,
 )
 from deserialize.conversions import camel_case, pascal_case
+from deserialize.exceptions import DeserializeException
 from deserialize.field import Field
+from deserialize.generics import resolve_type_hints, specialized_origin
+from deserialize.persistent_cache import PersistentCache
 
 
 def _extract_field_config(field_type: Any) -> tuple[Any, Field | None]:
@@ -67,6 +83,13 @@ class FieldMetadata:
         "dict_value_type",
         "camel_key",
         "pascal_key",
+        "keys",
+        "accepts_none",
+        "union_cache",
+        "handler",
+        "discriminator",
+        "_discriminated_members",
+        "_discriminated_generation",
     )
 
     name: str
@@ -86,7 +109,15 @@ class FieldMetadata:
     dict_value_type: Any | None
     camel_key: str | None
     pascal_key: str | None
-
+    keys: tuple[str, ...]
+    accepts_none: bool
+    union_cache: dict[builtins.type, Any] | None
+    handler: Callable[..., Any] | None
+    discriminator: str | None
+    _discriminated_members: dict[Any, Any] | None
+    _discriminated_generation: int
+
+    # pylint: disable-next=too-many-branches
     def __init__(
         self,
         name: str,
@@ -108,11 +139,11 @@ class FieldMetadata:
             if field_config.parser:
                 self.parser = field_config.parser
             else:
-                identity_func: Callable[[Any], Any] = lambda x: x
-                self.parser = identity_func
+                self.parser = _identity_parser
             self.has_default = field_config.has_default()
             self.default_value = field_config.default if field_config.has_default() else None
             self.ignore = field_config.ignore
+            self.discriminator = field_config.discriminator
         else:
             # Fall back to decorator-based metadata
             self.key = _get_key(class_reference, name)
@@ -120,6 +151,7 @@ class FieldMetadata:
             self.has_default = _has_default(class_reference, name)
             self.default_value = _get_default(class_reference, name) if self.has_default else None
             self.ignore = _should_ignore(class_reference, name)
+            self.discriminator = None
 
         # Type classification (use actual type, not Annotated wrapper)
         self.is_classvar = is_classvar(self.type)
@@ -154,79 +186,701 @@ class FieldMetadata:
             self.camel_key = camel_case(self.key)
             self.pascal_key = pascal_case(self.key)
 
+        # All keys this field can be read from, in lookup priority order
+        keys = [self.key]
+        for alternative_key in (self.camel_key, self.pascal_key):
+            if alternative_key and alternative_key not in keys:
+                keys.append(alternative_key)
+        self.keys = tuple(keys)
+
+        # Whether a missing value can be deserialized as None
+        self.accepts_none = bool(
+            self.is_union and self.union_types and type(None) in self.union_types
+        )
+
+        # The union member which last succeeded for each type of data, if the
+        # class has opted in to adaptive unions
+        self.union_cache = None
+        if self.is_union and _uses_adaptive_unions(class_reference):
+            self.union_cache = {}
+
+        # The handler for the type, which is looked up when first needed. It
+        # is kept here since not every type's handler is cached globally.
+        self.handler = None
+
+        # The members are looked up the first time they are needed, since they
+        # may not all be defined yet, or may refer back to this class
+        self._discriminated_members = None
+        self._discriminated_generation = -1
+        if self.discriminator is not None and not self.is_union:
+            raise DeserializeException(
+                f"A discriminator can only be used with a union of classes: {class_reference}.{name}"
+            )
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Get the state to pickle, leaving out anything learned at runtime."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["union_cache"] = None if self.union_cache is None else {}
+        state["handler"] = None
+        state["_discriminated_members"] = None
+        return None, state
+
+    def discriminated_members(self) -> dict[Any, Any]:
+        """Get the members of a discriminated union, keyed by their tag.
+
+        :returns: A dictionary of tag value to the class it identifies
+        """
+
+        # The tags come from the members' configuration, which may change
+        if (
+            self._discriminated_members is not None
+            and self._discriminated_generation == _any_class_generation()
+        ):
+            return self._discriminated_members
+
+        generation = _any_class_generation()
+
+        members = discriminated_members(self.type, cast(str, self.discriminator), self.name)
+
+        self._discriminated_members = members
+        self._discriminated_generation = generation
+        return members
+
+
+def discriminated_members(union_type: Any, discriminator: str, name: str) -> dict[Any, Any]:
+    """Get the members of a discriminated union, keyed by their tag.
+
+    :param union_type: The union
+    :param discriminator: The key of the discriminator in the data
+    :param name: What the union is used for, for error messages
+
+    :returns: A dictionary of tag value to the class it identifies
+    """
+
+    members: dict[Any, Any] = {}
+
+    for member in typing.get_args(union_type):
+        # Only classes can be identified from dict data. Other members,
+        # such as None, are left for data of other types.
+        if not inspect.isclass(member) or member.__module__ == "builtins":
+            continue
+
+        for tag in _discriminator_tags(member, discriminator):
+            if tag in members:
+                raise DeserializeException(
+                    f"Discriminator value {tag!r} is used by both {members[tag]} and {member} for {name}"
+                )
+            members[tag] = member
+
+    return members
+
+
+def _discriminator_tags(member: Any, discriminator: str) -> tuple[Any, ...]:
+    """Get the values of the discriminator which identify a member of a union.
+
+    These come from a `Literal` type hint on the discriminator field, or
+    failing that, its default or class attribute value.
+
+    :param member: The class to get the tags for
+    :param discriminator: The key of the discriminator in the data
+    :returns: The tags which identify the member
+    """
+
+    attribute_name = discriminator
+
+    for field_meta in get_class_metadata(member).fields.values():
+        if discriminator not in (field_meta.name, field_meta.key):
+            continue
+
+        if get_origin(field_meta.type) is Literal:
+            return get_args(field_meta.type)
+
+        if field_meta.has_default:
+            return (field_meta.default_value,)
+
+        attribute_name = field_meta.name
+        break
+
+    if hasattr(member, attribute_name):
+        return (getattr(member, attribute_name),)
+
+    raise DeserializeException(
+        f"Could not find a value for discriminator '{discriminator}' on union member {member}"
+    )
+
 
 class ClassMetadata:
     """Cached metadata for a class."""
 
     __slots__ = (
-        "class_reference",
+        "_class_reference",
+        "origin",
+        "generation",
         "hints",
         "fields",
         "auto_snake",
         "downcast_field",
         "allows_downcast_fallback",
+        "steps",
+        "snake_case_violation",
+        "required_keys",
+        "key_index",
+        "shapes",
+        "_downcast_table",
+        "_downcast_generation",
     )
 
-    class_reference: Any
+    _class_reference: Any
+    origin: Any | None
+    generation: int
     hints: dict[str, Any]
     fields: dict[str, FieldMetadata]
     auto_snake: bool
     downcast_field: str | None
     allows_downcast_fallback: bool
+    steps: tuple[FieldMetadata, ...]
+    snake_case_violation: str | None
+    required_keys: tuple[tuple[str, ...], ...]
+    key_index: dict[str, tuple[int, ...]]
+    shapes: "dict[tuple[Any, ...], ShapePlan]"
+    _downcast_table: "dict[Any, DowncastTarget] | None"
+    _downcast_generation: int
 
     def __init__(self, class_reference: Any):
-        self.class_reference = class_reference
-
-        # Get type hints once (include_extras=True to preserve Annotated metadata)
-        self.hints = typing.get_type_hints(class_reference, include_extras=True)
+        # Held weakly where possible, so that metadata kept in the registry
+        # doesn't keep its class alive
+        try:
+            self._class_reference = weakref.ref(class_reference)
+        except TypeError:
+            self._class_reference = class_reference
+
+        # For specializations of generic classes, such as `Page[User]`, the
+        # generic class. It is what instances are created from, and what the
+        # decorators are applied to.
+        self.origin = specialized_origin(class_reference)
+        configured_class = class_reference if self.origin is None else self.origin
+
+        # The generation of the class's configuration this was built from. It
+        # is read first, so that a decorator applied while this is being built
+        # makes it out of date rather than being missed.
+        self.generation = _class_generation(configured_class)
+
+        # Get type hints once (include_extras=True to preserve Annotated
+        # metadata), with the type arguments of generic classes filled in
+        self.hints = resolve_type_hints(class_reference)
 
         # Class-level decorators
-        self.auto_snake = _uses_auto_snake(class_reference)
-        self.downcast_field = _get_downcast_field(class_reference)
-        self.allows_downcast_fallback = _allows_downcast_fallback(class_reference)
+        self.auto_snake = _uses_auto_snake(configured_class)
+        self.downcast_field = _get_downcast_field(configured_class)
+        self.allows_downcast_fallback = _allows_downcast_fallback(configured_class)
+        self._downcast_table = None
+        self._downcast_generation = -1
 
         # Build field metadata
         self.fields = {}
         for attr_name, attr_type in self.hints.items():
             self.fields[attr_name] = FieldMetadata(
-                attr_name, attr_type, class_reference, self.auto_snake
+                attr_name, attr_type, configured_class, self.auto_snake
             )
 
+        self.steps, self.snake_case_violation = self._compile_steps()
+
+        self.key_index = self._index_keys()
+        self.shapes = {}
+
+        # The keys for each field which must be present in the data, since it
+        # has no default and can't be None
+        self.required_keys = tuple(
+            field_meta.keys
+            for field_meta in self.steps
+            if not field_meta.is_classvar
+            and not field_meta.has_default
+            and not field_meta.accepts_none
+        )
+
+    @property
+    def class_reference(self) -> Any:
+        """The class the metadata is for."""
+
+        reference = self._class_reference
+
+        if isinstance(reference, weakref.ref):
+            return cast("weakref.ref[Any]", reference)()
+
+        return reference
+
+    def downcast_table(self) -> "dict[Any, DowncastTarget]":
+        """Get the classes to downcast to, keyed by their identifier.
+
+        This covers every identifier registered against this class, or against
+        a base class using the same downcast field, including those registered
+        against subclasses using the same field. The table is rebuilt if
+        downcasting has been configured since it was built.
+
+        :returns: A dictionary of identifier to the class to downcast to
+        """
+
+        if self._downcast_table is None or self._downcast_generation != _downcast_generation():
+            self._downcast_generation = _downcast_generation()
+            self._downcast_table = {}
+
+            configured_class = self.class_reference if self.origin is None else self.origin
+
+            for base_class in getattr(configured_class, "__mro__", ()):
+                if _get_downcast_field(base_class) == self.downcast_field:
+                    _add_downcast_targets(
+                        self._downcast_table, base_class, self.downcast_field, set()
+                    )
+
+        return self._downcast_table
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Get the state to pickle, leaving out anything learned at runtime."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        # Weak references can't be pickled, and the class is pickled by name anyway
+        state["_class_reference"] = self.class_reference
+        state["shapes"] = {}
+        state["_downcast_table"] = None
+        state["_downcast_generation"] = -1
+        return None, state
+
+    def shape_plan(self, shape: tuple[Any, ...]) -> "ShapePlan":
+        """Get the plan for reading data with the given keys.
+
+        Plans are cached, up to a limit per class so that data with arbitrary
+        keys can't use unbounded memory. Beyond the limit, plans are built
+        each time instead.
+
+        :param shape: The keys of the data, in order
+        :returns: The plan for the data
+        """
+
+        plan = self.shapes.get(shape)
+
+        if plan is None:
+            plan = ShapePlan(self, shape)
+            if len(self.shapes) < MAX_SHAPES_PER_CLASS:
+                self.shapes[shape] = plan
+
+        return plan
+
+    def _index_keys(self) -> dict[str, tuple[int, ...]]:
+        """Index every key in the data which a field can be read from.
+
+        ClassVars are left out, since they can't be set from the data.
+
+        :returns: A dictionary of each key to the positions in the steps of
+            the fields which read from it
+        """
+        index: dict[str, tuple[int, ...]] = {}
+
+        for position, field_meta in enumerate(self.steps):
+            if field_meta.is_classvar:
+                continue
+
+            for data_key in field_meta.keys:
+                index[data_key] = index.get(data_key, ()) + (position,)
+
+        return index
+
+    def _compile_steps(self) -> tuple[tuple[FieldMetadata, ...], str | None]:
+        """Compile the flat list of fields to process for each object.
+
+        Ignored fields are dropped entirely. If auto_snake is in use and a field
+        isn't snake cased, the steps stop at that field and its name is returned
+        so that the error can be raised at the same point it always has been.
+
+        :returns: Tuple of (steps, name of the first non-snake cased field or None)
+        """
+        steps: list[FieldMetadata] = []
+
+        for attribute_name, field_meta in self.fields.items():
+            if field_meta.ignore:
+                continue
+
+            if (
+                self.auto_snake
+                and not field_meta.is_classvar
+                and attribute_name.lower() != attribute_name
+            ):
+                return tuple(steps), attribute_name
+
+            steps.append(field_meta)
+
+        return tuple(steps), None
+
+
+# The number of different sets of keys to cache plans for on each class
+MAX_SHAPES_PER_CLASS = 32
+
+
+class ShapePlan:
+    """Which key each field is read from, for data with a particular set of keys."""
+
+    __slots__ = ("keys", "unhandled")
+
+    keys: tuple[Any, ...]
+    unhandled: tuple[int, ...]
+
+    def __init__(self, metadata: ClassMetadata, shape: tuple[Any, ...]) -> None:
+        """Create a new plan.
+
+        :param metadata: The metadata of the class being deserialized
+        :param shape: The keys of the data, in order
+        """
+
+        keys: list[Any] = [None] * len(metadata.steps)
+
+        for data_key in shape:
+            for position in metadata.key_index.get(data_key, ()):
+                current_key = keys[position]
+                field_keys = metadata.steps[position].keys
+
+                # If more than one spelling of a key is present, the first of
+                # the field's keys wins and the rest are unhandled
+                if current_key is None or field_keys.index(data_key) < field_keys.index(
+                    current_key
+                ):
+                    keys[position] = data_key
+
+        handled = set(keys)
+        handled.discard(None)
+
+        # The key to read each step from, or None if it isn't in the data
+        self.keys = tuple(keys)
+
+        # The positions in the data of keys which no field reads
+        self.unhandled = tuple(
+            position for position, data_key in enumerate(shape) if data_key not in handled
+        )
+
+
+class DowncastTarget:
+    """A class which data can be downcast to."""
+
+    __slots__ = ("class_reference", "nested", "_metadata")
+
+    class_reference: Any
+    nested: bool
+    _metadata: ClassMetadata | None
+
+    def __init__(self, class_reference: Any, nested: bool) -> None:
+        """Create a new target.
+
+        :param class_reference: The class to downcast to
+        :param nested: Whether the class has its own downcast field, so the
+            data needs to be downcast again
+        """
+        self.class_reference = class_reference
+        self.nested = nested
+        self._metadata = None
+
+    def metadata(self) -> ClassMetadata:
+        """Get the metadata for the class, which is only looked up when first needed."""
+        if self._metadata is None or self._metadata.generation != _class_generation(
+            self.class_reference
+        ):
+            self._metadata = get_class_metadata(self.class_reference)
+        return self._metadata
+
+
+def _add_downcast_targets(
+    table: dict[Any, DowncastTarget],
+    class_reference: Any,
+    downcast_field_name: str | None,
+    visited: set[Any],
+) -> None:
+    """Add the downcast targets registered against a class to a table.
+
+    Subclasses which use the same downcast field have their targets added
+    too, so that the whole hierarchy takes a single lookup. Identifiers which
+    are already in the table are left alone.
+    """
+
+    if class_reference in visited:
+        return
+
+    visited.add(class_reference)
+
+    own_map = _get_own_downcast_map(class_reference)
+
+    for identifier, subclass in own_map.items():
+        if identifier not in table:
+            nested = (
+                _get_downcast_field(subclass) != downcast_field_name
+                and _get_downcast_field(subclass) is not None
+            )
+            table[identifier] = DowncastTarget(subclass, nested)
+
+    for subclass in own_map.values():
+        if subclass is not class_reference and _get_downcast_field(subclass) == downcast_field_name:
+            _add_downcast_targets(table, subclass, downcast_field_name, visited)
+
+
+# Where to load and store metadata across processes, if anywhere
+_persistent_cache: PersistentCache | None = None
+
+
+def enable_persistent_cache(directory: str | os.PathLike[str]) -> None:
+    """Load class metadata from, and store it to, a directory.
+
+    This saves rebuilding the metadata for every class in every new process,
+    such as on serverless cold starts. Metadata is stored the first time each
+    class is used, and is rebuilt automatically if the class changes. The
+    directory can be populated ahead of time, e.g. as part of a build, by
+    calling `prewarm` with this enabled.
+
+    Since the files are unpickled, the directory must only be writable by
+    trusted users.
+
+    :param directory: The directory to use, which is created if needed
+    """
+    global _persistent_cache  # pylint: disable=global-statement
+    _persistent_cache = PersistentCache(directory)
+
+
+def disable_persistent_cache() -> None:
+    """Stop loading and storing class metadata on disk."""
+    global _persistent_cache  # pylint: disable=global-statement
+    _persistent_cache = None
+
+
+def _build_class_metadata(class_reference: Any) -> ClassMetadata:
+    """Build the metadata for a class, or load it from the persistent cache."""
+
+    persistent_cache = _persistent_cache
+
+    if persistent_cache is None:
+        return ClassMetadata(class_reference)
+
+    generation = _class_generation(class_reference)
+    metadata = persistent_cache.load(class_reference)
+
+    if metadata is None:
+        metadata = ClassMetadata(class_reference)
+        persistent_cache.store(class_reference, metadata)
+    else:
+        # The stored metadata matches the class's configuration, but the
+        # generation it was stored with is from another process
+        metadata.generation = generation
+
+    return cast(ClassMetadata, metadata)
+
+
+# Locks for the classes whose metadata is being built, so that each class is
+# only built once, however many threads need it at the same time
+_BUILD_LOCKS: dict[Any, threading.RLock] = {}
+_BUILD_LOCKS_GUARD = threading.Lock()
+
 
 def get_class_metadata(class_reference: Any) -> ClassMetadata:
     """Get or create cached metadata for a class.
 
+    Metadata is stored on the class itself where possible. Specializations of
+    generic classes, such as `Page[User]`, are kept in a cache of their own,
+    so that each is only resolved once however many equal aliases there are.
+    Other types which can't hold it, such as `list[int]`, are kept in a
+    registry instead. Neither stops the types from being garbage collected.
+
+    This is safe to call from multiple threads. Reading cached metadata takes
+    no locks. If several threads need metadata which isn't cached yet, one of
+    them builds it while the others wait for it.
+
     :param class_reference: The class to get metadata for
     :returns: Cached ClassMetadata instance
     """
-    cache_attr = "__deserialize_cache__"
 
-    # Check if already cached (must be in class's own __dict__, not inherited)
-    if hasattr(class_reference, "__dict__") and cache_attr in class_reference.__dict__:
-        return class_reference.__dict__[cache_attr]
+    # Check if already cached (must be in class's own __dict__, not inherited),
+    # and that no decorator has changed the class since
+    class_dict = getattr(class_reference, "__dict__", None)
+    if class_dict is not None:
+        metadata = class_dict.get(_CACHE_ATTRIBUTE)
+        if metadata is not None and metadata.generation == class_dict.get(_GENERATION_ATTRIBUTE, 0):
+            return metadata
+
+    metadata = _specialized_metadata(class_reference) or _registered_metadata(class_reference)
+    if metadata is not None:
+        return metadata
+
+    try:
+        with _BUILD_LOCKS_GUARD:
+            lock = _BUILD_LOCKS.setdefault(class_reference, threading.RLock())
+    except TypeError:
+        # Unhashable types can't be locked on, but can't be cached either
+        return ClassMetadata(class_reference)
+
+    with lock:
+        try:
+            # Another thread may have built it while this one was waiting
+            if class_dict is not None:
+                metadata = class_dict.get(_CACHE_ATTRIBUTE)
+                if metadata is not None and metadata.generation == _class_generation(
+                    class_reference
+                ):
+                    return metadata
+
+            metadata = _specialized_metadata(class_reference) or _registered_metadata(
+                class_reference
+            )
+            if metadata is not None:
+                return metadata
+
+            metadata = _build_class_metadata(class_reference)
+            _store_metadata(class_reference, metadata)
+        finally:
+            with _BUILD_LOCKS_GUARD:
+                _BUILD_LOCKS.pop(class_reference, None)
+
+    return metadata
+
+
+# The attribute metadata is stored in on classes which allow it
+_CACHE_ATTRIBUTE = "__deserialize_cache__"
+
+# The classes with metadata stored on them, so that they can be counted
+_ATTRIBUTE_CACHED: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+# The metadata for types which can't have attributes set on them, such as
+# `list[int]`. Entries are removed when their type is garbage collected.
+_WEAK_REGISTRY: "weakref.WeakKeyDictionary[Any, ClassMetadata]" = weakref.WeakKeyDictionary()
+
+# The metadata for specializations of generic classes, such as `Page[User]`,
+# keyed by the specialization. Equal specializations aren't always the same
+# object, but share an entry.
+_SPECIALIZATIONS: "weakref.WeakKeyDictionary[Any, ClassMetadata]" = weakref.WeakKeyDictionary()
+
+# The attribute each specialization object also keeps its metadata in, so that
+# it can be found without hashing the specialization. It is separate from
+# `_CACHE_ATTRIBUTE` since it follows the generation of the generic class.
+_SPECIALIZATION_ATTRIBUTE = "__deserialize_specialization__"
+
+
+def _specialized_metadata(class_reference: Any) -> ClassMetadata | None:
+    """Get the metadata for a specialization of a generic class, if it is cached."""
+
+    metadata = getattr(class_reference, "__dict__", {}).get(_SPECIALIZATION_ATTRIBUTE)
+
+    if metadata is None:
+        try:
+            metadata = _SPECIALIZATIONS.get(class_reference)
+        except TypeError:
+            # Types which can't be weakly referenced, or are unhashable
+            return None
+
+        if metadata is None:
+            return None
+
+        # Equal specializations can be different objects
+        _remember_specialization(class_reference, metadata)
+
+    if metadata.generation != _class_generation(metadata.origin):
+        return None
+
+    return metadata
+
+
+def _remember_specialization(class_reference: Any, metadata: ClassMetadata | None) -> None:
+    """Keep the metadata for a specialization on the specialization object itself.
+
+    :param class_reference: The specialization
+    :param metadata: The metadata, or None to forget it
+    """
+
+    try:
+        if metadata is None:
+            class_reference.__dict__.pop(_SPECIALIZATION_ATTRIBUTE, None)
+        else:
+            class_reference.__dict__[_SPECIALIZATION_ATTRIBUTE] = metadata
+    except (AttributeError, TypeError):
+        # Some aliases, such as `types.GenericAlias`, pass attribute lookups
+        # through to the generic class, so are only in the keyed cache
+        pass
+
 
-    # Create and cache metadata
-    metadata = ClassMetadata(class_reference)
+def _registered_metadata(class_reference: Any) -> ClassMetadata | None:
+    """Get the metadata for a type from the registry, if it is there."""
+
+    try:
+        metadata = _WEAK_REGISTRY.get(class_reference)
+    except TypeError:
+        # Types which can't be weakly referenced, or are unhashable
+        return None
+
+    if metadata is None or metadata.generation != _class_generation(class_reference):
+        return None
+
+    return metadata
+
+
+def _store_metadata(class_reference: Any, metadata: ClassMetadata) -> None:
+    """Cache the metadata for a type, wherever it can be kept."""
+
+    if metadata.origin is not None:
+        _SPECIALIZATIONS[class_reference] = metadata
+        _remember_specialization(class_reference, metadata)
+        return
 
-    # Only cache on classes that support attribute setting
-    # Skip built-in immutable types
     try:
         if hasattr(class_reference, "__dict__"):
-            setattr(class_reference, cache_attr, metadata)
+            setattr(class_reference, _CACHE_ATTRIBUTE, metadata)
     except (TypeError, AttributeError):
-        # Can't cache on this type (e.g., built-in types like int, str)
+        # Can't cache on this type (e.g., built-in types like int, str, or
+        # generic aliases like list[int])
+        pass
+
+    # Some types accept the attribute, but store it somewhere else
+    if hasattr(class_reference, "__dict__") and _CACHE_ATTRIBUTE in class_reference.__dict__:
+        _ATTRIBUTE_CACHED.add(class_reference)
+        return
+
+    try:
+        _WEAK_REGISTRY[class_reference] = metadata
+    except TypeError:
+        # Types which can't be weakly referenced, or are unhashable, are built
+        # every time
         pass
 
-    return metadata
+
+def metadata_cache_info() -> dict[str, int]:
+    """Get the number of types with cached metadata.
+
+    Both kinds of entry are removed when their type is garbage collected.
+
+    :returns: A dictionary of:
+        `attributes`: The number of classes with their metadata stored on them
+        `specializations`: The number of specializations of generic classes,
+            such as `Page[User]`
+        `registry`: The number of other types, such as `list[int]`, with
+            their metadata in the registry
+    """
+
+    return {
+        "attributes": len(_ATTRIBUTE_CACHED),
+        "specializations": len(_SPECIALIZATIONS),
+        "registry": len(_WEAK_REGISTRY),
+    }
 
 
 def clear_class_cache(class_reference: Any) -> None:
     """Clear cached metadata for a class.
 
-    This is useful if decorators are modified at runtime (not recommended).
+    This is rarely needed, since applying a decorator to a class at runtime
+    rebuilds its metadata automatically.
 
     :param class_reference: The class to clear cache for
     """
-    cache_attr = "__deserialize_cache__"
-    if hasattr(class_reference, cache_attr):
-        delattr(class_reference, cache_attr)
+    if hasattr(class_reference, "__dict__") and _CACHE_ATTRIBUTE in class_reference.__dict__:
+        delattr(class_reference, _CACHE_ATTRIBUTE)
+        _ATTRIBUTE_CACHED.discard(class_reference)
+
+    if specialized_origin(class_reference) is not None:
+        _remember_specialization(class_reference, None)
+
+    try:
+        _WEAK_REGISTRY.pop(class_reference, None)
+        _SPECIALIZATIONS.pop(class_reference, None)
+    except TypeError:
+        pass
+
+    # Downcast tables hold on to the metadata of the classes they point to
+    _invalidate_downcasts()
@@ -0,0 +1,261 @@
+"""Persist class metadata to disk so that it doesn't need to be rebuilt on startup."""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from typing import Annotated, Any, cast, get_args, get_origin
+
+from deserialize.field import Field
+
+# Bump this whenever the layout of the metadata changes, so that files
+# written by older versions are ignored
+_FORMAT_VERSION = 2
+
+
+class PersistentCache:
+    """A directory of pickled class metadata.
+
+    Each class is stored in its own file, named after the class and a
+    fingerprint of everything its metadata is built from: the annotations and
+    deserialize decorators of it and its bases, and the size and modification
+    time of the files they are defined in. If any of those change the
+    fingerprint changes, so the old file is simply never read again.
+
+    Only classes which can be imported by name, and whose metadata can be
+    pickled, are stored. Anything else is built as normal every time.
+
+    Since the files are unpickled, the directory must only be writable by
+    trusted users.
+    """
+
+    __slots__ = ("directory",)
+
+    directory: str
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+
+    def load(self, class_reference: Any) -> Any | None:
+        """Load the metadata for a class.
+
+        :param class_reference: The class to load the metadata for
+        :returns: The metadata, or None if it isn't stored or is out of date
+        """
+
+        path = self._path(class_reference)
+
+        if path is None:
+            return None
+
+        try:
+            with open(path, "rb") as cache_file:
+                metadata = pickle.load(cache_file)
+        # Anything can go wrong unpickling a stale file, and the fallback is
+        # always to build the metadata again
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            return None
+
+        if getattr(metadata, "class_reference", None) is not class_reference:
+            return None
+
+        return metadata
+
+    def store(self, class_reference: Any, metadata: Any) -> None:
+        """Store the metadata for a class, if possible.
+
+        :param class_reference: The class the metadata is for
+        :param metadata: The metadata to store
+        """
+
+        path = self._path(class_reference)
+
+        if path is None:
+            return
+
+        try:
+            contents = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+        # Parsers, defaults, etc. may be arbitrary objects which can't be pickled
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # Write to a temporary file first so that readers never see a
+            # partially written file
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                cache_file.write(contents)
+            os.replace(temporary_path, path)
+        except OSError:
+            # e.g. a read only file system
+            pass
+
+    def _path(self, class_reference: Any) -> str | None:
+        """Get the path of the file for a class, or None if it can't be stored."""
+
+        module_name = getattr(class_reference, "__module__", None)
+        qualified_name = getattr(class_reference, "__qualname__", None)
+
+        if (
+            not isinstance(class_reference, type)
+            or not module_name
+            or module_name == "builtins"
+            or not qualified_name
+            or "<locals>" in qualified_name
+        ):
+            return None
+
+        class_fingerprint = fingerprint(class_reference)
+        source_stamp = _source_stamp(class_reference)
+
+        if class_fingerprint is None or source_stamp is None:
+            return None
+
+        key = hashlib.sha256(f"{class_fingerprint}\n{source_stamp}".encode("utf-8")).hexdigest()
+
+        return os.path.join(self.directory, f"{module_name}.{qualified_name}-{key[:32]}.pickle")
+
+
+def fingerprint(class_reference: type) -> str | None:
+    """Get a fingerprint of everything on a class which its metadata is built from.
+
+    Only the classes themselves are looked at, so that this is cheap enough
+    to check every time the metadata is loaded. The annotations are used as
+    they are written rather than the types they resolve to, since resolving
+    them is most of the work the caches save.
+
+    :param class_reference: The class to fingerprint
+    :returns: A hex digest which changes if the class's annotations or
+        decorators do, or None if the class includes values which can't be
+        fingerprinted
+    """
+
+    parts = [f"format={_FORMAT_VERSION}", f"python={sys.version_info[:2]}"]
+
+    for base_class in class_reference.__mro__:
+        if base_class is object:
+            continue
+
+        class_vars = base_class.__dict__
+        annotations = cast(dict[str, Any], class_vars.get("__annotations__", {}))
+
+        parts.append(f"class={base_class.__module__}.{base_class.__qualname__}")
+        # The order of the annotations is the order of the fields
+        for name, annotation in annotations.items():
+            parts.append(f"annotation {name}={_annotation_repr(annotation)}")
+
+        for name in sorted(class_vars):
+            # The bases of a class decide the types filled in for type
+            # variables in the annotations of generic bases
+            if name == "__orig_bases__" or (
+                name.startswith("__deserialize_")
+                and name
+                not in (
+                    "__deserialize_cache__",
+                    "__deserialize_generation__",
+                    "__deserialize_handler__",
+                )
+            ):
+                parts.append(f"{name}={_stable_repr(class_vars[name])}")
+
+    description = "\n".join(parts)
+
+    # Objects without a repr of their own are different in every process
+    if " at 0x" in description:
+        return None
+
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()[:32]
+
+
+def _annotation_repr(annotation: Any) -> str:
+    """Get a representation of an annotation which is the same in every process.
+
+    Most annotations are classes, or aliases of them, whose repr is already
+    stable, so the slower walk is only needed for those with objects in them,
+    such as `Field` options.
+    """
+
+    text = repr(annotation)
+
+    if " at 0x" in text:
+        return _stable_repr(annotation)
+
+    return text
+
+
+def _source_stamp(class_reference: type) -> str | None:
+    """Get the size and modification time of the files a class and its bases are defined in.
+
+    String annotations are resolved against the module a class is defined in,
+    so a change to a name they refer to, such as a type alias, changes the
+    module's file even though the annotations stay the same.
+    """
+
+    stamps: list[str] = []
+
+    for module_name in dict.fromkeys(base.__module__ for base in class_reference.__mro__):
+        if module_name == "builtins":
+            continue
+
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+
+        if not path:
+            return None
+
+        try:
+            status = os.stat(path)
+        except OSError:
+            return None
+
+        stamps.append(f"{path}:{status.st_mtime_ns}:{status.st_size}")
+
+    return "\n".join(stamps)
+
+
+# pylint: disable-next=too-many-return-statements
+def _stable_repr(value: Any) -> str:
+    """Get a representation of a value which is the same in every process.
+
+    Functions and classes are represented by name rather than by their
+    default repr, which includes their address.
+    """
+
+    if isinstance(value, dict):
+        mapping = cast(dict[Any, Any], value)
+        items = sorted(
+            f"{_stable_repr(key)}: {_stable_repr(item)}" for key, item in mapping.items()
+        )
+        return "{" + ", ".join(items) + "}"
+
+    if isinstance(value, (list, tuple)):
+        sequence = cast(list[Any] | tuple[Any, ...], value)
+        return f"{type(sequence).__name__}[{', '.join(_stable_repr(item) for item in sequence)}]"
+
+    if isinstance(value, (set, frozenset)):
+        members = cast(set[Any] | frozenset[Any], value)
+        items = sorted(_stable_repr(item) for item in members)
+        return f"{type(members).__name__}[{', '.join(items)}]"
+
+    if inspect.isclass(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    # Field options in Annotated hints hold parsers and defaults too
+    if get_origin(value) is Annotated:
+        return f"Annotated[{', '.join(_stable_repr(item) for item in get_args(value))}]"
+
+    if isinstance(value, Field):
+        # Fields without a default hold a placeholder object instead
+        options = ", ".join(
+            f"{name}={_stable_repr(getattr(value, name))}"
+            for name in Field.__slots__
+            if name != "default" or value.has_default()
+        )
+        return f"Field({options})"
+
+    return repr(value)
@@ -0,0 +1,181 @@
+"""Build class metadata when classes are defined, rather than when first used."""
+
+import inspect
+import sys
+import threading
+from typing import Callable, TypeVar
+
+from deserialize.custom_deserializable import CustomDeserializable
+from deserialize.exceptions import DeserializeException
+from deserialize.metadata_cache import get_class_metadata
+
+T = TypeVar("T")
+
+# Classes waiting to be precompiled because they refer to names which weren't
+# defined yet, keyed by their module and then by the name they are waiting
+# for. They are tried again once the name has been defined, which is checked
+# whenever another class in the same module is precompiled.
+_PENDING: dict[str, dict[str | None, list[type]]] = {}
+
+# Classes waiting for `precompile_ready()`
+_DEFERRED: list[type] = []
+
+_PENDING_LOCK = threading.Lock()
+
+
+def precompile(*, defer: bool = False) -> Callable[[type[T]], type[T]]:
+    """A decorator for building the metadata of a class when it is defined.
+
+    Normally this is done the first time the class is deserialized. Doing it
+    up front moves the cost to import time, and raises any configuration
+    errors (such as fields which aren't snake cased when using auto_snake)
+    straight away rather than on the first payload.
+
+    This must be the outermost decorator, so that every other decorator has
+    been applied by the time it runs.
+
+    If the type hints refer to classes which aren't defined yet, the class is
+    precompiled once they are and another class in the same module is
+    precompiled, or at the latest when `precompile_ready()` is called. Until
+    then it is built as normal if it is deserialized.
+
+    :param defer: Wait until `precompile_ready()` is called, e.g. once all
+        of the classes have been imported
+    """
+
+    def precompile_class(class_reference: type[T]) -> type[T]:
+        """Build the metadata for the class."""
+
+        if defer:
+            with _PENDING_LOCK:
+                _DEFERRED.append(class_reference)
+            return class_reference
+
+        _build_all(_resolved_classes(class_reference.__module__), strict=False)
+        _build_all([class_reference], strict=False)
+
+        return class_reference
+
+    return precompile_class
+
+
+def precompile_ready() -> int:
+    """Precompile every class which is still waiting to be.
+
+    Call this once all of the classes have been defined, such as at the end of
+    startup.
+
+    :raises DeserializeException: If a class can't be deserialized, including
+        if its type hints still refer to classes which don't exist
+
+    :returns: The number of classes which were precompiled
+    """
+
+    with _PENDING_LOCK:
+        waiting = [
+            class_reference
+            for names in _PENDING.values()
+            for classes in names.values()
+            for class_reference in classes
+        ]
+        waiting.extend(_DEFERRED)
+        _PENDING.clear()
+        _DEFERRED.clear()
+
+    return _build_all(waiting, strict=True)
+
+
+def _build_all(classes: list[type], *, strict: bool) -> int:
+    """Precompile classes, leaving those which refer to undefined names to wait.
+
+    :param classes: The classes to precompile
+    :param strict: Raise if a class refers to names which aren't defined,
+        rather than leaving it to wait
+
+    :returns: The number of classes which were precompiled
+    """
+
+    remaining = list(classes)
+    built = 0
+
+    try:
+        while remaining:
+            class_reference = remaining.pop(0)
+
+            try:
+                _build(class_reference)
+            except NameError as ex:
+                if strict:
+                    raise DeserializeException(
+                        f"Could not resolve the type hints of {class_reference}: {ex}"
+                    ) from ex
+
+                _wait_for(class_reference, ex.name)
+                continue
+
+            built += 1
+    finally:
+        # If a class can't be built, the ones after it are left for `precompile_ready()`
+        for class_reference in remaining:
+            _wait_for(class_reference, None)
+
+    return built
+
+
+def _wait_for(class_reference: type, name: str | None) -> None:
+    """Wait to precompile a class until a name it refers to is defined.
+
+    :param class_reference: The class to wait to precompile
+    :param name: The name which wasn't defined, or None to wait for
+        `precompile_ready()`
+    """
+
+    with _PENDING_LOCK:
+        waiting = _PENDING.setdefault(class_reference.__module__, {})
+        waiting.setdefault(name, []).append(class_reference)
+
+
+def _resolved_classes(module_name: str) -> list[type]:
+    """Stop waiting for the classes in a module whose missing names are now defined.
+
+    :param module_name: The module to check
+    :returns: The classes which can be tried again
+    """
+
+    module = sys.modules.get(module_name)
+
+    with _PENDING_LOCK:
+        waiting = _PENDING.get(module_name)
+
+        if module is None or not waiting:
+            return []
+
+        module_globals = vars(module)
+        defined = [name for name in waiting if name is not None and name in module_globals]
+
+        return [class_reference for name in defined for class_reference in waiting.pop(name)]
+
+
+def _build(class_reference: type) -> None:
+    """Build and check the metadata for a class.
+
+    :raises NameError: If the type hints refer to classes which aren't defined yet
+    :raises DeserializeException: If the class can't be deserialized
+    """
+
+    if inspect.isclass(class_reference) and issubclass(class_reference, CustomDeserializable):
+        return
+
+    metadata = get_class_metadata(class_reference)
+
+    if len(metadata.hints) == 0:
+        raise DeserializeException(f"Could not precompile {class_reference}, it has no type hints")
+
+    if metadata.snake_case_violation is not None:
+        raise DeserializeException(
+            f"When using auto_snake, all properties must be snake cased. Error on: {class_reference.__qualname__}.{metadata.snake_case_violation}"
+        )
+
+    for field_meta in metadata.steps:
+        if field_meta.discriminator is not None:
+            field_meta.discriminated_members()
@@ -0,0 +1,173 @@
+"""Opt-in timing instrumentation for deserialization."""
+
+import contextlib
+import contextvars
+import time
+from types import TracebackType
+from typing import Any, Callable, Generator
+
+_ACTIVE_PROFILER: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar(
+    "deserialize_active_profiler", default=None
+)
+
+
+def active_profiler() -> "Profiler | None":
+    """Get the profiler which is currently recording, if any."""
+    return _ACTIVE_PROFILER.get()
+
+
+class ProfileStats:
+    """The timings recorded for a single class, field, parser or callback."""
+
+    __slots__ = ("calls", "total_time", "failures")
+
+    calls: int
+    total_time: float
+    failures: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the stats as a dictionary."""
+        return {"calls": self.calls, "total_time": self.total_time, "failures": self.failures}
+
+
+class Profiler:
+    """Records call counts, cumulative times and failures while deserializing.
+
+    Everything deserialized inside the `with` block, in the same thread or
+    task, is recorded:
+
+        with deserialize.Profiler() as profiler:
+            deserialize.deserialize(MyClass, data)
+
+        print(profiler.as_dict())
+
+    Times are cumulative, so the time for a class includes the time for all of
+    its fields, and the time for a field includes its parser and any classes
+    nested inside it. A profiler should only be used by one thread at a time.
+    """
+
+    classes: dict[str, ProfileStats]
+    fields: dict[str, ProfileStats]
+    parsers: dict[str, ProfileStats]
+    constructed: dict[str, ProfileStats]
+
+    _stack: list[str]
+    _stack_times: dict[tuple[str, ...], float]
+    _tokens: list[contextvars.Token["Profiler | None"]]
+
+    def __init__(self) -> None:
+        self.classes = {}
+        self.fields = {}
+        self.parsers = {}
+        self.constructed = {}
+        self._stack = []
+        self._stack_times = {}
+        self._tokens = []
+
+    def __enter__(self) -> "Profiler":
+        self._tokens.append(_ACTIVE_PROFILER.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _ACTIVE_PROFILER.reset(self._tokens.pop())
+
+    @contextlib.contextmanager
+    def record(self, stats: dict[str, ProfileStats], name: str) -> Generator[None, None, None]:
+        """Record the time taken by the body of the `with` block.
+
+        :param stats: The group of stats to record into
+        :param name: The name of the entry in the group
+        """
+
+        entry = stats.get(name)
+        if entry is None:
+            entry = ProfileStats()
+            stats[name] = entry
+
+        self._stack.append(self._frame_name(stats, name))
+        start = time.perf_counter()
+
+        try:
+            yield
+        except BaseException:
+            entry.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            entry.calls += 1
+            entry.total_time += elapsed
+            path = tuple(self._stack)
+            self._stack_times[path] = self._stack_times.get(path, 0.0) + elapsed
+            self._stack.pop()
+
+    def _frame_name(self, stats: dict[str, ProfileStats], name: str) -> str:
+        """Get the name of an entry in the collapsed stacks.
+
+        Parsers and callbacks are named after the field or class they belong
+        to, so they are prefixed to tell them apart from it.
+        """
+
+        if stats is self.parsers:
+            return f"parser:{name}"
+
+        if stats is self.constructed:
+            return f"constructed:{name}"
+
+        return name
+
+    def call(
+        self, stats: dict[str, ProfileStats], name: str, function: Callable[[Any], Any], value: Any
+    ) -> Any:
+        """Call a single argument function, recording the time it takes."""
+        with self.record(stats, name):
+            return function(value)
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Export the recorded stats as a dictionary.
+
+        :returns: A dictionary with `classes`, `fields`, `parsers` and
+            `constructed` groups, each mapping a name to its calls, total_time
+            (in seconds) and failures.
+        """
+
+        return {
+            group_name: {name: entry.as_dict() for name, entry in group.items()}
+            for group_name, group in (
+                ("classes", self.classes),
+                ("fields", self.fields),
+                ("parsers", self.parsers),
+                ("constructed", self.constructed),
+            )
+        }
+
+    def collapsed_stacks(self) -> str:
+        """Export the recorded times in the collapsed stack format used by flame graphs.
+
+        Each line is a `;` separated stack followed by the time spent in the
+        innermost frame itself, in microseconds. Parsers and `@constructed`
+        callbacks are named `parser:Class.field` and `constructed:Class`. This
+        can be passed directly to tools such as `flamegraph.pl` or speedscope.
+
+        :returns: The collapsed stacks, one per line
+        """
+
+        self_times = dict(self._stack_times)
+
+        for path, elapsed in self._stack_times.items():
+            if len(path) > 1:
+                self_times[path[:-1]] -= elapsed
+
+        return "\n".join(
+            f"{';'.join(path)} {max(0, round(elapsed * 1_000_000))}"
+            for path, elapsed in sorted(self_times.items())
+        )
@@ -0,0 +1,225 @@
+"""Incremental reading of JSON values from files and sockets."""
+
+import codecs
+import json
+from typing import Any, Iterator, Literal, Protocol, get_args
+
+# How much to read from the source at a time by default
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# How the values in a source are laid out: "lines" for whitespace separated
+# values such as JSON Lines, "array" for the elements of a single top level
+# array, or "auto" to pick "array" if the source starts with `[`
+StreamFormat = Literal["auto", "lines", "array"]
+
+# The characters which can continue a number, e.g. "1" can become "1.5e-3"
+_NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+# The words which are values on their own
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+class Readable(Protocol):
+    """Anything with a `read` method, such as a file or `socket.makefile()`."""
+
+    def read(self, size: int, /) -> str | bytes:
+        """Read up to `size` characters or bytes, returning an empty value at the end."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+
+class _JSONReader:
+    """Reads whitespace separated JSON values, or the elements of a top level array.
+
+    Only as much of the source as is needed for the next value is held in
+    memory, so arbitrarily large sources can be read.
+    """
+
+    __slots__ = (
+        "source",
+        "chunk_size",
+        "format",
+        "decoder",
+        "text_decoder",
+        "buffer",
+        "position",
+        "eof",
+    )
+
+    source: Readable
+    chunk_size: int
+    # pylint: disable-next=redefined-builtin
+    format: StreamFormat
+    decoder: json.JSONDecoder
+    text_decoder: codecs.IncrementalDecoder | None
+    buffer: str
+    position: int
+    eof: bool
+
+    # pylint: disable-next=redefined-builtin
+    def __init__(self, source: Readable, chunk_size: int, format: StreamFormat) -> None:
+        self.source = source
+        self.chunk_size = chunk_size
+        self.format = format
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = None
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read_more(self, size: int) -> None:
+        """Read more data from the source into the buffer."""
+
+        chunk = self.source.read(size)
+
+        if isinstance(chunk, bytes):
+            if self.text_decoder is None:
+                self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+            text = self.text_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+
+        if not chunk:
+            self.eof = True
+
+        # Drop everything which has already been consumed
+        self.buffer = self.buffer[self.position :] + text
+        self.position = 0
+
+    def _next_character(self) -> str | None:
+        """Skip whitespace and return the next character without consuming it.
+
+        :returns: The next character, or None at the end of the source
+        """
+
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if self.eof:
+                return None
+
+            self._read_more(self.chunk_size)
+
+    def _expect(self, character: str) -> None:
+        """Consume the next character, which must be the one given."""
+
+        next_character = self._next_character()
+        if next_character != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self.buffer, self.position)
+        self.position += 1
+
+    def _decode_value(self) -> Any:
+        """Decode the next value, reading more data until it is complete."""
+
+        read_size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as ex:
+                # Only read more if it could fix the error, so that invalid
+                # data fails where it is rather than at the end of the source
+                if self.eof or not self._may_be_truncated(ex):
+                    raise
+            else:
+                # A value which runs to the end of the buffer might not be
+                # complete (e.g. a number which continues in the next chunk)
+                if self.eof or not (
+                    end == len(self.buffer)
+                    or (isinstance(value, (int, float)) and _is_number_part(self.buffer[end:]))
+                ):
+                    self.position = end
+                    return value
+
+            # Grow the reads so that large values aren't decoded repeatedly
+            self._read_more(read_size)
+            read_size = max(read_size, len(self.buffer))
+
+    def _may_be_truncated(self, error: json.JSONDecodeError) -> bool:
+        """Check whether a decode error could be caused by the buffer ending too soon.
+
+        The decoder reports the position of the character it couldn't parse,
+        so the error can only be fixed by more data if everything from there to
+        the end of the buffer could be the start of something valid.
+        """
+
+        rest = self.buffer[error.pos :]
+
+        if error.msg.startswith("Unterminated string"):
+            return True
+
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            return len(rest) <= len("uXXXX")
+
+        return _is_number_part(rest) or any(literal.startswith(rest) for literal in _LITERALS)
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over the values in the source."""
+
+        if self.format == "array" or (self.format == "auto" and self._next_character() == "["):
+            self._expect("[")
+            yield from self._array_values()
+            if self._next_character() is not None:
+                raise json.JSONDecodeError("Extra data", self.buffer, self.position)
+            return
+
+        while self._next_character() is not None:
+            yield self._decode_value()
+
+    def _array_values(self) -> Iterator[Any]:
+        """Iterate over the elements of a top level array."""
+
+        if self._next_character() == "]":
+            self.position += 1
+            return
+
+        while True:
+            self._next_character()
+            yield self._decode_value()
+
+            if self._next_character() == ",":
+                self.position += 1
+                continue
+
+            self._expect("]")
+            return
+
+
+def _is_number_part(text: str) -> bool:
+    """Check whether the text could be part of a number."""
+    return all(character in _NUMBER_CHARACTERS for character in text)
+
+
+def iter_json_values(
+    source: Readable,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    # pylint: disable-next=redefined-builtin
+    format: StreamFormat = "auto",
+) -> Iterator[Any]:
+    """Incrementally decode JSON values from a file-like object.
+
+    With `format="lines"` the source is a sequence of values separated by
+    whitespace, which covers JSON Lines. With `format="array"` it is a single
+    top level JSON array, and each element of the array is returned in turn.
+    By default the format is picked from the first character, so JSON Lines
+    whose values are arrays need `format="lines"`.
+
+    :param source: A text or binary file-like object. Binary data must be UTF-8.
+    :param chunk_size: The amount to read from the source at a time
+    :param format: How the values are laid out: "lines", "array" or "auto"
+
+    :raises ValueError: If the format isn't one of those
+    :raises json.JSONDecodeError: If the source isn't valid JSON
+
+    :returns: An iterator over the decoded values
+    """
+
+    if format not in get_args(StreamFormat):
+        raise ValueError(f"format must be 'auto', 'lines' or 'array', not {format!r}")
+
+    return _JSONReader(source, chunk_size, format).values()
@@ -1,5 +1,8 @@
 """Convenience checks for typing."""
 
+import enum
+import inspect
+import sys
 import typing
 import types
 from typing import Any
@@ -26,12 +29,17 @@ def is_union(type_value: Any) -> bool:
 
 def union_types(type_value: Any, debug_name: str) -> set[Any]:
     """Return the list of types in a Union."""
+    return set(union_members(type_value, debug_name))
+
+
+def union_members(type_value: Any, debug_name: str) -> tuple[Any, ...]:
+    """Return the types in a Union, in the order they were declared."""
     if not is_union(type_value):
         raise deserialize.exceptions.DeserializeException(
             f"Cannot extract union types from non-union type: {type_value} for {debug_name}"
         )
 
-    return set(typing.get_args(type_value))
+    return typing.get_args(type_value)
 
 
 def is_classvar(type_value: Any) -> bool:
@@ -166,3 +174,34 @@ def tuple_content_types(type_value: Any, debug_name: str) -> tuple[Any, ...]:
         raise TypeError(f"{type_value} is not a tuple type for {debug_name}")
 
     return typing.get_args(type_value)
+
+
+def is_importable(type_value: Any) -> bool:
+    """Check if a type only refers to classes which can be imported by name.
+
+    Such classes live as long as their modules, unlike classes created at
+    runtime (e.g. inside functions, or with `type()`), which can be garbage
+    collected.
+
+    e.g. list[User] -> True if `User` is defined at the top level of its module
+    """
+
+    if isinstance(type_value, enum.Enum):
+        # Literal values can be enum members
+        return is_importable(type(type_value))
+
+    if not inspect.isclass(type_value):
+        origin = typing.get_origin(type_value)
+        return (origin is None or is_importable(origin)) and all(
+            is_importable(argument) for argument in typing.get_args(type_value)
+        )
+
+    if type_value.__module__ == "builtins":
+        return True
+
+    value: Any = sys.modules.get(type_value.__module__)
+
+    for part in type_value.__qualname__.split("."):
+        value = getattr(value, part, None)
+
+    return value is type_value
@@ -4,9 +4,9 @@ pushd "${VIRTUAL_ENV}/.." > /dev/null
 
 source "${VIRTUAL_ENV}/bin/activate"
 
-python -m black --line-length 100 deserialize tests
+python -m black --line-length 100 deserialize tests benchmarks
 
-python -m pylint --rcfile=pylintrc deserialize tests
+python -m pylint --rcfile=pylintrc deserialize tests benchmarks
 
 python -m pyright deserialize tests
 
@@ -0,0 +1,125 @@
+"""Test deserializing without blocking the event loop."""
+
+import asyncio
+import concurrent.futures
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import deserialize_async, DeserializeException
+
+# pylint: enable=wrong-import-position
+
+
+class Item:
+    """A sample item."""
+
+    identifier: int
+    name: str
+
+
+ITEMS = [{"identifier": index, "name": str(index)} for index in range(100)]
+
+
+def test_same_result() -> None:
+    """Test that the result is the same as deserializing synchronously."""
+
+    results = asyncio.run(deserialize_async(list[Item], ITEMS, yield_every=7))
+    assert [result.identifier for result in results] == list(range(100))
+
+    result = asyncio.run(deserialize_async(Item, ITEMS[3]))
+    assert isinstance(result, Item)
+    assert result.name == "3"
+
+
+def test_yields_to_event_loop() -> None:
+    """Test that other tasks run while a large list is deserialized."""
+
+    ticks: list[int] = []
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def run() -> list[Item]:
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks.clear()
+        results = await deserialize_async(list[Item], ITEMS, yield_every=10)
+        task.cancel()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(results) == 100
+    assert len(ticks) >= 9
+
+
+def test_offload_to_executor() -> None:
+    """Test that payloads over the threshold are deserialized in the executor."""
+
+    async def run(executor: concurrent.futures.Executor) -> tuple[list[Item], Item]:
+        many = await deserialize_async(list[Item], ITEMS, executor=executor, offload_threshold=50)
+        single = await deserialize_async(Item, ITEMS[0], executor=executor, offload_threshold=50)
+        return many, single
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        many, single = asyncio.run(run(executor))
+
+    assert len(many) == 100
+    assert single.identifier == 0
+
+
+class Page:
+    """A page of items, wrapped in a dict."""
+
+    items: list[Item]
+
+
+def test_offload_wrapped_payload() -> None:
+    """Test that a large list wrapped in a dict is offloaded rather than blocking."""
+
+    page = {"items": [{"identifier": index, "name": str(index)} for index in range(20000)]}
+    ticks: list[int] = []
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def run(executor: concurrent.futures.Executor) -> Page:
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks.clear()
+        result = await deserialize_async(Page, page, executor=executor, offload_threshold=1000)
+        task.cancel()
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(run(executor))
+
+    assert len(result.items) == 20000
+    assert ticks
+
+
+def test_errors() -> None:
+    """Test that errors report the index in the full list."""
+
+    items = list(ITEMS)
+    items[55] = {"identifier": "bad", "name": "bad"}
+
+    with pytest.raises(DeserializeException) as exc_info:
+        asyncio.run(deserialize_async(list[Item], items, yield_every=10))
+
+    assert "list[55].identifier" in str(exc_info.value)
+
+
+def test_invalid_yield_every() -> None:
+    """Test that yield_every must be positive."""
+
+    with pytest.raises(ValueError, match="yield_every"):
+        asyncio.run(deserialize_async(list[Item], ITEMS, yield_every=0))
@@ -0,0 +1,103 @@
+"""Test deserializing batches of rows."""
+
+import os
+import sys
+from typing import Any, Iterator
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import (
+    deserialize_many,
+    deserialize_iter,
+    DeserializeException,
+    InvalidBaseTypeException,
+    RawStorageMode,
+    UnhandledFieldException,
+)
+
+# pylint: enable=wrong-import-position
+
+
+class Row:
+    """A sample row."""
+
+    identifier: int
+    name: str
+
+
+def test_deserialize_many() -> None:
+    """Test that all rows are deserialized in order."""
+
+    rows = [{"identifier": 1, "name": "one"}, {"identifier": 2, "name": "two"}]
+
+    results = deserialize_many(Row, rows)
+
+    assert isinstance(results, list)
+    assert [result.identifier for result in results] == [1, 2]
+    assert [result.name for result in results] == ["one", "two"]
+
+
+def test_deserialize_many_options() -> None:
+    """Test that the usual options apply to every row."""
+
+    rows = [{"identifier": 1, "name": "one"}]
+
+    results = deserialize_many(Row, rows, raw_storage_mode=RawStorageMode.ROOT)
+    assert results[0].__deserialize_raw__ == rows[0]  # type: ignore[attr-defined]
+
+    with pytest.raises(UnhandledFieldException):
+        _ = deserialize_many(
+            Row, [{"identifier": 1, "name": "one", "extra": True}], throw_on_unhandled=True
+        )
+
+
+def test_deserialize_many_raises() -> None:
+    """Test that failures raise by default, naming the failing row."""
+
+    rows = [{"identifier": 1, "name": "one"}, {"identifier": "2", "name": "two"}]
+
+    with pytest.raises(DeserializeException) as exc_info:
+        _ = deserialize_many(Row, rows)
+
+    assert "Row[1].identifier" in str(exc_info.value)
+
+
+def test_deserialize_many_collects_errors() -> None:
+    """Test that failures can be collected instead of raised."""
+
+    rows: list[Any] = [
+        {"identifier": 1, "name": "one"},
+        {"identifier": "2", "name": "two"},
+        "not a dict",
+        {"identifier": 4, "name": "four"},
+    ]
+    errors: list[tuple[int, DeserializeException]] = []
+
+    results = deserialize_many(Row, rows, errors=errors)
+
+    assert [result.identifier for result in results] == [1, 4]
+    assert [index for index, _ in errors] == [1, 2]
+    assert isinstance(errors[1][1], InvalidBaseTypeException)
+
+
+def test_deserialize_iter_is_lazy() -> None:
+    """Test that rows are only consumed as results are requested."""
+
+    consumed: list[int] = []
+
+    def generate_rows() -> Iterator[dict[str, Any]]:
+        for index in range(3):
+            consumed.append(index)
+            yield {"identifier": index, "name": str(index)}
+
+    results = deserialize_iter(Row, generate_rows())
+    assert not consumed
+
+    first = next(results)
+    assert first.identifier == 0
+    assert consumed == [0]
+
+    assert [result.identifier for result in results] == [1, 2]
+    assert consumed == [0, 1, 2]
@@ -0,0 +1,38 @@
+"""Test that the benchmark scenarios stay valid."""
+
+import os
+import sys
+from typing import Any, cast
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import deserialize
+from benchmarks.__main__ import measure
+from benchmarks.fixtures import SCENARIOS, Scenario
+
+# pylint: enable=wrong-import-position
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=[scenario.name for scenario in SCENARIOS])
+def test_scenario_deserializes(scenario: Scenario) -> None:
+    """Test that each scenario's data deserializes to its type."""
+
+    data = scenario.make_data()
+    result = deserialize(scenario.class_reference, data, **scenario.options)
+
+    if isinstance(data, list):
+        assert isinstance(result, list)
+        assert len(cast(list[Any], result)) == len(cast(list[Any], data)) == scenario.object_count
+    else:
+        assert isinstance(result, scenario.class_reference)
+
+
+def test_measure() -> None:
+    """Test that measuring a scenario reports positive timings."""
+
+    results = measure(SCENARIOS[0], min_time=0.01)
+
+    assert set(results) == {"ops_per_sec", "latency_us", "peak_memory_kib"}
+    assert all(value > 0 for value in results.values())
@@ -0,0 +1,335 @@
+"""Test generating deserializers ahead of time."""
+
+import importlib
+import itertools
+import os
+import pathlib
+import sys
+import textwrap
+import typing
+from typing import Any, Iterator, cast
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+from deserialize import compiled
+from deserialize.__main__ import main
+from deserialize.codegen import default_output_path, generate
+
+# pylint: enable=wrong-import-position
+
+MODELS = """
+import enum
+from typing import Annotated, Any, ClassVar, Literal, Optional
+
+import deserialize
+from deserialize import Field
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+def to_int(value):
+    return int(value)
+
+
+def maybe_int(value):
+    return None if value is None else int(value)
+
+
+@deserialize.default("nick", "n/a")
+@deserialize.parser("age", lambda value: int(value))
+@deserialize.allow_unhandled("extra")
+@deserialize.constructed(lambda instance: setattr(instance, "built", True))
+class Person:
+    name: str
+    age: int
+    nick: str
+    tags: list[str]
+    score: float | None
+    color: Color
+    anything: Any
+    kind: Literal["a", "b"]
+    count: Annotated[int, Field(alias="Count", parser=to_int, default=3)]
+    rating: Annotated[Optional[int], Field(parser=maybe_int)]
+    LIMIT: ClassVar[int] = 3
+
+
+@deserialize.auto_snake()
+class Team:
+    team_name: str
+    members: list[Person]
+    lead: Optional[Person]
+
+
+@deserialize.downcast_field("type")
+class Animal:
+    type: str
+
+
+@deserialize.downcast_identifier(Animal, "dog")
+class Dog(Animal):
+    name: str
+
+
+class Zoo:
+    animals: list[Animal]
+"""
+
+# Data for the models, covering both valid and invalid values
+PERSON = {
+    "name": "Ann",
+    "age": "30",
+    "tags": ["a"],
+    "score": 1.5,
+    "color": "red",
+    "anything": [1],
+    "kind": "a",
+}
+
+VARIATIONS: list[dict[str, Any]] = [
+    {},
+    {"nick": "Annie", "Count": "7"},
+    {"score": None},
+    {"score": 2},
+    {"name": 3},
+    {"kind": "c"},
+    {"color": "blue"},
+    {"tags": "a"},
+    {"extra": 1},
+    {"unknown": 1},
+    {"LIMIT": 4},
+    {"count": 4},
+    {"rating": "5"},
+    {"rating": None},
+]
+
+MISSING = ["name", "age", "score", "tags"]
+
+
+@pytest.fixture(name="models")
+def fixture_models(tmp_path: pathlib.Path) -> Iterator[Any]:
+    """Write the models to a module named after the test, and generate its deserializers."""
+
+    module_name = f"compile_models_{tmp_path.name}"
+    (tmp_path / f"{module_name}.py").write_text(textwrap.dedent(MODELS))
+    sys.path.insert(0, str(tmp_path))
+
+    try:
+        yield importlib.import_module(module_name)
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop(module_name, None)
+        sys.modules.pop(module_name + compiled.COMPILED_MODULE_SUFFIX, None)
+
+
+def _outcome(function: Any, *args: Any, **kwargs: Any) -> Any:
+    """Get the result of a call, or the exception it raised."""
+
+    try:
+        result = function(*args, **kwargs)
+    except deserialize.DeserializeException as ex:
+        return type(ex), str(ex)
+
+    return _describe(result)
+
+
+def _describe(value: Any) -> Any:
+    """Describe a deserialized value so that it can be compared."""
+
+    if isinstance(value, list):
+        return [_describe(item) for item in cast(list[Any], value)]
+
+    if type(value).__module__.startswith("compile_models_"):
+        attributes = cast(dict[str, Any], vars(value))
+        return {
+            name: item if name == "__deserialize_raw__" else _describe(item)
+            for name, item in attributes.items()
+        }
+
+    return value
+
+
+# The normal path, which deserialize() skips for classes with generated deserializers
+_deserialize_normally = deserialize._deserialize_dict  # pylint: disable=protected-access
+
+
+def test_generated_module_is_used_automatically(models: Any) -> None:
+    """Test that the generated module is picked up when a class is deserialized."""
+
+    assert main(["compile", models.__name__]) == 0
+    assert os.path.exists(default_output_path(models))
+
+    team = deserialize.deserialize(models.Team, {"teamName": "A", "members": [PERSON]})
+
+    assert compiled.compiled_deserializer(models.Team) is not None
+    assert compiled.compiled_deserializer(models.Person) is not None
+    assert team.team_name == "A"
+    assert team.lead is None
+    assert team.members[0].age == 30
+    assert team.members[0].nick == "n/a"
+    assert team.members[0].count == 3
+    assert team.members[0].built
+
+
+def test_roots_across_modules(tmp_path: pathlib.Path) -> None:
+    """Test that classes from each module use the module generated for it, whichever is first."""
+
+    owner_name = f"compile_owner_{tmp_path.name}"
+    pet_name = f"compile_pet_{tmp_path.name}"
+    (tmp_path / f"{pet_name}.py").write_text("class Pet:\n    name: str\n")
+    (tmp_path / f"{owner_name}.py").write_text(
+        f"import {pet_name}\n\nclass Owner:\n    pet: {pet_name}.Pet\n"
+    )
+    sys.path.insert(0, str(tmp_path))
+
+    try:
+        owners = importlib.import_module(owner_name)
+        pets = importlib.import_module(pet_name)
+
+        assert main(["compile", owner_name]) == 0
+        assert os.path.exists(default_output_path(owners))
+        assert os.path.exists(default_output_path(pets))
+
+        # The class from the second module is deserialized before the first module is searched
+        assert deserialize.deserialize(pets.Pet, {"name": "Rex"}).name == "Rex"
+        assert compiled.compiled_deserializer(pets.Pet) is not None
+        assert compiled.compiled_deserializer(owners.Owner) is not None
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module_name in (owner_name, pet_name):
+            sys.modules.pop(module_name, None)
+            sys.modules.pop(module_name + compiled.COMPILED_MODULE_SUFFIX, None)
+
+
+def test_generated_matches_normal_path(models: Any) -> None:
+    """Test that the generated deserializers behave the same as the normal path."""
+
+    main(["compile", models.__name__])
+    deserialize.deserialize(models.Team, {"team_name": "A", "members": []})
+
+    samples: list[dict[str, Any]] = [{**PERSON, **variation} for variation in VARIATIONS]
+    samples += [{key: value for key, value in PERSON.items() if key != name} for name in MISSING]
+
+    for data, throw_on_unhandled, raw_storage_mode in itertools.product(
+        samples, [False, True], list(deserialize.RawStorageMode)
+    ):
+        options = {"throw_on_unhandled": throw_on_unhandled, "raw_storage_mode": raw_storage_mode}
+        expected = _outcome(_deserialize_normally, models.Person, data, "Root", **options)
+        actual = _outcome(compiled.compiled_deserializer(models.Person), data, "Root", **options)
+        assert actual == expected
+
+
+def test_generated_key_priority(models: Any) -> None:
+    """Test that generated deserializers read the same spelling of auto snake keys."""
+
+    main(["compile", models.__name__])
+
+    samples: list[dict[str, Any]] = [
+        {"team_name": "A", "teamName": "B", "TeamName": "C", "members": []},
+        {"TeamName": "C", "teamName": "B", "Members": []},
+        {"TeamName": "C", "members": [], "unknown": 1},
+    ]
+
+    for data in samples:
+        for throw_on_unhandled in [False, True]:
+            expected = _outcome(
+                _deserialize_normally,
+                models.Team,
+                data,
+                "Root",
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=deserialize.RawStorageMode.NONE,
+            )
+            actual = _outcome(
+                compiled.compiled_deserializer(models.Team),
+                data,
+                "Root",
+                throw_on_unhandled=throw_on_unhandled,
+                raw_storage_mode=deserialize.RawStorageMode.NONE,
+            )
+            assert actual == expected
+
+
+def test_optional_fields_written_once(models: Any) -> None:
+    """Test that optional fields don't repeat their steps for missing values."""
+
+    source = generate([models.Person]).source
+
+    assert source.count("(debug_name, 'score', False)") == 1
+    assert "instance.score = None" in source
+    assert source.count("(debug_name, 'rating', False)") == 1
+    assert "data.get('rating')" in source
+
+
+def test_unsupported_classes_are_skipped(models: Any) -> None:
+    """Test that classes the generated code can't express use the normal path."""
+
+    result = generate([models.Zoo])
+
+    assert result.compiled == [models.Zoo]
+    assert "downcasting" in result.skipped[models.Animal]
+    assert "downcasting" in result.skipped[models.Dog]
+
+    main(["compile", f"{models.__name__}:Zoo"])
+    zoo = deserialize.deserialize(models.Zoo, {"animals": [{"type": "dog", "name": "Rex"}]})
+
+    assert compiled.compiled_deserializer(models.Animal) is None
+    assert isinstance(zoo.animals[0], models.Dog)
+
+
+def test_changed_classes_are_not_used(models: Any) -> None:
+    """Test that a deserializer isn't used once its class has changed."""
+
+    def build() -> Any:
+        raise AssertionError("A changed class was built")
+
+    compiled.register(models.__name__, "Person", "0" * 32, build)
+
+    assert compiled.compiled_deserializer(models.Person) is None
+
+
+def test_generated_module_checked_lazily(models: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that importing a generated module doesn't inspect its classes."""
+
+    main(["compile", models.__name__])
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("A class was inspected on import")
+
+    monkeypatch.setattr(compiled, "fingerprint", fail)
+    monkeypatch.setattr(typing, "get_type_hints", fail)
+
+    importlib.import_module(models.__name__ + compiled.COMPILED_MODULE_SUFFIX)
+
+    monkeypatch.undo()
+
+    assert compiled.compiled_deserializer(models.Person) is not None
+
+
+def test_profiling_uses_normal_path(models: Any) -> None:
+    """Test that classes are still profiled when they have generated deserializers."""
+
+    main(["compile", models.__name__])
+
+    with deserialize.Profiler() as profiler:
+        deserialize.deserialize(models.Team, {"team_name": "A", "members": [PERSON]})
+
+    assert profiler.classes["Team"].calls == 1
+    assert profiler.classes["Person"].calls == 1
+
+
+def test_decorators_after_generation_use_normal_path(models: Any) -> None:
+    """Test that a class configured after its deserializer was generated isn't stale."""
+
+    main(["compile", models.__name__])
+    deserialize.deserialize(models.Team, {"team_name": "A", "members": [PERSON]})
+
+    deserialize.parser("name", str.upper)(models.Person)
+
+    team = deserialize.deserialize(models.Team, {"team_name": "A", "members": [PERSON]})
+
+    assert team.members[0].name == "ANN"
@@ -0,0 +1,54 @@
+"""Test lazily rendered debug names."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import deserialize, DeserializeException
+from deserialize.debug_name import render_debug_name
+
+# pylint: enable=wrong-import-position
+
+
+class Leaf:
+    """Innermost class."""
+
+    name: str
+
+
+class Branch:
+    """Class with nested collections."""
+
+    leaves: list[Leaf]
+    lookup: dict[str, list[int]]
+
+
+def test_render_root() -> None:
+    """Test that a root name renders as itself."""
+    assert render_debug_name("Root") == "Root"
+
+
+def test_render_nested() -> None:
+    """Test that nested names render with attribute and index separators."""
+    attribute_name = ((("Root", "field", False), 3, True), "name", False)
+    assert render_debug_name(attribute_name) == "Root.field[3].name"
+
+    index_name = (("Root", 7, False), 0, True)
+    assert render_debug_name(index_name) == "Root.7[0]"
+
+
+def test_nested_error_messages() -> None:
+    """Test that errors deep in the tree report the full path."""
+
+    with pytest.raises(DeserializeException) as exc_info:
+        _ = deserialize(Branch, {"leaves": [{"name": "a"}, {"name": 2}], "lookup": {}})
+
+    assert "'Branch.leaves[1].name'" in str(exc_info.value)
+
+    with pytest.raises(DeserializeException) as exc_info:
+        _ = deserialize(Branch, {"leaves": [], "lookup": {"key": [1, "2"]}})
+
+    assert "'Branch.lookup.key[1]'" in str(exc_info.value)
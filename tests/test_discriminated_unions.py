@@ -0,0 +1,208 @@
+"""Test discriminated unions."""
+
+import os
+import sys
+from typing import Annotated, Any, Literal
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import (
+    deserialize,
+    DeserializeException,
+    Field,
+    RawStorageMode,
+    UndefinedDowncastException,
+)
+
+# pylint: enable=wrong-import-position
+
+
+class Created:
+    """Event identified by a Literal type hint."""
+
+    kind: Literal["created"]
+    name: str
+
+
+class Updated:
+    """Event identified by a class attribute."""
+
+    kind: str = "updated"
+    name: str
+    changes: list[str]
+
+
+class Deleted:
+    """Event identified by a Field default, under a different attribute name."""
+
+    event_kind: Annotated[str, Field(alias="kind", default="deleted")]
+    name: str
+
+
+class Renamed:
+    """Event identified by any of several tags."""
+
+    kind: Literal["renamed", "moved"]
+    name: str
+
+
+class Webhook:
+    """Webhook with a discriminated union of events."""
+
+    event: Annotated[Created | Updated | Deleted | Renamed, Field(discriminator="kind")]
+    previous: Annotated[Created | Updated | None, Field(discriminator="kind")]
+
+
+def test_discriminated_union() -> None:
+    """Test that each member is chosen by its tag."""
+
+    events: list[tuple[dict[str, Any], type[Created | Updated | Deleted | Renamed]]] = [
+        ({"kind": "created", "name": "a"}, Created),
+        ({"kind": "updated", "name": "a", "changes": []}, Updated),
+        ({"kind": "deleted", "name": "a"}, Deleted),
+        ({"kind": "renamed", "name": "a"}, Renamed),
+        ({"kind": "moved", "name": "a"}, Renamed),
+    ]
+
+    for event, expected_type in events:
+        result = deserialize(Webhook, {"event": event, "previous": None})
+        assert isinstance(result.event, expected_type)
+        assert result.event.name == "a"
+        assert result.previous is None
+
+    result = deserialize(
+        Webhook,
+        {"event": {"kind": "deleted", "name": "b"}, "previous": {"kind": "created", "name": "c"}},
+    )
+    assert isinstance(result.event, Deleted)
+    assert result.event.event_kind == "deleted"
+    assert isinstance(result.previous, Created)
+
+
+def test_discriminated_union_member_errors() -> None:
+    """Test that errors come from the identified member only."""
+
+    with pytest.raises(DeserializeException) as exc_info:
+        deserialize(Webhook, {"event": {"kind": "updated", "name": "a"}, "previous": None})
+
+    assert str(exc_info.value) == "Unexpected missing value for: Webhook.event.changes"
+
+
+def test_discriminated_union_unknown_tag() -> None:
+    """Test that unknown and missing tags are errors."""
+
+    with pytest.raises(UndefinedDowncastException):
+        deserialize(Webhook, {"event": {"kind": "archived", "name": "a"}, "previous": None})
+
+    with pytest.raises(UndefinedDowncastException):
+        deserialize(Webhook, {"event": {"kind": ["created"], "name": "a"}, "previous": None})
+
+    with pytest.raises(DeserializeException) as exc_info:
+        deserialize(Webhook, {"event": {"name": "a"}, "previous": None})
+
+    assert str(exc_info.value) == "Missing discriminator 'kind' for Webhook.event"
+
+
+def test_discriminated_union_raw_storage() -> None:
+    """Test that raw storage still works for discriminated members."""
+
+    data = {"event": {"kind": "created", "name": "a"}, "previous": None}
+
+    result = deserialize(Webhook, data, raw_storage_mode=RawStorageMode.ALL)
+
+    assert getattr(result.event, "__deserialize_raw__") == data["event"]
+
+
+Event = Annotated[Created | Updated | Deleted | Renamed, Field(discriminator="kind")]
+
+
+class Feed:
+    """Feed with discriminated unions nested in other type hints."""
+
+    events: list[Event]
+    latest: dict[str, Event]
+    pinned: Event | None
+
+
+def test_nested_discriminated_union() -> None:
+    """Test that discriminators work in lists, dict values and optional hints."""
+
+    result = deserialize(
+        Feed,
+        {
+            "events": [{"kind": "created", "name": "a"}, {"kind": "moved", "name": "b"}],
+            "latest": {"x": {"kind": "deleted", "name": "c"}},
+            "pinned": {"kind": "updated", "name": "d", "changes": ["e"]},
+        },
+    )
+
+    assert [type(event) for event in result.events] == [Created, Renamed]
+    assert isinstance(result.latest["x"], Deleted)
+    assert isinstance(result.pinned, Updated)
+
+    result = deserialize(Feed, {"events": [], "latest": {}, "pinned": None})
+
+    assert result.pinned is None
+    assert deserialize(list[Event], [{"kind": "created", "name": "a"}])[0].name == "a"
+
+    with pytest.raises(DeserializeException) as exc_info:
+        deserialize(Feed, {"events": [{"name": "a"}], "latest": {}, "pinned": None})
+
+    assert str(exc_info.value) == "Missing discriminator 'kind' for Feed.events[0]"
+
+    with pytest.raises(UndefinedDowncastException):
+        deserialize(list[Event], [{"kind": "archived", "name": "a"}])
+
+
+def test_discriminator_requires_union() -> None:
+    """Test that a discriminator can only be used on a union."""
+
+    class NotUnion:
+        """Discriminator on a plain class."""
+
+        event: Annotated[Created, Field(discriminator="kind")]
+
+    with pytest.raises(DeserializeException):
+        deserialize(NotUnion, {"event": {"kind": "created", "name": "a"}})
+
+    with pytest.raises(DeserializeException):
+        deserialize(
+            list[Annotated[Created, Field(discriminator="kind")]],
+            [{"kind": "created", "name": "a"}],
+        )
+
+
+def test_discriminator_duplicate_tags() -> None:
+    """Test that two members can't share a tag."""
+
+    class Other:
+        """Another class using the created tag."""
+
+        kind: Literal["created"]
+
+    class Duplicated:
+        """Union with a duplicated tag."""
+
+        event: Annotated[Created | Other, Field(discriminator="kind")]
+
+    with pytest.raises(DeserializeException):
+        deserialize(Duplicated, {"event": {"kind": "created", "name": "a"}})
+
+
+def test_literal() -> None:
+    """Test that Literal fields only accept their values."""
+
+    assert deserialize(Created, {"kind": "created", "name": "a"}).kind == "created"
+
+    with pytest.raises(DeserializeException):
+        deserialize(Created, {"kind": "updated", "name": "a"})
+
+    class Flag:
+        """Class with an integer literal."""
+
+        value: Literal[1]
+
+    with pytest.raises(DeserializeException):
+        deserialize(Flag, {"value": True})
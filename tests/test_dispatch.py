@@ -0,0 +1,218 @@
+"""Test the type dispatch cache."""
+
+import os
+import sys
+from typing import Annotated, Any, Literal, Union, cast
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+
+# pylint: enable=wrong-import-position
+
+# pylint: disable=protected-access
+
+
+class DispatchItem:
+    """Sample class for dispatch tests."""
+
+    value: int
+    names: list[str]
+
+
+def test_handlers_cached() -> None:
+    """Test that handlers are resolved once and reused."""
+
+    data: list[dict[str, Any]] = [{"value": 1, "names": ["a"]}, {"value": 2, "names": []}]
+
+    first = deserialize.deserialize(list[DispatchItem], data)
+    handler = deserialize._HANDLER_CACHE[DispatchItem]
+    second = deserialize.deserialize(list[DispatchItem], data)
+
+    assert deserialize._HANDLER_CACHE[DispatchItem] is handler
+    assert list[DispatchItem] in deserialize._HANDLER_CACHE
+    assert list[str] in deserialize._HANDLER_CACHE
+    assert [item.value for item in first] == [item.value for item in second] == [1, 2]
+
+
+def test_cached_handler_checks_each_value() -> None:
+    """Test that a cached handler still checks the data for every value."""
+
+    assert deserialize.deserialize(list[int], [1, 2]) == [1, 2]
+
+    with pytest.raises(deserialize.DeserializeException) as exc_info:
+        deserialize.deserialize(list[int], [1, "2"])
+
+    assert "list[1]" in str(exc_info.value)
+
+
+def test_unhashable_type_hint() -> None:
+    """Test that unhashable type hints are resolved without being cached."""
+
+    unhashable: Any = list[Annotated[int, {"unhashable": True}]]
+
+    assert not deserialize.deserialize(unhashable, [])
+    assert not deserialize.deserialize(unhashable, [])
+
+
+class UnionHolder:
+    """Sample class with union fields."""
+
+    value: DispatchItem | list[int] | int | str | None
+    number: int | list[int] | None
+
+
+def test_union_skips_implausible_members() -> None:
+    """Test that unions only try the members which could accept the data."""
+
+    data: list[dict[str, Any]] = [
+        {"value": [1, 2], "number": 1},
+        {"value": 3, "number": 1},
+        {"value": {"value": 1, "names": []}, "number": 1},
+    ]
+
+    result = deserialize.deserialize(list[UnionHolder], data)
+
+    assert result[0].value == [1, 2]
+    assert result[1].value == 3
+    assert isinstance(result[2].value, DispatchItem)
+
+    handler = cast(
+        deserialize._UnionHandler,
+        deserialize._HANDLER_CACHE[DispatchItem | list[int] | int | str | None],
+    )
+
+    def members(data_type: type) -> set[Any]:
+        return {member for _, member, _ in handler.candidates[data_type]}
+
+    assert members(list) == {list[int]}
+    assert members(int) == {int}
+    assert members(dict) == {DispatchItem}
+
+
+def test_union_error_lists_every_member() -> None:
+    """Test that a union failure still explains why each member failed."""
+
+    with pytest.raises(deserialize.DeserializeException) as exc_info:
+        deserialize.deserialize(UnionHolder, {"value": None, "number": "a"})
+
+    message = str(exc_info.value)
+
+    assert message.count("\n\t* ") == 3
+    assert "'<class 'str'>' to '<class 'int'>'" in message
+
+
+def test_union_error_for_dict_data() -> None:
+    """Test that dict data no member accepts raises the union error."""
+
+    with pytest.raises(deserialize.DeserializeException) as exc_info:
+        deserialize.deserialize(dict[str, Union[list[int], int]], {"a": {"b": 1}})
+
+    assert "Cannot deserialize a dict to 'list[int]' for dict.a" in str(exc_info.value)
+
+
+PARSE_CALLS: list[Any] = []
+
+
+def record_parse(value: Any) -> Any:
+    """Parser which records every value it is given."""
+    PARSE_CALLS.append(value)
+    return value
+
+
+@deserialize.parser("first", record_parse)
+class TwoFields:
+    """Sample class which fails after parsing its first field."""
+
+    first: int
+    second: int
+
+
+class OtherFields:
+    """Sample class which requires a key the data doesn't have."""
+
+    other: int
+
+
+class TrialHolder:
+    """Sample class with a union of classes."""
+
+    value: TwoFields | OtherFields | None
+
+
+def test_union_failures_rendered_once() -> None:
+    """Test that failed union members are only tried once, even for the error."""
+
+    PARSE_CALLS.clear()
+
+    with pytest.raises(deserialize.DeserializeException) as exc_info:
+        deserialize.deserialize(TrialHolder, {"value": {"first": 1, "second": "a"}})
+
+    message = str(exc_info.value)
+
+    assert PARSE_CALLS == [1]
+    assert message.count("\n\t* ") == 3
+    assert "Unexpected missing value for: TrialHolder.value.other" in message
+
+
+def test_union_skips_missing_required_keys() -> None:
+    """Test that classes missing a required key are skipped."""
+
+    PARSE_CALLS.clear()
+
+    result = deserialize.deserialize(TrialHolder, {"value": {"first": 1, "other": 1}})
+
+    assert isinstance(result.value, OtherFields)
+    assert not PARSE_CALLS
+    assert deserialize.deserialize(TrialHolder, {"value": None}).value is None
+
+
+class Cat:
+    """Sample class identified by a Literal field."""
+
+    kind: Literal["cat"]
+    lives: int
+
+
+class Dog:
+    """Sample class identified by a Literal field."""
+
+    kind: Literal["dog"]
+    name: str
+
+
+class PetHolder:
+    """Sample class with a union of classes which all have the same keys."""
+
+    pet: Cat | Dog | None
+
+
+def test_union_trials_do_not_raise(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that members which are certain to fail are ruled out without raising."""
+
+    created: list[str] = []
+    create = deserialize.DeserializeException.__init__
+
+    def record_exception(self: deserialize.DeserializeException, message: str) -> None:
+        created.append(message)
+        create(self, message)
+
+    monkeypatch.setattr(deserialize.DeserializeException, "__init__", record_exception)
+
+    dog = deserialize.deserialize(PetHolder, {"pet": {"kind": "dog", "name": "Rex"}})
+    cat = deserialize.deserialize(PetHolder, {"pet": {"kind": "cat", "lives": 9}})
+    wrong_type = deserialize.deserialize(
+        list[Cat | dict[str, str]], [{"kind": "cat", "lives": "9"}]
+    )
+
+    assert isinstance(dog.pet, Dog)
+    assert isinstance(cat.pet, Cat)
+    assert wrong_type == [{"kind": "cat", "lives": "9"}]
+    assert not created
+
+    with pytest.raises(deserialize.DeserializeException) as exc_info:
+        deserialize.deserialize(PetHolder, {"pet": {"kind": "bird", "name": "Tweety"}})
+
+    assert str(exc_info.value).count("\n\t* ") == 3
@@ -169,3 +169,85 @@ def test_downcasting_fallback() -> None:
 
     assert foo.type_name == "foo"
     assert bar["type_name"] == "bar"
+
+
+def test_downcasting_multiple_levels() -> None:
+    """Test that subclasses with their own downcast field are downcast again."""
+
+    @downcast_field("kind")
+    class Event:
+        """Base event."""
+
+        kind: str
+
+    @downcast_field("action")
+    @downcast_identifier(Event, "user")
+    class UserEvent(Event):
+        """User events, which have their own downcast field."""
+
+        action: str
+
+    @downcast_identifier(UserEvent, "login")
+    class Login(UserEvent):
+        """Login event."""
+
+        ip: str
+
+    @downcast_identifier(Event, "system")
+    class SystemEvent(Event):
+        """System events."""
+
+        message: str
+
+    @downcast_identifier(SystemEvent, "shutdown")
+    class Shutdown(SystemEvent):
+        """Registered against a subclass using the same downcast field."""
+
+        code: int
+
+    data = [
+        {"kind": "user", "action": "login", "ip": "::1"},
+        {"kind": "system", "message": "hello"},
+        {"kind": "shutdown", "message": "bye", "code": 1},
+    ]
+
+    results = deserialize(list[Event], data)
+
+    assert isinstance(results[0], Login)
+    assert results[0].ip == "::1"
+    assert type(results[1]) is SystemEvent  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(results[2], Shutdown)
+    assert results[2].code == 1
+
+    with pytest.raises(UndefinedDowncastException):
+        _ = deserialize(Event, {"kind": "user", "action": "logout"})
+
+
+def test_downcasting_registered_after_use() -> None:
+    """Test that identifiers registered after deserializing are picked up."""
+
+    @downcast_field("kind")
+    class Shape:
+        """Base shape."""
+
+        kind: str
+
+    @downcast_identifier(Shape, "circle")
+    class Circle(Shape):
+        """Circle."""
+
+        radius: int
+
+    assert isinstance(deserialize(Shape, {"kind": "circle", "radius": 1}), Circle)
+
+    with pytest.raises(UndefinedDowncastException):
+        _ = deserialize(Shape, {"kind": "square", "side": 1})
+
+    @downcast_identifier(Shape, "square")
+    class Square(Shape):
+        """Square."""
+
+        side: int
+
+    assert isinstance(deserialize(Shape, {"kind": "square", "side": 1}), Square)
+    assert isinstance(deserialize(Circle, {"kind": "square", "side": 1}), Square)
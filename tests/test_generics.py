@@ -0,0 +1,137 @@
+"""Test deserializing generic classes."""
+
+import os
+import sys
+from typing import Generic, Optional, TypeVar
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+from deserialize.metadata_cache import clear_class_cache, get_class_metadata
+
+# pylint: enable=wrong-import-position
+
+T = TypeVar("T")
+
+
+class User:
+    """A user."""
+
+    name: str
+
+
+class Team:
+    """A team."""
+
+    title: str
+
+
+@deserialize.auto_snake()
+class Page(Generic[T]):
+    """A page of results."""
+
+    items: list[T]
+    next_page: Optional["Page[T]"]
+
+
+class UserPage(Page[User]):
+    """A page of users, with the total."""
+
+    total: int
+
+
+class Nested(Page[list[T]], Generic[T]):
+    """A page of lists, with a value of the type of the items in the lists."""
+
+    first: T
+
+
+PAGE = {"items": [{"name": "Ann"}], "nextPage": {"items": [{"name": "Bob"}], "next_page": None}}
+
+
+def test_specialization() -> None:
+    """Test that the type arguments of a specialization are used for its fields."""
+
+    page = deserialize.deserialize(Page[User], PAGE)
+
+    assert type(page) is Page  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(page.items[0], User)
+    assert page.items[0].name == "Ann"
+    assert page.next_page is not None
+    assert isinstance(page.next_page.items[0], User)
+    assert page.next_page.next_page is None
+
+    teams = deserialize.deserialize(Page[Team], {"items": [{"title": "A"}], "next_page": None})
+
+    assert isinstance(teams.items[0], Team)
+
+    with pytest.raises(deserialize.DeserializeException, match=r"Page.items\[0\].name"):
+        deserialize.deserialize(Page[User], {"items": [{"title": "A"}], "next_page": None})
+
+
+def test_subclass_of_specialization() -> None:
+    """Test that classes inheriting from specializations fill in the type arguments."""
+
+    page = deserialize.deserialize(UserPage, {**PAGE, "total": 2})
+
+    assert isinstance(page.items[0], User)
+    assert page.total == 2
+
+    nested = deserialize.deserialize(
+        Nested[int], {"items": [[1, 2]], "next_page": None, "first": 1}
+    )
+
+    assert nested.items == [[1, 2]]
+    assert nested.first == 1
+
+    with pytest.raises(deserialize.DeserializeException):
+        deserialize.deserialize(Nested[int], {"items": [["a"]], "next_page": None, "first": 1})
+
+
+class Crate(Generic[T]):
+    """A crate."""
+
+    value: T
+
+
+# Specializing this makes new aliases, which are equal to those made from Crate
+AnyCrate = Crate[T]
+
+
+def test_metadata_cached_per_specialization() -> None:
+    """Test that each specialization's metadata is built once and shared by equal aliases."""
+
+    before = deserialize.metadata_cache_info()["specializations"]
+
+    metadata = get_class_metadata(Crate[User])
+    copied_alias = AnyCrate[User]
+
+    assert copied_alias is not Crate[User]
+    assert get_class_metadata(Crate[User]) is metadata
+    assert get_class_metadata(copied_alias) is metadata
+    assert get_class_metadata(Crate[Team]) is not metadata
+    assert metadata.origin is Crate
+    assert metadata.fields["value"].type is User
+    assert deserialize.metadata_cache_info()["specializations"] == before + 2
+
+    clear_class_cache(copied_alias)
+
+    assert deserialize.metadata_cache_info()["specializations"] == before + 1
+    assert get_class_metadata(copied_alias) is not metadata
+
+
+def test_decorators_on_generic_class() -> None:
+    """Test that specializations follow decorators applied to the generic class."""
+
+    class Box(Generic[T]):
+        """A box."""
+
+        value: T
+
+    assert deserialize.deserialize(Box[int], {"value": 1}).value == 1
+
+    deserialize.key("value", "Value")(Box)
+
+    assert deserialize.deserialize(Box[int], {"Value": 2}).value == 2
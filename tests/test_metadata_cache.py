@@ -1,8 +1,11 @@
 """Test metadata caching functionality."""
 
+import gc
 import os
 import sys
 import time
+import types
+import weakref
 from typing import Union
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -11,8 +14,10 @@ from deserialize import deserialize, key, parser, default, auto_snake, ignore
 from deserialize.metadata_cache import (
     get_class_metadata,
     clear_class_cache,
+    metadata_cache_info,
     FieldMetadata,
     ClassMetadata,
+    MAX_SHAPES_PER_CLASS,
 )
 
 # pylint: enable=wrong-import-position
@@ -299,6 +304,9 @@ def test_immutable_types_handled() -> None:
     # int won't have the cache attribute (immutable)
     assert "__deserialize_cache__" not in int.__dict__
 
+    # But it is still cached, in the registry instead
+    assert get_class_metadata(int) is metadata
+
 
 def test_union_types_cached() -> None:
     """Test that union types are properly cached."""
@@ -366,3 +374,241 @@ def test_parser_function_cached() -> None:
     # Test the parser works
     assert field.parser(5) == 10
     assert field.parser("3") == 6
+
+
+def test_steps_precompiled() -> None:
+    """Test that the per-class steps are compiled once from the field metadata."""
+
+    @ignore("skipped")
+    class StepsClass:
+        """Class for testing compiled steps."""
+
+        first: int
+        skipped: str
+        second: str | None
+
+    metadata = get_class_metadata(StepsClass)
+
+    assert [step.name for step in metadata.steps] == ["first", "second"]
+    assert metadata.snake_case_violation is None
+    assert metadata.steps[0].keys == ("first",)
+    assert metadata.steps[0].accepts_none is False
+    assert metadata.steps[1].accepts_none is True
+
+
+def test_steps_auto_snake_keys() -> None:
+    """Test that auto_snake steps carry all lookup keys in priority order."""
+    metadata = get_class_metadata(SnakeClass)
+
+    assert metadata.fields["user_id"].keys == ("user_id", "userId", "UserId")
+
+
+def test_steps_snake_case_violation() -> None:
+    """Test that a non-snake cased field stops the compiled steps."""
+
+    @auto_snake()
+    class BadSnakeClass:
+        """Class with a field which isn't snake cased."""
+
+        good_field: int
+        badField: int  # pylint: disable=invalid-name
+        other_field: int
+
+    metadata = get_class_metadata(BadSnakeClass)
+
+    assert [step.name for step in metadata.steps] == ["good_field"]
+    assert metadata.snake_case_violation == "badField"
+
+
+def test_key_index() -> None:
+    """Test that every spelling of every key maps back to its fields."""
+
+    @key("alias", "shared")
+    @key("other", "shared")
+    class IndexedClass:
+        """Class with two fields reading the same key."""
+
+        alias: int
+        other: int
+        plain: str
+
+    metadata = get_class_metadata(SnakeClass)
+
+    assert metadata.key_index == {
+        "user_id": (0,),
+        "userId": (0,),
+        "UserId": (0,),
+        "user_name": (1,),
+        "userName": (1,),
+        "UserName": (1,),
+    }
+
+    assert get_class_metadata(IndexedClass).key_index == {"shared": (0, 1), "plain": (2,)}
+
+    result = deserialize(IndexedClass, {"shared": 1, "plain": "a"}, throw_on_unhandled=True)
+    assert result.alias == result.other == 1
+
+
+def test_shape_plans_cached() -> None:
+    """Test that plans are cached for each set of keys in the data."""
+
+    @auto_snake()
+    class ShapeClass:
+        """Class for testing shape plans."""
+
+        first_value: int
+        second_value: str | None
+
+    metadata = get_class_metadata(ShapeClass)
+
+    deserialize(ShapeClass, {"firstValue": 1, "second_value": "a", "extra": True})
+    deserialize(ShapeClass, {"firstValue": 2, "second_value": "b", "extra": False})
+    deserialize(ShapeClass, {"first_value": 3})
+
+    assert len(metadata.shapes) == 2
+
+    plan = metadata.shapes[("firstValue", "second_value", "extra")]
+    assert plan.keys == ("firstValue", "second_value")
+    assert plan.unhandled == (2,)
+
+    plan = metadata.shapes[("first_value",)]
+    assert plan.keys == ("first_value", None)
+    assert not plan.unhandled
+
+
+def test_shape_plans_bounded() -> None:
+    """Test that data with arbitrary keys doesn't grow the shape cache forever."""
+
+    class BoundedClass:
+        """Class for testing the shape cache limit."""
+
+        value: int
+
+    for index in range(MAX_SHAPES_PER_CLASS * 2):
+        result = deserialize(BoundedClass, {"value": index, f"extra_{index}": index})
+        assert result.value == index
+
+    assert len(get_class_metadata(BoundedClass).shapes) == MAX_SHAPES_PER_CLASS
+
+
+def test_registry_caches_generic_aliases() -> None:
+    """Test that types which can't hold attributes are cached in the registry."""
+
+    class Box:
+        """Class whose aliases can't hold attributes."""
+
+        value: int
+
+    alias = types.GenericAlias(Box, (int,))
+    before = metadata_cache_info()["registry"]
+
+    metadata = get_class_metadata(alias)
+
+    assert get_class_metadata(alias) is metadata
+    assert get_class_metadata(types.GenericAlias(Box, (int,))) is metadata
+    assert metadata.class_reference is alias
+    assert metadata_cache_info()["registry"] == before + 1
+
+    clear_class_cache(alias)
+
+    assert metadata_cache_info()["registry"] == before
+    assert get_class_metadata(alias) is not metadata
+
+
+def test_metadata_released_with_class() -> None:
+    """Test that cached metadata doesn't keep dynamically created classes alive."""
+
+    gc.collect()
+    before = metadata_cache_info()
+
+    def make_tenant_class() -> type:
+        tenant_class = type("Tenant", (), {"__annotations__": {"value": int}})
+        get_class_metadata(tenant_class)
+        get_class_metadata(types.GenericAlias(tenant_class, (int,)))
+        return tenant_class
+
+    tenant_class = make_tenant_class()
+
+    assert metadata_cache_info()["attributes"] == before["attributes"] + 1
+
+    del tenant_class
+    gc.collect()
+
+    assert metadata_cache_info() == before
+
+
+def test_classes_released_after_deserializing() -> None:
+    """Test that deserializing to dynamically created classes doesn't keep them alive."""
+
+    def deserialize_tenant() -> tuple["weakref.ref[type]", "weakref.ref[type]"]:
+        member_class = type("Member", (), {"__annotations__": {"name": str}})
+        tenant_class = type(
+            "Tenant",
+            (),
+            {
+                "__annotations__": {
+                    "members": list[member_class],  # type: ignore[valid-type]
+                    # typing caches `Optional[...]` itself, so `| None` is used
+                    "owner": member_class | None,
+                }
+            },
+        )
+        data = {"members": [{"name": "Ann"}], "owner": {"name": "Bob"}}
+
+        deserialize(tenant_class, data)
+        deserialize(list[tenant_class], [data])  # type: ignore[valid-type]
+        deserialize(tenant_class | None, data)
+
+        return weakref.ref(tenant_class), weakref.ref(member_class)
+
+    tenant_reference, member_reference = deserialize_tenant()
+    gc.collect()
+
+    assert tenant_reference() is None
+    assert member_reference() is None
+
+
+def test_decorators_after_first_use_rebuild_metadata() -> None:
+    """Test that decorators applied after a class has been used take effect."""
+
+    class Patched:
+        """Class which is configured after it is first used."""
+
+        value: int
+
+    metadata = get_class_metadata(Patched)
+    assert deserialize(Patched, {"value": 1}).value == 1
+
+    parser("value", lambda value: value * 10)(Patched)
+
+    assert get_class_metadata(Patched) is not metadata
+    assert deserialize(Patched, {"value": 1}).value == 10
+
+    rebuilt = get_class_metadata(Patched)
+    assert get_class_metadata(Patched) is rebuilt
+
+
+def test_decorators_on_base_rebuild_subclass_metadata() -> None:
+    """Test that decorating a base class rebuilds the metadata of its subclasses."""
+
+    class PatchedBase:
+        """Base class which is configured after its subclass is used."""
+
+        value: int
+
+    class PatchedChild(PatchedBase):
+        """Subclass inheriting the configuration."""
+
+        other: int
+
+    assert deserialize(PatchedChild, {"value": 1, "other": 2}).value == 1
+
+    key("value", "Value")(PatchedBase)
+
+    assert deserialize(PatchedChild, {"Value": 3, "other": 2}).value == 3
+
+    # Decorating the subclass adds to the map it inherits, which changes the
+    # base class too
+    key("value", "VALUE")(PatchedChild)
+
+    assert deserialize(PatchedBase, {"VALUE": 5}).value == 5
@@ -0,0 +1,90 @@
+"""Test deserializing top level lists in parallel."""
+
+import concurrent.futures
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import deserialize, DeserializeException, RawStorageMode
+
+# pylint: enable=wrong-import-position
+
+
+class Record:
+    """A sample record. This has to be importable by the worker processes."""
+
+    identifier: int
+    tags: list[str]
+
+
+RECORDS = [{"identifier": index, "tags": [str(index)]} for index in range(100)]
+
+
+def test_process_pool() -> None:
+    """Test that results are deserialized by worker processes and kept in order."""
+
+    results = deserialize(list[Record], RECORDS, workers=2)
+
+    assert [result.identifier for result in results] == list(range(100))
+    assert all(isinstance(result, Record) for result in results)
+    assert results[42].tags == ["42"]
+
+
+def test_single_worker_runs_serially(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a single worker doesn't start a process pool."""
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("A process pool was started")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", fail)
+
+    results = deserialize(list[Record], RECORDS, workers=1)
+
+    assert [result.identifier for result in results] == list(range(100))
+
+
+def test_executor() -> None:
+    """Test that an existing executor can be used."""
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        results = deserialize(list[Record], RECORDS, executor=executor)
+
+    assert [result.identifier for result in results] == list(range(100))
+
+
+def test_errors_report_index() -> None:
+    """Test that errors in a chunk report the index in the full list."""
+
+    records: list[dict[str, Any]] = list(RECORDS)
+    records[77] = {"identifier": "bad", "tags": []}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        with pytest.raises(DeserializeException) as exc_info:
+            _ = deserialize(list[Record], records, executor=executor)
+
+    assert "list[77].identifier" in str(exc_info.value)
+
+
+def test_raw_storage() -> None:
+    """Test that raw storage applies to the records in each chunk."""
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        results = deserialize(
+            list[Record], RECORDS, executor=executor, raw_storage_mode=RawStorageMode.ALL
+        )
+
+    assert results[10].__deserialize_raw__ == RECORDS[10]  # type: ignore[attr-defined]
+
+
+def test_non_list_runs_serially() -> None:
+    """Test that data which can't be split is deserialized as usual."""
+
+    result = deserialize(Record, {"identifier": 1, "tags": []}, workers=2)
+    assert result.identifier == 1
+
+    assert deserialize(set[int], [1, 2, 2], workers=2) == {1, 2}
+    assert deserialize(list[int], [1], workers=2) == [1]
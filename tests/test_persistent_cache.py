@@ -0,0 +1,189 @@
+"""Test the persistent metadata cache."""
+
+import importlib
+import os
+import pathlib
+import sys
+import typing
+from typing import Annotated, Any, Iterator
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+from deserialize import metadata_cache
+from deserialize.metadata_cache import clear_class_cache, get_class_metadata
+from deserialize.persistent_cache import fingerprint
+
+# pylint: enable=wrong-import-position
+
+
+def double(value: int) -> int:
+    """Parser which can be pickled by reference."""
+    return value * 2
+
+
+class Address:
+    """Nested class."""
+
+    street: str
+
+
+@deserialize.parser("count", double)
+@deserialize.auto_snake()
+class Stored:
+    """Class whose metadata is stored on disk."""
+
+    user_name: str
+    count: int
+    address: Address | None
+
+
+@deserialize.parser("value", lambda value: value)
+class Unpicklable:
+    """Class whose metadata can't be pickled."""
+
+    value: int
+
+
+@pytest.fixture(name="cache_directory")
+def fixture_cache_directory(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Enable the persistent cache in a temporary directory."""
+
+    deserialize.enable_persistent_cache(tmp_path)
+
+    for class_reference in (Stored, Address, Unpicklable):
+        clear_class_cache(class_reference)
+
+    yield tmp_path
+
+    deserialize.disable_persistent_cache()
+
+    for class_reference in (Stored, Address, Unpicklable):
+        clear_class_cache(class_reference)
+
+
+def _forbid_building(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make building metadata from scratch fail."""
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Metadata was built rather than loaded")
+
+    monkeypatch.setattr(metadata_cache.ClassMetadata, "__init__", fail)
+
+
+def test_metadata_reloaded(cache_directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that stored metadata is loaded instead of being rebuilt."""
+
+    data = {"userName": "a", "count": 2, "address": {"street": "b"}}
+
+    deserialize.deserialize(Stored, data)
+
+    assert len(list(cache_directory.glob(f"{__name__}.Stored-*.pickle"))) == 1
+    assert len(list(cache_directory.glob(f"{__name__}.Address-*.pickle"))) == 1
+
+    clear_class_cache(Stored)
+    clear_class_cache(Address)
+    _forbid_building(monkeypatch)
+
+    result = deserialize.deserialize(Stored, data)
+
+    assert result.user_name == "a"
+    assert result.count == 4
+    assert result.address is not None and result.address.street == "b"
+    assert get_class_metadata(Stored).fields["count"].parser is double
+
+
+def test_changed_class_invalidates(cache_directory: pathlib.Path) -> None:
+    """Test that changing a class's decorators changes its fingerprint."""
+
+    before = fingerprint(Stored)
+
+    get_class_metadata(Stored)
+    deserialize.default("count", 1)(Stored)
+
+    try:
+        assert fingerprint(Stored) != before
+
+        clear_class_cache(Stored)
+        assert get_class_metadata(Stored).fields["count"].has_default
+        assert len(list(cache_directory.glob(f"{__name__}.Stored-*.pickle"))) == 2
+    finally:
+        delattr(Stored, "__deserialize_defaults_map__")
+
+
+def test_changed_module_invalidates(cache_directory: pathlib.Path) -> None:
+    """Test that changing the file a class is defined in changes where it is stored."""
+
+    module_path = cache_directory / f"{cache_directory.name}_aliased.py"
+    module_path.write_text("Identifier = int\n\nclass Aliased:\n    identifier: 'Identifier'\n")
+    sys.path.insert(0, str(cache_directory))
+
+    try:
+        module = importlib.import_module(module_path.stem)
+
+        get_class_metadata(module.Aliased)
+        clear_class_cache(module.Aliased)
+        get_class_metadata(module.Aliased)
+
+        assert len(list(cache_directory.glob(f"{module_path.stem}.Aliased-*.pickle"))) == 1
+
+        module_path.write_text(
+            "Identifier = float\n\nclass Aliased:\n    identifier: 'Identifier'\n"
+        )
+        clear_class_cache(module.Aliased)
+        get_class_metadata(module.Aliased)
+
+        assert len(list(cache_directory.glob(f"{module_path.stem}.Aliased-*.pickle"))) == 2
+    finally:
+        sys.path.remove(str(cache_directory))
+        sys.modules.pop(module_path.stem, None)
+
+
+def test_loading_does_not_resolve_hints(
+    cache_directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that loading stored metadata doesn't resolve the class's type hints."""
+
+    get_class_metadata(Stored)
+    assert list(cache_directory.glob(f"{__name__}.Stored-*.pickle"))
+
+    clear_class_cache(Stored)
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Type hints were resolved")
+
+    monkeypatch.setattr(typing, "get_type_hints", fail)
+
+    assert get_class_metadata(Stored).fields["count"].parser is double
+
+
+def test_field_without_default_fingerprinted() -> None:
+    """Test that Field options without a default can be fingerprinted."""
+
+    class Rated:
+        """Class with a Field which has a parser but no default."""
+
+        rating: Annotated[int | None, deserialize.Field(parser=double)]
+
+    assert fingerprint(Rated) is not None
+
+
+def test_unpicklable_not_stored(cache_directory: pathlib.Path) -> None:
+    """Test that classes which can't be stored still work."""
+
+    assert deserialize.deserialize(Unpicklable, {"value": 1}).value == 1
+    assert not list(cache_directory.glob(f"{__name__}.Unpicklable-*"))
+
+
+def test_corrupt_file_ignored(cache_directory: pathlib.Path) -> None:
+    """Test that unreadable files are rebuilt."""
+
+    get_class_metadata(Address)
+    (path,) = cache_directory.glob(f"{__name__}.Address-*.pickle")
+    path.write_bytes(b"not a pickle")
+
+    clear_class_cache(Address)
+
+    assert deserialize.deserialize(Address, {"street": "a"}).street == "a"
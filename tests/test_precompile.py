@@ -0,0 +1,160 @@
+"""Test building class metadata when classes are defined."""
+
+import importlib
+import os
+import sys
+from typing import Annotated, Any
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+
+# pylint: enable=wrong-import-position
+
+# The package exports the decorator under the same name as the module
+precompile_module = importlib.import_module("deserialize.precompile")
+
+
+@deserialize.precompile()
+class Forward:
+    """Refers to a class which isn't defined yet."""
+
+    later: "DefinedLater"
+
+
+class DefinedLater:
+    """Defined after the class which refers to it."""
+
+    value: int
+
+
+FORWARD_PENDING_BEFORE_TRIGGER = "__deserialize_cache__" not in Forward.__dict__
+
+
+@deserialize.precompile()
+class Trigger:
+    """Precompiling this retries the classes which were waiting."""
+
+    value: int
+
+
+def test_built_on_definition() -> None:
+    """Test that the metadata is built when the class is defined."""
+
+    @deserialize.precompile()
+    @deserialize.key("identifier", "id")
+    @deserialize.auto_snake()
+    class Precompiled:
+        """Precompiled class."""
+
+        identifier: int
+        user_name: str
+
+    metadata = Precompiled.__dict__["__deserialize_cache__"]
+
+    assert metadata.fields["identifier"].key == "id"
+    assert metadata.fields["user_name"].keys == ("user_name", "userName", "UserName")
+
+    result = deserialize.deserialize(Precompiled, {"id": 1, "userName": "Ann"})
+
+    assert result.identifier == 1
+    assert result.user_name == "Ann"
+
+
+def test_configuration_errors_are_raised_on_definition() -> None:
+    """Test that errors which would be raised for the first payload are raised early."""
+
+    @deserialize.auto_snake()
+    class NotSnakeCased:
+        """Has a field which isn't snake cased."""
+
+        userName: str
+
+    class BadDiscriminator:
+        """Uses a discriminator on a field which isn't a union."""
+
+        value: Annotated[int, deserialize.Field(discriminator="kind")]
+
+    class NoHints:
+        """Has nothing to deserialize."""
+
+    with pytest.raises(deserialize.DeserializeException, match="must be snake cased"):
+        deserialize.precompile()(NotSnakeCased)
+
+    with pytest.raises(deserialize.DeserializeException, match="discriminator"):
+        deserialize.precompile()(BadDiscriminator)
+
+    with pytest.raises(deserialize.DeserializeException, match="no type hints"):
+        deserialize.precompile()(NoHints)
+
+
+def test_forward_references_wait() -> None:
+    """Test that classes referring to undefined classes are built once they are defined."""
+
+    assert FORWARD_PENDING_BEFORE_TRIGGER
+    assert "__deserialize_cache__" in Forward.__dict__
+    assert deserialize.deserialize(Forward, {"later": {"value": 1}}).later.value == 1
+
+
+def test_deferred_until_ready() -> None:
+    """Test that deferred classes are built when precompile_ready is called."""
+
+    @deserialize.precompile(defer=True)
+    class Deferred:
+        """Deferred class."""
+
+        value: int
+
+    assert "__deserialize_cache__" not in Deferred.__dict__
+    assert deserialize.precompile_ready() == 1
+    assert "__deserialize_cache__" in Deferred.__dict__
+    assert deserialize.precompile_ready() == 0
+
+
+def test_only_resolved_references_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that waiting classes aren't rebuilt until the names they need are defined."""
+
+    built: list[type] = []
+    build = precompile_module.get_class_metadata
+
+    def record_build(class_reference: type) -> Any:
+        built.append(class_reference)
+        return build(class_reference)
+
+    monkeypatch.setattr(precompile_module, "get_class_metadata", record_build)
+
+    @deserialize.precompile()
+    class Waiting:
+        """Refers to a class which is never defined."""
+
+        missing: "NeverDefined"  # type: ignore[name-defined] # noqa: F821
+
+    @deserialize.precompile()
+    class Unrelated:
+        """Precompiling this doesn't retry the waiting class."""
+
+        value: int
+
+    assert built == [Waiting, Unrelated]
+
+    with pytest.raises(deserialize.DeserializeException, match="NeverDefined"):
+        deserialize.precompile_ready()
+
+
+def test_unresolvable_references_raise_when_ready() -> None:
+    """Test that precompile_ready raises for references which never resolve."""
+
+    @deserialize.precompile()
+    class Unresolvable:
+        """Refers to a class which doesn't exist."""
+
+        missing: "DoesNotExist"  # type: ignore[name-defined] # noqa: F821
+
+    assert "__deserialize_cache__" not in Unresolvable.__dict__
+
+    with pytest.raises(deserialize.DeserializeException, match="DoesNotExist"):
+        deserialize.precompile_ready()
+
+    assert deserialize.precompile_ready() == 0
@@ -0,0 +1,105 @@
+"""Test preparing types ahead of time."""
+
+import os
+import sys
+from typing import Annotated, Any, Literal, cast
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+
+# pylint: enable=wrong-import-position
+
+# pylint: disable=protected-access
+
+
+class Leaf:
+    """Reached through a list."""
+
+    value: int
+
+
+class Keyed:
+    """Reached through a dict."""
+
+    value: str
+
+
+@deserialize.downcast_field("kind")
+class Base:
+    """Downcast root."""
+
+    kind: str
+
+
+@deserialize.downcast_identifier(Base, "sub")
+class Sub(Base):
+    """Reached through downcasting."""
+
+    extra: tuple[Leaf, ...]
+
+
+class Tagged:
+    """Reached through a discriminated union."""
+
+    tag: Literal["tagged"]
+
+
+class Root:
+    """Root of the type graph."""
+
+    leaves: list[Leaf]
+    keyed: dict[str, Keyed]
+    base: Base | None
+    tagged: Annotated[Tagged | None, deserialize.Field(discriminator="tag")]
+
+
+class Unresolvable:
+    """Class whose type hints can't be resolved."""
+
+    missing: "DoesNotExist"  # type: ignore[name-defined] # noqa: F821
+
+
+def _is_warm(class_reference: type) -> bool:
+    return "__deserialize_cache__" in vars(class_reference)
+
+
+def _value_handler(class_reference: Any) -> deserialize._ValueHandler:
+    return cast(deserialize._ValueHandler, deserialize._HANDLER_CACHE[class_reference])
+
+
+def test_prewarm_reaches_type_graph() -> None:
+    """Test that everything reachable from a type is prepared."""
+
+    count = deserialize.prewarm(Root)
+
+    for class_reference in (Root, Leaf, Keyed, Base, Sub, Tagged):
+        assert _is_warm(class_reference)
+        assert class_reference in deserialize._HANDLER_CACHE
+
+    assert _value_handler(list[Leaf]).list_handler is not None
+    assert _value_handler(dict[str, Keyed]).dict_handler is not None
+    assert _value_handler(Leaf).dict_handler is not None
+    assert count >= 10
+
+    result = deserialize.deserialize(
+        Root,
+        {
+            "leaves": [{"value": 1}],
+            "keyed": {"a": {"value": "b"}},
+            "base": {"kind": "sub", "extra": [{"value": 2}]},
+            "tagged": {"tag": "tagged"},
+        },
+    )
+
+    assert isinstance(result.base, Sub)
+    assert result.base.extra[0].value == 2
+
+
+def test_prewarm_module() -> None:
+    """Test that modules are prepared, skipping classes which can't be."""
+
+    deserialize.prewarm(sys.modules[__name__])
+
+    assert _is_warm(Keyed)
+    assert not _is_warm(Unresolvable)
@@ -0,0 +1,95 @@
+"""Test profiling hooks."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# pylint: disable=wrong-import-position
+import deserialize
+
+# pylint: enable=wrong-import-position
+
+
+class Inner:
+    """Inner class."""
+
+    value: int
+
+
+@deserialize.parser("count", int)
+@deserialize.constructed(lambda instance: None)
+class Outer:
+    """Outer class."""
+
+    count: int
+    inner: Inner
+    items: list[Inner]
+
+
+DATA = {"count": "3", "inner": {"value": 1}, "items": [{"value": 2}, {"value": 3}]}
+
+
+def test_records_classes_and_fields():
+    """Test that classes, fields, parsers and callbacks are recorded."""
+
+    with deserialize.Profiler() as profiler:
+        deserialize.deserialize(Outer, DATA)
+
+    stats = profiler.as_dict()
+
+    assert stats["classes"]["Outer"]["calls"] == 1
+    assert stats["classes"]["Inner"]["calls"] == 3
+    assert stats["fields"]["Outer.count"]["calls"] == 1
+    assert stats["fields"]["Inner.value"]["calls"] == 3
+    assert stats["parsers"]["Outer.count"]["calls"] == 1
+    assert "Inner.value" not in stats["parsers"]
+    assert stats["constructed"]["Outer"]["calls"] == 1
+    assert "Inner" not in stats["constructed"]
+    assert stats["classes"]["Outer"]["total_time"] >= stats["fields"]["Outer.items"]["total_time"]
+    assert all(entry["failures"] == 0 for entry in stats["classes"].values())
+
+
+def test_records_failures():
+    """Test that failures are counted against every frame they pass through."""
+
+    with deserialize.Profiler() as profiler:
+        with pytest.raises(deserialize.DeserializeException):
+            deserialize.deserialize(Outer, {"count": 1, "inner": {"value": "a"}, "items": []})
+
+    assert profiler.classes["Outer"].failures == 1
+    assert profiler.classes["Inner"].failures == 1
+    assert profiler.fields["Outer.inner"].failures == 1
+    assert profiler.fields["Inner.value"].failures == 1
+    assert profiler.fields["Outer.count"].failures == 0
+
+
+def test_inactive_outside_block():
+    """Test that nothing is recorded outside of the with block."""
+
+    profiler = deserialize.Profiler()
+
+    with profiler:
+        deserialize.deserialize(Inner, {"value": 1})
+
+    deserialize.deserialize(Inner, {"value": 1})
+
+    assert profiler.classes["Inner"].calls == 1
+
+
+def test_collapsed_stacks():
+    """Test that the collapsed stacks follow the nesting of the data."""
+
+    with deserialize.Profiler() as profiler:
+        deserialize.deserialize(Outer, DATA)
+
+    stacks = {line.rsplit(" ", 1)[0] for line in profiler.collapsed_stacks().splitlines()}
+
+    assert "Outer" in stacks
+    assert "Outer;Outer.count;parser:Outer.count" in stacks
+    assert "Outer;Outer.inner;Inner;Inner.value" in stacks
+    assert "Outer;Outer.items;Inner" in stacks
+    assert "Outer;constructed:Outer" in stacks
+    assert not any("constructed:Inner" in stack for stack in stacks)
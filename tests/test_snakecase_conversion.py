@@ -7,7 +7,7 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # pylint: disable=wrong-import-position
-from deserialize import deserialize, DeserializeException, auto_snake
+from deserialize import deserialize, DeserializeException, UnhandledFieldException, auto_snake
 
 # pylint: enable=wrong-import-position
 
@@ -120,3 +120,34 @@ def test_nested_snake_case_failure() -> None:
 
     with pytest.raises(DeserializeException):
         _ = deserialize(NonSnakeCaseItem, {"SnakeItem": {"IntField": 1, "SomeValues": [1, 2, 3]}})
+
+
+def test_snake_case_key_priority() -> None:
+    """Test that the snake cased key wins when more than one spelling is present."""
+
+    @auto_snake()
+    class SnakeCaseItem:
+        """Sample item for use in tests."""
+
+        int_field: int
+
+    for data in ({"intField": 2, "int_field": 1}, {"int_field": 1, "IntField": 2}):
+        assert deserialize(SnakeCaseItem, data).int_field == 1
+
+        with pytest.raises(UnhandledFieldException):
+            deserialize(SnakeCaseItem, data, throw_on_unhandled=True)
+
+
+def test_unhandled_field_reported_in_data_order() -> None:
+    """Test that the first unhandled key in the data is the one reported."""
+
+    @auto_snake()
+    class SnakeCaseItem:
+        """Sample item for use in tests."""
+
+        int_field: int
+
+    with pytest.raises(UnhandledFieldException) as exc_info:
+        deserialize(SnakeCaseItem, {"intField": 1, "zebra": 1, "apple": 2}, throw_on_unhandled=True)
+
+    assert str(exc_info.value) == "Unhandled field: zebra for SnakeCaseItem"
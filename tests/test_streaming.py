@@ -0,0 +1,164 @@
+"""Test streaming deserialization."""
+
+import io
+import json
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+from deserialize import stream, DeserializeException, RawStorageMode, UnhandledFieldException
+from deserialize.streaming import iter_json_values
+
+# pylint: enable=wrong-import-position
+
+
+class Event:
+    """A sample event."""
+
+    identifier: int
+    name: str
+    values: list[float]
+
+
+EVENTS: list[dict[str, Any]] = [
+    {"identifier": 1, "name": "café", "values": [1.5, 2.25]},
+    {"identifier": 22, "name": "b", "values": []},
+    {"identifier": 333333, "name": "c \\" + '"quoted"', "values": [3.0]},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_json_lines(chunk_size: int) -> None:
+    """Test that JSON Lines are deserialized one at a time."""
+
+    source = io.StringIO("\n".join(json.dumps(event) for event in EVENTS) + "\n")
+
+    results = list(stream(Event, source, chunk_size=chunk_size))
+
+    assert [result.identifier for result in results] == [1, 22, 333333]
+    assert [result.name for result in results] == [event["name"] for event in EVENTS]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_json_array(chunk_size: int) -> None:
+    """Test that the elements of a top level array are deserialized one at a time."""
+
+    source = io.StringIO(json.dumps(EVENTS, indent=2))
+
+    results = list(stream(Event, source, chunk_size=chunk_size))
+
+    assert [result.identifier for result in results] == [1, 22, 333333]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_binary_source(chunk_size: int) -> None:
+    """Test that binary sources are decoded, even when characters span chunks."""
+
+    source = io.BytesIO(json.dumps(EVENTS, ensure_ascii=False).encode("utf-8"))
+
+    results = list(stream(Event, source, chunk_size=chunk_size))
+
+    assert results[0].name == "café"
+
+
+def test_numbers_across_chunks() -> None:
+    """Test that a number split between reads isn't cut short."""
+
+    assert list(iter_json_values(io.StringIO("12345 678"), chunk_size=2)) == [12345, 678]
+    assert list(iter_json_values(io.StringIO("[12345,678]"), chunk_size=2)) == [12345, 678]
+    assert list(iter_json_values(io.StringIO("1.5 -2e3"), chunk_size=2)) == [1.5, -2000.0]
+    assert list(iter_json_values(io.StringIO("[1.25,-3e2]"), chunk_size=2)) == [1.25, -300.0]
+    assert list(iter_json_values(io.StringIO('"\\u00e9" 1'), chunk_size=1)) == ["é", 1]
+
+
+def test_json_lines_of_arrays() -> None:
+    """Test that JSON Lines whose values are arrays can be streamed."""
+
+    assert list(stream(list[int], io.StringIO("[1,2]\n[3]\n"), format="lines")) == [[1, 2], [3]]
+    assert list(iter_json_values(io.StringIO("[1,2]\n[3]\n"), format="lines")) == [[1, 2], [3]]
+
+    # By default a source which starts with an array is a single array
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(io.StringIO("[1,2]\n[3]\n")))
+
+
+def test_explicit_array_format() -> None:
+    """Test that the array format requires a top level array."""
+
+    assert list(iter_json_values(io.StringIO(" [1, 2]"), format="array")) == [1, 2]
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(io.StringIO("1\n2\n"), format="array"))
+
+    with pytest.raises(ValueError):
+        iter_json_values(io.StringIO("1"), format="csv")  # type: ignore[arg-type]
+
+
+def test_empty_sources() -> None:
+    """Test that empty sources produce no values."""
+
+    assert not list(iter_json_values(io.StringIO("")))
+    assert not list(iter_json_values(io.StringIO("  \n ")))
+    assert not list(iter_json_values(io.StringIO("[ ]")))
+
+
+def test_is_lazy() -> None:
+    """Test that values are only read as they are needed."""
+
+    source = io.StringIO("\n".join(json.dumps(event) for event in EVENTS))
+
+    results = stream(Event, source, chunk_size=16)
+    assert next(results).identifier == 1
+    assert source.tell() < len(source.getvalue())
+
+
+def test_invalid_json() -> None:
+    """Test that invalid JSON raises."""
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(io.StringIO('{"a": 1} {"b": ')))
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(io.StringIO("[1, 2")))
+
+
+def test_invalid_json_fails_early() -> None:
+    """Test that invalid JSON raises without reading the rest of the source."""
+
+    source = io.StringIO('{"a": x}\n' + '{"b": 1}\n' * 10000)
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(source, chunk_size=16))
+
+    assert source.tell() <= 16
+
+    source = io.StringIO("[1, 2 3]" + " " * 10000)
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(source, chunk_size=16))
+
+    assert source.tell() <= 16
+
+    with pytest.raises(json.JSONDecodeError):
+        _ = list(iter_json_values(io.StringIO("[1, 2] 3")))
+
+
+def test_options() -> None:
+    """Test that the usual deserialization options apply to each value."""
+
+    line = json.dumps(EVENTS[0])
+
+    result = next(stream(Event, io.StringIO(line), raw_storage_mode=RawStorageMode.ROOT))
+    assert result.__deserialize_raw__ == EVENTS[0]  # type: ignore[attr-defined]
+
+    with pytest.raises(UnhandledFieldException):
+        _ = list(stream(Event, io.StringIO('{"extra": 1, ' + line[1:]), throw_on_unhandled=True))
+
+    errors: list[tuple[int, DeserializeException]] = []
+    source = io.StringIO(line + '\n{"identifier": "x"}\n' + line)
+    assert len(list(stream(Event, source, errors=errors))) == 2
+    assert [index for index, _ in errors] == [1]
@@ -0,0 +1,98 @@
+"""Test deserializing from multiple threads."""
+
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import deserialize
+from deserialize import metadata_cache
+from deserialize.metadata_cache import ClassMetadata, get_class_metadata
+
+# pylint: enable=wrong-import-position
+
+THREAD_COUNT = 64
+
+
+class Child:
+    """Nested class."""
+
+    value: int
+
+
+class Parent:
+    """Class deserialized from many threads at once."""
+
+    name: str
+    children: list[Child]
+    maybe: Child | None
+
+
+def _run_at_once(target: Any) -> list[Any]:
+    """Run the target in many threads, all starting at the same moment."""
+
+    barrier = threading.Barrier(THREAD_COUNT)
+    results: list[Any] = [None] * THREAD_COUNT
+    errors: list[BaseException] = []
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = target()
+        except BaseException as ex:  # pylint: disable=broad-exception-caught
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(THREAD_COUNT)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    return results
+
+
+def test_metadata_built_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that concurrent cold lookups only build the metadata once."""
+
+    class Cold:
+        """Class with no metadata yet."""
+
+        value: int
+
+    builds: list[Any] = []
+    original_init = ClassMetadata.__init__
+
+    def slow_init(self: ClassMetadata, class_reference: Any) -> None:
+        builds.append(class_reference)
+        # Widen the window for other threads to arrive while this one builds
+        time.sleep(0.05)
+        original_init(self, class_reference)
+
+    monkeypatch.setattr(ClassMetadata, "__init__", slow_init)
+
+    results = _run_at_once(lambda: get_class_metadata(Cold))
+
+    assert builds == [Cold]
+    assert all(result is results[0] for result in results)
+    assert not metadata_cache._BUILD_LOCKS  # pylint: disable=protected-access
+
+
+def test_concurrent_deserialize() -> None:
+    """Test that deserializing cold classes from many threads gives the same results."""
+
+    data = {"name": "a", "children": [{"value": 1}, {"value": 2}], "maybe": {"value": 3}}
+
+    results = _run_at_once(lambda: deserialize.deserialize(Parent, data))
+
+    for result in results:
+        assert result.name == "a"
+        assert [child.value for child in result.children] == [1, 2]
+        assert result.maybe.value == 3
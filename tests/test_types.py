@@ -24,6 +24,7 @@ from deserialize import (
     set_content_type,
     tuple_content_types,
     union_types,
+    union_members,
 )
 
 # pylint: enable=wrong-import-position
@@ -101,6 +102,16 @@ def test_union_types() -> None:
         _ = union_types(tuple[int | None, int], "")
 
 
+def test_union_members() -> None:
+    """Test union_members keeps declaration order."""
+    assert union_members(Union[str, int], "") == (str, int)
+    assert union_members(int | str | None, "") == (int, str, type(None))
+    assert union_members(Union[None, str | None], "") == (type(None), str)
+
+    with pytest.raises(DeserializeException):
+        _ = union_members(int, "")
+
+
 def test_is_list() -> None:
     """Test is_list."""
     assert is_list(list[int])
@@ -300,6 +311,36 @@ def test_base_type_lists() -> None:
     assert data == parsed
 
 
+def test_base_type_lists_scanned() -> None:
+    """Test that lists of base types which pass the single scan are copied."""
+    data = [1, 2, 3]
+
+    parsed = deserialize(list[int], data)
+    assert parsed == data
+    assert parsed is not data
+
+    assert deserialize(list[str], ["a", "b"]) == ["a", "b"]
+    assert deserialize(list[float], [1.5, 2.5]) == [1.5, 2.5]
+    assert deserialize(set[int], [1, 1, 2]) == {1, 2}
+    assert deserialize(tuple[int, ...], [1, 2]) == (1, 2)
+    assert deserialize(list[Any], [1, "a", None]) == [1, "a", None]
+
+
+def test_base_type_lists_mixed() -> None:
+    """Test that lists which fail the single scan still deserialize per item."""
+
+    # Bools are ints, so they are still valid, just not via the scan
+    assert deserialize(list[int], [1, True]) == [1, True]
+
+    with pytest.raises(DeserializeException) as exc_info:
+        _ = deserialize(list[int], [1, 2, "3"])
+
+    assert "list[2]" in str(exc_info.value)
+
+    with pytest.raises(DeserializeException):
+        _ = deserialize(list[float], [1.5, 2])
+
+
 def test_base_type() -> None:
     """Test that base types don't parse."""
     base_types = [  # pyright: ignore[reportUnknownVariableType]
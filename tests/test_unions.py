@@ -8,7 +8,9 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # pylint: disable=wrong-import-position
+import deserialize as deserialize_module
 from deserialize import deserialize, DeserializeException
+from deserialize.metadata_cache import get_class_metadata
 
 # pylint: enable=wrong-import-position
 
@@ -113,3 +115,100 @@ def test_union(union_classes: tuple[Type[Any], Type[Any]]):
     for invalid_test_case in invalid_test_cases:
         with pytest.raises(DeserializeException):
             _ = deserialize(some_union_class, invalid_test_case)
+
+
+class Circle:
+    """Shape which accepts a radius."""
+
+    radius: int
+
+
+class Wheel:
+    """Shape which accepts a radius and optional spokes."""
+
+    radius: int
+    spokes: int | None
+
+
+class Square:
+    """Shape which accepts a side."""
+
+    side: int
+
+
+class Drawing:
+    """Both members accept a radius, so declaration order decides."""
+
+    shape: Circle | Wheel
+
+
+def test_union_declaration_order():
+    """Test that union members are tried in the order they are declared."""
+
+    for _ in range(5):
+        assert isinstance(deserialize(Drawing, {"shape": {"radius": 1}}).shape, Circle)
+
+
+class ReversedDrawing:
+    """Unions equal to the one in Drawing, but declared in the opposite order."""
+
+    shape: Wheel | Circle
+    shapes: list[Wheel | Circle]
+    original: Circle | Wheel
+
+
+def test_union_declaration_order_per_hint():
+    """Test that equal unions declared in a different order keep their own order."""
+
+    assert isinstance(deserialize(Drawing, {"shape": {"radius": 1}}).shape, Circle)
+
+    drawing = deserialize(
+        ReversedDrawing,
+        {"shape": {"radius": 1}, "shapes": [{"radius": 2}], "original": {"radius": 3}},
+    )
+
+    assert isinstance(drawing.shape, Wheel)
+    assert isinstance(drawing.shapes[0], Wheel)
+    assert isinstance(drawing.original, Circle)
+    assert isinstance(deserialize(Circle | Wheel, {"radius": 1}), Circle)
+    assert isinstance(deserialize(Wheel | Circle, {"radius": 1}), Wheel)
+
+
+@deserialize_module.adaptive_unions()
+class AdaptiveDrawing:
+    """Drawing whose union field adapts to the data."""
+
+    shape: Circle | Wheel | Square
+    label: str | None
+
+
+def test_adaptive_union():
+    """Test that adaptive union fields try the last successful member first."""
+
+    # Circle rejects the unhandled spokes key, so Wheel succeeds
+    first = deserialize(
+        AdaptiveDrawing,
+        {"shape": {"radius": 1, "spokes": 3}, "label": None},
+        throw_on_unhandled=True,
+    )
+    assert isinstance(first.shape, Wheel)
+
+    # Circle comes first in declaration order and accepts this, but Wheel last succeeded
+    second = deserialize(AdaptiveDrawing, {"shape": {"radius": 1}, "label": "a"})
+    assert isinstance(second.shape, Wheel)
+    assert second.label == "a"
+
+    third = deserialize(AdaptiveDrawing, {"shape": {"side": 2}, "label": None})
+    assert isinstance(third.shape, Square)
+    assert third.label is None
+
+    field_cache = get_class_metadata(AdaptiveDrawing).fields["shape"].union_cache
+    assert field_cache == {dict: Square}
+
+    # Once the last member fails, declaration order is used again
+    fourth = deserialize(AdaptiveDrawing, {"shape": {"radius": 1}, "label": None})
+    assert isinstance(fourth.shape, Circle)
+    assert field_cache == {dict: Circle}
+
+    with pytest.raises(DeserializeException):
+        deserialize(AdaptiveDrawing, {"shape": {"other": 2}, "label": None})